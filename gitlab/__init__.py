@@ -26,7 +26,13 @@ from gitlab._version import (  # noqa: F401
     __title__,
     __version__,
 )
-from gitlab.client import AsyncGraphQL, Gitlab, GitlabList, GraphQL  # noqa: F401
+from gitlab.client import (  # noqa: F401
+    AsyncGitlab,
+    AsyncGraphQL,
+    Gitlab,
+    GitlabList,
+    GraphQL,
+)
 from gitlab.exceptions import *  # noqa: F401,F403
 
 warnings.filterwarnings("default", category=DeprecationWarning, module="^gitlab")
@@ -41,6 +47,7 @@ __all__ = [
     "__version__",
     "Gitlab",
     "GitlabList",
+    "AsyncGitlab",
     "AsyncGraphQL",
     "GraphQL",
 ]
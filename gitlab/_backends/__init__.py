@@ -2,9 +2,13 @@
 Defines http backends for processing http requests
 """
 
+from typing import Any
+
 from .requests_backend import (
     JobTokenAuth,
     OAuthTokenAuth,
+    PoolAdapter,
+    PoolStats,
     PrivateTokenAuth,
     RequestsBackend,
     RequestsResponse,
@@ -13,10 +17,34 @@ from .requests_backend import (
 DefaultBackend = RequestsBackend
 DefaultResponse = RequestsResponse
 
+#: The names of the synchronous backends, used in configuration files
+BACKENDS = ("requests", "httpx")
+
+
+def get_backend_class(name: str) -> type[Any]:
+    """Return the synchronous backend class selected by its name.
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If the backend requires a package that is not installed
+    """
+    if name == "requests":
+        return RequestsBackend
+    if name == "httpx":
+        from .httpx_backend import HttpxBackend
+
+        return HttpxBackend
+    raise ValueError(f"Unknown backend {name!r}, use one of {', '.join(BACKENDS)}")
+
+
 __all__ = [
+    "BACKENDS",
     "DefaultBackend",
     "DefaultResponse",
     "JobTokenAuth",
     "OAuthTokenAuth",
+    "PoolAdapter",
+    "PoolStats",
     "PrivateTokenAuth",
+    "get_backend_class",
 ]
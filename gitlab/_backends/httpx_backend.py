@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from typing import Any, BinaryIO, cast
+
+import httpx
+import requests
+from requests.auth import AuthBase, HTTPBasicAuth
+from requests_toolbelt.multipart.encoder import MultipartEncoder  # type: ignore
+
+from . import protocol
+from .requests_backend import (
+    JobTokenAuth,
+    OAuthTokenAuth,
+    PoolStats,
+    PrivateTokenAuth,
+    RequestsBackend,
+    SendData,
+)
+
+# The default limits of httpx
+_MAX_CONNECTIONS = 100
+_MAX_KEEPALIVE_CONNECTIONS = 20
+_KEEPALIVE_EXPIRY = 5.0
+
+
+class HeaderAuth(httpx.Auth):
+    """Sets a single authentication header on each request."""
+
+    def __init__(self, header: str, value: str) -> None:
+        self.header = header
+        self.value = value
+
+    def auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        request.headers[self.header] = self.value
+        yield request
+
+
+def to_httpx_auth(auth: AuthBase | None) -> httpx.Auth | None:
+    """Convert the requests authentication objects used by ``Gitlab``
+    to their httpx equivalent."""
+    if auth is None:
+        return None
+    if isinstance(auth, PrivateTokenAuth):
+        return HeaderAuth("PRIVATE-TOKEN", auth.token)
+    if isinstance(auth, OAuthTokenAuth):
+        return HeaderAuth("Authorization", f"Bearer {auth.token}")
+    if isinstance(auth, JobTokenAuth):
+        return HeaderAuth("JOB-TOKEN", auth.token)
+    if isinstance(auth, HTTPBasicAuth):
+        return httpx.BasicAuth(auth.username, auth.password)
+    raise TypeError(f"Unsupported authentication type for httpx: {type(auth)}")
+
+
+def _get_content(
+    json: dict[str, Any] | bytes | None,
+    data: dict[str, Any] | bytes | MultipartEncoder | None,
+) -> dict[str, Any]:
+    """Map the body prepared by ``prepare_send_data()`` to httpx arguments."""
+    if isinstance(data, MultipartEncoder):
+        return {"content": data.to_string()}
+    if data is not None:
+        if hasattr(data, "read"):
+            return {"content": data.read()}
+        if isinstance(data, (bytes, str)):
+            return {"content": data}
+        return {"data": data}
+    if isinstance(json, bytes):
+        return {"content": json}
+    return {"json": json}
+
+
+class HttpxResponse(protocol.BackendResponse):
+    def __init__(self, response: httpx.Response) -> None:
+        self._response: httpx.Response = response
+
+    @property
+    def response(self) -> httpx.Response:
+        return self._response
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self._response.headers
+
+    @property
+    def content(self) -> bytes:
+        return self._response.content
+
+    @property
+    def reason(self) -> str:
+        return self._response.reason_phrase
+
+    def json(self) -> Any:
+        return self._response.json()
+
+
+def _limits(
+    max_connections: int | None,
+    max_keepalive_connections: int | None,
+    keepalive_expiry: float | None,
+    pool_maxsize: int | None,
+    pool_block: bool | None,
+    pool_idle_timeout: float | None,
+) -> httpx.Limits:
+    """Build the limits of a client, applying the pool options shared with
+    ``RequestsBackend``.
+
+    httpx keeps the connections of all hosts in one pool, so ``pool_maxsize``
+    limits the connections kept alive, and with ``pool_block`` all the open
+    connections.
+    """
+    if pool_maxsize is not None:
+        max_keepalive_connections = pool_maxsize
+        if pool_block:
+            max_connections = pool_maxsize
+    if pool_idle_timeout is not None:
+        keepalive_expiry = pool_idle_timeout
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _pool_stats(client: httpx.Client | httpx.AsyncClient) -> list[PoolStats]:
+    """Return the utilisation of the connections of a client, by host.
+
+    httpx does not expose its pool, so the stats are read from the httpcore
+    pool of the default transport, and are empty when it cannot be found, e.g.
+    with a custom transport or another version of httpx.
+    """
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if not isinstance(connections, list):
+        return []
+    maxsize = getattr(pool, "_max_keepalive_connections", None)
+    stats: dict[str, PoolStats] = {}
+    for connection in connections:
+        is_idle = getattr(connection, "is_idle", None)
+        if is_idle is None:
+            return []
+        host = str(getattr(connection, "_origin", ""))
+        host_stats = stats.setdefault(
+            host, PoolStats(host=host, in_use=0, idle=0, maxsize=maxsize)
+        )
+        if is_idle():
+            host_stats.idle += 1
+        else:
+            host_stats.in_use += 1
+    return list(stats.values())
+
+
+def _client_state(
+    backend: HttpxBackend | AsyncHttpxBackend, options: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Return the state of a backend, with the options of its client instead
+    of the client itself, which cannot be pickled."""
+    if options is None:
+        raise TypeError(
+            f"Cannot pickle a {type(backend).__name__} using an existing httpx client"
+        )
+    state = backend.__dict__.copy()
+    del state["_client"]
+    return state
+
+
+def _build_request(
+    client: httpx.Client | httpx.AsyncClient,
+    method: str,
+    url: str,
+    json: dict[str, Any] | bytes | None,
+    data: dict[str, Any] | MultipartEncoder | None,
+    params: Any | None,
+    timeout: float | None,
+    **kwargs: Any,
+) -> httpx.Request:
+    if isinstance(params, dict):
+        # requests drops parameters set to None, httpx would send them empty
+        params = {k: v for k, v in params.items() if v is not None}
+    return client.build_request(
+        method=method.upper(),
+        url=url,
+        params=params,
+        timeout=timeout,
+        **_get_content(json, data),
+        **kwargs,
+    )
+
+
+class HttpxBackend:
+    """A synchronous backend using an ``httpx.Client``.
+
+    Unlike :class:`RequestsBackend`, requests sent concurrently from several
+    threads can share a few HTTP/2 connections instead of opening one
+    connection each.
+
+    Args:
+        client: An existing client to use. If not provided, a client is created
+            with the other arguments.
+        verify: Whether SSL certificates should be validated. If the value is
+            a string, it is the path to a CA file used for certificate validation.
+        http2: Whether to use HTTP/2 when the server supports it, which
+            requires the ``h2`` package.
+        max_connections: Maximum number of connections in the pool.
+        max_keepalive_connections: Maximum number of idle connections kept
+            open for reuse.
+        keepalive_expiry: Number of seconds after which an idle connection is
+            closed.
+        pool_connections: Ignored, httpx keeps the connections of all hosts in
+            one pool.
+        pool_maxsize: Maximum number of connections kept alive, overrides
+            ``max_keepalive_connections``.
+        pool_block: Whether to also limit the open connections to
+            ``pool_maxsize``, so that requests wait for a connection.
+        pool_idle_timeout: Overrides ``keepalive_expiry``.
+        **client_opts: Extra options passed to ``httpx.Client``.
+
+    Raises:
+        ImportError: If ``http2`` is True and ``h2`` is not installed
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client | None = None,
+        verify: bool | str = True,
+        http2: bool = False,
+        max_connections: int | None = _MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = _MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = _KEEPALIVE_EXPIRY,
+        pool_connections: int | None = None,  # pylint: disable=unused-argument
+        pool_maxsize: int | None = None,
+        pool_block: bool | None = None,
+        pool_idle_timeout: float | None = None,
+        **client_opts: Any,
+    ) -> None:
+        #: The options the client was created with, None for an existing client
+        self._options: dict[str, Any] | None = None
+        if client is None:
+            client_opts.setdefault("follow_redirects", True)
+            self._options = {
+                "verify": verify,
+                "http2": http2,
+                "limits": _limits(
+                    max_connections,
+                    max_keepalive_connections,
+                    keepalive_expiry,
+                    pool_maxsize,
+                    pool_block,
+                    pool_idle_timeout,
+                ),
+                **client_opts,
+            }
+            client = httpx.Client(**self._options)
+        self._client: httpx.Client = client
+
+    def __getstate__(self) -> dict[str, Any]:
+        return _client_state(self, self._options)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._client = httpx.Client(**cast(dict[str, Any], self._options))
+
+    @property
+    def client(self) -> httpx.Client:
+        return self._client
+
+    @staticmethod
+    def prepare_send_data(
+        files: dict[str, Any] | None = None,
+        post_data: dict[str, Any] | bytes | BinaryIO | None = None,
+        raw: bool = False,
+    ) -> SendData:
+        return RequestsBackend.prepare_send_data(files, post_data, raw)
+
+    @staticmethod
+    def build_response(
+        url: str, status_code: int, headers: dict[str, str], content: bytes
+    ) -> HttpxResponse:
+        """Build a response from data received earlier, e.g. a cached response."""
+        return AsyncHttpxBackend.build_response(url, status_code, headers, content)
+
+    def pool_stats(self) -> list[PoolStats]:
+        """Return the utilisation of the connection pool of the client."""
+        return _pool_stats(self._client)
+
+    def http_request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | bytes | None = None,
+        data: dict[str, Any] | MultipartEncoder | None = None,
+        params: Any | None = None,
+        timeout: float | None = None,
+        verify: bool | str | None = True,  # pylint: disable=unused-argument
+        stream: bool | None = False,
+        auth: requests.auth.AuthBase | None = None,
+        **kwargs: Any,
+    ) -> HttpxResponse:
+        """Make HTTP request
+
+        Args:
+            method: The HTTP method to call ('get', 'post', 'put', 'delete', etc.)
+            url: The full URL
+            data: The data to send to the server in the body of the request
+            json: Data to send in the body in json by default
+            timeout: The timeout, in seconds, for the request
+            verify: Ignored, SSL verification is configured on the client.
+            stream: Whether the data should be streamed
+            auth: The authentication to convert and apply to the request
+
+        Returns:
+            An httpx Response object.
+        """
+        request = _build_request(
+            self._client, method, url, json, data, params, timeout, **kwargs
+        )
+        response = self._client.send(
+            request, auth=to_httpx_auth(auth), stream=bool(stream)
+        )
+        return HttpxResponse(response=response)
+
+
+class AsyncHttpxBackend:
+    """An asynchronous backend using an ``httpx.AsyncClient``.
+
+    Args:
+        client: An existing client to use. If not provided, a client is created
+            with ``verify`` and ``client_opts``.
+        verify: Whether SSL certificates should be validated. If the value is
+            a string, it is the path to a CA file used for certificate validation.
+        pool_connections: Ignored, httpx keeps the connections of all hosts in
+            one pool.
+        pool_maxsize: Maximum number of connections kept alive.
+        pool_block: Whether to also limit the open connections to
+            ``pool_maxsize``, so that requests wait for a connection.
+        pool_idle_timeout: Number of seconds after which an idle connection is
+            closed.
+        **client_opts: Extra options passed to ``httpx.AsyncClient``.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        verify: bool | str = True,
+        pool_connections: int | None = None,  # pylint: disable=unused-argument
+        pool_maxsize: int | None = None,
+        pool_block: bool | None = None,
+        pool_idle_timeout: float | None = None,
+        **client_opts: Any,
+    ) -> None:
+        client_opts.setdefault("follow_redirects", True)
+        client_opts.setdefault(
+            "limits",
+            _limits(
+                _MAX_CONNECTIONS,
+                _MAX_KEEPALIVE_CONNECTIONS,
+                _KEEPALIVE_EXPIRY,
+                pool_maxsize,
+                pool_block,
+                pool_idle_timeout,
+            ),
+        )
+        #: The options the client was created with, None for an existing client
+        self._options: dict[str, Any] | None = None
+        if client is None:
+            self._options = {"verify": verify, **client_opts}
+            client = httpx.AsyncClient(**self._options)
+        self._client: httpx.AsyncClient = client
+
+    def __getstate__(self) -> dict[str, Any]:
+        return _client_state(self, self._options)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._client = httpx.AsyncClient(**cast(dict[str, Any], self._options))
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client
+
+    @staticmethod
+    def prepare_send_data(
+        files: dict[str, Any] | None = None,
+        post_data: dict[str, Any] | bytes | BinaryIO | None = None,
+        raw: bool = False,
+    ) -> SendData:
+        return RequestsBackend.prepare_send_data(files, post_data, raw)
+
+    @staticmethod
+    def build_response(
+        url: str, status_code: int, headers: dict[str, str], content: bytes
+    ) -> HttpxResponse:
+        """Build a response from data received earlier, e.g. a cached response."""
+        response = httpx.Response(
+            status_code,
+            headers=headers,
+            content=content,
+            request=httpx.Request("GET", url),
+        )
+        return HttpxResponse(response=response)
+
+    def pool_stats(self) -> list[PoolStats]:
+        """Return the utilisation of the connection pool of the client."""
+        return _pool_stats(self._client)
+
+    async def http_request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | bytes | None = None,
+        data: dict[str, Any] | MultipartEncoder | None = None,
+        params: Any | None = None,
+        timeout: float | None = None,
+        verify: bool | str | None = True,  # pylint: disable=unused-argument
+        stream: bool | None = False,
+        auth: requests.auth.AuthBase | None = None,
+        **kwargs: Any,
+    ) -> HttpxResponse:
+        """Make HTTP request
+
+        Args:
+            method: The HTTP method to call ('get', 'post', 'put', 'delete', etc.)
+            url: The full URL
+            data: The data to send to the server in the body of the request
+            json: Data to send in the body in json by default
+            timeout: The timeout, in seconds, for the request
+            verify: Ignored, SSL verification is configured on the client.
+            stream: Whether the data should be streamed
+            auth: The authentication to convert and apply to the request
+
+        Returns:
+            An httpx Response object.
+        """
+        request = _build_request(
+            self._client, method, url, json, data, params, timeout, **kwargs
+        )
+        response = await self._client.send(
+            request, auth=to_httpx_auth(auth), stream=bool(stream)
+        )
+        return HttpxResponse(response=response)
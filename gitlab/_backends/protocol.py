@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+from collections.abc import MutableMapping
 from typing import Any, Protocol
 
 import requests
@@ -11,6 +12,23 @@ class BackendResponse(Protocol):
     @abc.abstractmethod
     def __init__(self, response: requests.Response) -> None: ...
 
+    @property
+    def response(self) -> Any: ...
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def headers(self) -> MutableMapping[str, str]: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+    @property
+    def reason(self) -> str: ...
+
+    def json(self) -> Any: ...
+
 
 class Backend(Protocol):
     @abc.abstractmethod
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
+import http
+import threading
+import time
+import weakref
 from typing import Any, BinaryIO, TYPE_CHECKING
 
 import requests
+import urllib3
 from requests import PreparedRequest
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 from requests.structures import CaseInsensitiveDict
 from requests_toolbelt.multipart.encoder import MultipartEncoder  # type: ignore
@@ -55,6 +62,154 @@ class SendData:
             )
 
 
+@dataclasses.dataclass
+class PoolStats:
+    """Utilisation of the connections to a host, see ``Gitlab.pool_stats()``."""
+
+    #: The scheme, host and port of the connections
+    host: str
+    #: Number of connections sending a request or reading a response
+    in_use: int
+    #: Number of open connections waiting in the pool to be reused
+    idle: int
+    #: Maximum number of connections kept in the pool, None if unlimited
+    maxsize: int | None = None
+    #: Number of requests sent, if known
+    requests: int | None = None
+    #: Number of connections closed because the pool was full, if known
+    discarded: int | None = None
+
+    @property
+    def connections(self) -> int:
+        """The number of open connections."""
+        return self.in_use + self.idle
+
+
+class _TrackedPoolMixin:
+    """Counts the connections of an urllib3 pool, and closes the connections
+    that stayed idle for longer than ``idle_timeout`` instead of reusing them."""
+
+    pool: Any
+    num_requests: int
+
+    def __init__(
+        self, *args: Any, idle_timeout: float | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.idle_timeout = idle_timeout
+        self.in_use = 0
+        self.discarded = 0
+        # Keyed weakly, so that discarded connections are forgotten
+        self._released_at: weakref.WeakKeyDictionary[Any, float] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats_lock = threading.Lock()
+
+    def _get_conn(self, timeout: float | None = None) -> Any:
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        with self._stats_lock:
+            self.in_use += 1
+            released_at = None if conn is None else self._released_at.pop(conn, None)
+        if (
+            self.idle_timeout is not None
+            and released_at is not None
+            and time.monotonic() - released_at > self.idle_timeout
+        ):
+            # The connection reconnects when it is used again
+            conn.close()
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        with self._stats_lock:
+            self.in_use = max(0, self.in_use - 1)
+            if conn is not None:
+                if self.pool is not None and self.pool.full():
+                    self.discarded += 1
+                else:
+                    self._released_at[conn] = time.monotonic()
+        super()._put_conn(conn)  # type: ignore[misc]
+
+    def stats(self, host: str) -> PoolStats:
+        queued = list(self.pool.queue) if self.pool is not None else []
+        return PoolStats(
+            host=host,
+            in_use=self.in_use,
+            idle=sum(1 for conn in queued if conn is not None),
+            maxsize=self.pool.maxsize if self.pool is not None else None,
+            requests=self.num_requests,
+            discarded=self.discarded,
+        )
+
+
+class _HTTPConnectionPool(_TrackedPoolMixin, urllib3.HTTPConnectionPool):
+    pass
+
+
+class _HTTPSConnectionPool(_TrackedPoolMixin, urllib3.HTTPSConnectionPool):
+    pass
+
+
+class PoolAdapter(HTTPAdapter):
+    """An ``HTTPAdapter`` whose connection pools report their utilisation and
+    close the connections that stayed idle for too long.
+
+    Args:
+        pool_connections: Number of hosts whose connections are pooled.
+        pool_maxsize: Maximum number of connections kept in the pool of a host.
+        pool_block: Whether to wait for a connection to be available when
+            ``pool_maxsize`` connections are in use, instead of opening a
+            connection that is closed after the request.
+        pool_idle_timeout: Number of seconds after which an idle connection is
+            closed instead of being reused.
+        **kwargs: Extra options passed to ``HTTPAdapter``.
+    """
+
+    # The attributes pickled by HTTPAdapter
+    __attrs__ = HTTPAdapter.__attrs__ + ["pool_idle_timeout"]
+
+    def __init__(
+        self,
+        pool_connections: int = requests.adapters.DEFAULT_POOLSIZE,
+        pool_maxsize: int = requests.adapters.DEFAULT_POOLSIZE,
+        pool_block: bool = requests.adapters.DEFAULT_POOLBLOCK,
+        pool_idle_timeout: float | None = None,
+        **kwargs: Any,
+    ) -> None:
+        # Used by init_poolmanager(), called by HTTPAdapter.__init__()
+        self.pool_idle_timeout = pool_idle_timeout
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            **kwargs,
+        )
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": functools.partial(
+                _HTTPConnectionPool, idle_timeout=self.pool_idle_timeout
+            ),
+            "https": functools.partial(
+                _HTTPSConnectionPool, idle_timeout=self.pool_idle_timeout
+            ),
+        }
+
+    def pool_stats(self) -> list[PoolStats]:
+        """Return the utilisation of the pool of each host."""
+        stats = []
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            try:
+                pool = pools[key]
+            except KeyError:  # pragma: no cover, evicted meanwhile
+                continue
+            if isinstance(pool, (_HTTPConnectionPool, _HTTPSConnectionPool)):
+                host = f"{pool.scheme}://{pool.host}:{pool.port}"
+                stats.append(pool.stats(host))
+        return stats
+
+
 class RequestsResponse(protocol.BackendResponse):
     def __init__(self, response: requests.Response) -> None:
         self._response: requests.Response = response
@@ -84,8 +239,46 @@ class RequestsResponse(protocol.BackendResponse):
 
 
 class RequestsBackend(protocol.Backend):
-    def __init__(self, session: requests.Session | None = None) -> None:
-        self._client: requests.Session = session or requests.Session()
+    """A backend using a ``requests.Session``.
+
+    A :class:`PoolAdapter` is mounted on the session when pool options are
+    set, otherwise the default adapters of ``requests`` are used and
+    :meth:`pool_stats` returns no stats.
+
+    Args:
+        session: An existing session to use.
+        pool_connections: Number of hosts whose connections are pooled.
+        pool_maxsize: Maximum number of connections kept in the pool of a host.
+        pool_block: Whether to wait for a connection to be available when
+            ``pool_maxsize`` connections are in use.
+        pool_idle_timeout: Number of seconds after which an idle connection is
+            closed instead of being reused.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool | None = None,
+        pool_idle_timeout: float | None = None,
+    ) -> None:
+        pool_options: dict[str, Any] = {
+            key: value
+            for key, value in {
+                "pool_connections": pool_connections,
+                "pool_maxsize": pool_maxsize,
+                "pool_block": pool_block,
+                "pool_idle_timeout": pool_idle_timeout,
+            }.items()
+            if value is not None
+        }
+        session = session or requests.Session()
+        if pool_options:
+            adapter = PoolAdapter(**pool_options)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self._client: requests.Session = session
 
     @property
     def client(self) -> requests.Session:
@@ -126,6 +319,27 @@ class RequestsBackend(protocol.Backend):
 
         return SendData(json=post_data, content_type="application/json")
 
+    @staticmethod
+    def build_response(
+        url: str, status_code: int, headers: dict[str, str], content: bytes
+    ) -> RequestsResponse:
+        """Build a response from data received earlier, e.g. a cached response."""
+        response = requests.Response()
+        response.url = url
+        response.status_code = status_code
+        response.reason = http.HTTPStatus(status_code).phrase
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = content
+        return RequestsResponse(response=response)
+
+    def pool_stats(self) -> list[PoolStats]:
+        """Return the utilisation of the connection pools of the session."""
+        stats = []
+        for adapter in set(self._client.adapters.values()):
+            if isinstance(adapter, PoolAdapter):
+                stats.extend(adapter.pool_stats())
+        return stats
+
     def http_request(
         self,
         method: str,
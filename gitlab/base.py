@@ -1,29 +1,146 @@
 from __future__ import annotations
 
-import copy
+import collections
 import importlib
 import json
 import pprint
 import textwrap
-from collections.abc import Iterable
-from types import ModuleType
+from collections.abc import Iterable, Mapping, Sequence
+from copy import deepcopy
+from types import MappingProxyType, ModuleType
 from typing import Any, ClassVar, Generic, TYPE_CHECKING, TypeVar
 
 import gitlab
 from gitlab import types as g_types
 from gitlab.exceptions import GitlabParsingError
 
-from .client import Gitlab, GitlabList
+from .client import AsyncGitlabList, Gitlab, GitlabList
 
-__all__ = ["RESTObject", "RESTObjectList", "RESTManager"]
+__all__ = ["RESTObject", "RESTObjectList", "RESTDictList", "RESTManager"]
 
 
+# The state of every object, stored in slots instead of the instance dictionary
+_SLOTS = (
+    "manager",
+    "_attrs",
+    "_updated_attrs",
+    "_parent_attrs",
+    "_created_from_list",
+    "_lazy",
+)
+# Slots set only on some objects, and not pickled: the batch of the lazy objects
+# created by the same get_many() call
+_TRANSIENT_SLOTS = ("_lazy_batch",)
+
 _URL_ATTRIBUTE_ERROR = (
     f"https://python-gitlab.readthedocs.io/en/v{gitlab.__version__}/"
     f"faq.html#attribute-error-list"
 )
 
 
+class _Tracked:
+    """Mixin of the containers returned for list and dict attributes.
+
+    The container replaces the server value in ``_attrs`` when first read, so
+    that every read returns the same container and the changes made through
+    any reference to it are tracked. The first change made to it in place
+    copies the server value back to ``_attrs`` and moves the container to
+    ``_updated_attrs``, so that ``save()`` only sends the attributes actually
+    modified.
+    """
+
+    __slots__ = ()
+    #: The type of the server value, also used for copies and pickles
+    _container: ClassVar[type[Any]]
+    _owner: RESTObject
+    _name: str
+
+    def _before_write(self) -> None:
+        owner = self._owner
+        # Once the object was updated from the server, the container is not
+        # one of its attributes anymore
+        if owner._attrs.get(self._name) is self:
+            owner._attrs[self._name] = self._snapshot()
+            owner._updated_attrs[self._name] = self
+
+    def _snapshot(self) -> Any:
+        """Return the content of the container as a plain list or dict."""
+        return self._container(self)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Copies and pickles are plain lists and dicts
+        return self._container, (self._snapshot(),)
+
+
+class _TrackedList(_Tracked, list):  # type: ignore[type-arg]
+    __slots__ = ("_owner", "_name")
+    _container = list
+
+    def __init__(self, value: list[Any], owner: RESTObject, name: str) -> None:
+        super().__init__(value)
+        self._owner = owner
+        self._name = name
+
+
+class _TrackedDict(_Tracked, dict):  # type: ignore[type-arg]
+    __slots__ = ("_owner", "_name")
+    _container = dict
+
+    def __init__(self, value: dict[str, Any], owner: RESTObject, name: str) -> None:
+        super().__init__(value)
+        self._owner = owner
+        self._name = name
+
+
+def _mutator(container: type[Any], name: str) -> Any:
+    method = getattr(container, name)
+
+    def mutate(self: _Tracked, *args: Any, **kwargs: Any) -> Any:
+        self._before_write()
+        return method(self, *args, **kwargs)
+
+    mutate.__name__ = name
+    return mutate
+
+
+for _container, _tracked_class, _names in (
+    (
+        list,
+        _TrackedList,
+        (
+            "__delitem__",
+            "__iadd__",
+            "__imul__",
+            "__setitem__",
+            "append",
+            "clear",
+            "extend",
+            "insert",
+            "pop",
+            "remove",
+            "reverse",
+            "sort",
+        ),
+    ),
+    (
+        dict,
+        _TrackedDict,
+        (
+            "__delitem__",
+            "__ior__",
+            "__setitem__",
+            "clear",
+            "pop",
+            "popitem",
+            "setdefault",
+            "update",
+        ),
+    ),
+):
+    for _name in _names:
+        setattr(_tracked_class, _name, _mutator(_container, _name))
+
+
 class RESTObject:
     """Represents an object built from server data.
 
@@ -37,11 +154,20 @@ class RESTObject:
     Likewise, you can define a ``_repr_attr`` in subclasses to specify which
     attribute should be added as a human-readable identifier when called in the
     object's ``__repr__()`` method.
+
+    The managers of the sub-resources, declared as annotations of the child
+    classes, are created on first access, so that objects built from large lists
+    only hold their attributes.
     """
 
+    # The instance dictionary only holds the managers created so far, lazy
+    # objects waiting to be hydrated are referenced weakly
+    __slots__ = _SLOTS + _TRANSIENT_SLOTS + ("__dict__", "__weakref__")
+
     _id_attr: str | None = "id"
     _attrs: dict[str, Any]
     _created_from_list: bool  # Indicates if object was created from a list() action
+    _manager_classes: ClassVar[dict[str, type[RESTManager[Any]]]]
     _module: ModuleType
     _parent_attrs: dict[str, Any]
     _repr_attr: str | None = None
@@ -63,54 +189,76 @@ class RESTObject:
                 f"{attrs!r}\nThis likely indicates an incorrect or malformed server "
                 f"response."
             )
-        self.__dict__.update(
-            {
-                "manager": manager,
-                "_attrs": attrs,
-                "_updated_attrs": {},
-                "_module": importlib.import_module(self.__module__),
-                "_created_from_list": created_from_list,
-                "_lazy": lazy,
-            }
-        )
-        self.__dict__["_parent_attrs"] = self.manager.parent_attrs
-        self._create_managers()
+        # Since we have our own __setattr__ method, we can't use setattr()
+        object.__setattr__(self, "manager", manager)
+        object.__setattr__(self, "_attrs", attrs)
+        object.__setattr__(self, "_updated_attrs", {})
+        object.__setattr__(self, "_parent_attrs", manager.parent_attrs)
+        object.__setattr__(self, "_created_from_list", created_from_list)
+        object.__setattr__(self, "_lazy", lazy)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._module = importlib.import_module(cls.__module__)
 
     def __getstate__(self) -> dict[str, Any]:
         state = self.__dict__.copy()
-        module = state.pop("_module")
-        state["_module_name"] = module.__name__
+        for name in _SLOTS:
+            state[name] = object.__getattribute__(self, name)
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
-        module_name = state.pop("_module_name")
-        self.__dict__.update(state)
-        self.__dict__["_module"] = importlib.import_module(module_name)
+        # Objects pickled by previous versions also hold their module name
+        state.pop("_module_name", None)
+        for name, value in state.items():
+            if name in _SLOTS:
+                object.__setattr__(self, name, value)
+            else:
+                self.__dict__[name] = value
 
     def __getattr__(self, name: str) -> Any:
-        if name in self.__dict__["_updated_attrs"]:
-            return self.__dict__["_updated_attrs"][name]
-
-        if name in self.__dict__["_attrs"]:
-            value = self.__dict__["_attrs"][name]
-            # If the value is a list, we copy it in the _updated_attrs dict
-            # because we are not able to detect changes made on the object
-            # (append, insert, pop, ...). Without forcing the attr
-            # creation __setattr__ is never called, the list never ends up
-            # in the _updated_attrs dict, and the update() and save()
-            # method never push the new data to the server.
+        if name in _SLOTS or name in _TRANSIENT_SLOTS:
+            # Not initialized yet, e.g. while unpickling
+            raise AttributeError(name)
+
+        manager_cls = self._get_manager_classes().get(name)
+        if manager_cls is not None:
+            manager = manager_cls(self.manager.gitlab, parent=self)
+            # Later accesses find the manager without calling __getattr__
+            self.__dict__[name] = manager
+            return manager
+
+        if name in self._updated_attrs:
+            return self._updated_attrs[name]
+
+        if name in self._attrs:
+            value = self._attrs[name]
+            # Lists and dicts can be changed in place (append, pop, ...)
+            # without calling __setattr__. They are returned in containers
+            # tracking these changes, so that update() and save() push them to
+            # the server, while reading them does not mark them as updated.
+            # The container replaces the value in _attrs on the first read
+            # only, so that later reads return it without copying the value
+            # again.
             # See https://github.com/python-gitlab/python-gitlab/issues/306
             #
             # note: _parent_attrs will only store simple values (int) so we
             # don't make this check in the next block.
-            if isinstance(value, list):
-                self.__dict__["_updated_attrs"][name] = value[:]
-                return self.__dict__["_updated_attrs"][name]
-
+            value_type = type(value)
+            if value_type is list:
+                value = self._attrs[name] = _TrackedList(value, self, name)
+            elif value_type is dict:
+                value = self._attrs[name] = _TrackedDict(value, self, name)
             return value
 
-        if name in self.__dict__["_parent_attrs"]:
-            return self.__dict__["_parent_attrs"][name]
+        if name in self._parent_attrs:
+            return self._parent_attrs[name]
+
+        if self._lazy and not name.startswith("_") and self.manager.gitlab.auto_hydrate:
+            hydrate = getattr(self.manager, "_hydrate_lazy", None)
+            if hydrate is not None:
+                hydrate(self)
+                return getattr(self, name)
 
         message = f"{type(self).__name__!r} object has no attribute {name!r}"
         if self._created_from_list:
@@ -133,28 +281,53 @@ class RESTObject:
         raise AttributeError(message)
 
     def __setattr__(self, name: str, value: Any) -> None:
-        self.__dict__["_updated_attrs"][name] = value
+        self._updated_attrs[name] = value
 
-    def asdict(self, *, with_parent_attrs: bool = False) -> dict[str, Any]:
+    def asdict(
+        self, *, with_parent_attrs: bool = False, copy: bool = True
+    ) -> dict[str, Any]:
+        """Return the attributes of the object as a dictionary.
+
+        Args:
+            with_parent_attrs: Whether to include the attributes of the parent
+                object
+            copy: Whether to copy the values. Without copy, the values are
+                shared with the object and must not be modified.
+        """
         data = {}
         if with_parent_attrs:
-            data.update(copy.deepcopy(self._parent_attrs))
-        data.update(copy.deepcopy(self._attrs))
-        data.update(copy.deepcopy(self._updated_attrs))
-        return data
+            data.update(self._parent_attrs)
+        data.update(self._attrs)
+        data.update(self._updated_attrs)
+        return deepcopy(data) if copy else data
 
     @property
     def attributes(self) -> dict[str, Any]:
         return self.asdict(with_parent_attrs=True)
 
+    @property
+    def attributes_view(self) -> Mapping[str, Any]:
+        """A read-only view of the attributes, including the parent attributes.
+
+        Unlike :attr:`attributes`, nothing is copied: the view reflects later
+        changes of the object, and its values are shared with the object.
+        """
+        return MappingProxyType(
+            collections.ChainMap(self._updated_attrs, self._attrs, self._parent_attrs)
+        )
+
     def to_json(self, *, with_parent_attrs: bool = False, **kwargs: Any) -> str:
-        return json.dumps(self.asdict(with_parent_attrs=with_parent_attrs), **kwargs)
+        data = self.asdict(with_parent_attrs=with_parent_attrs, copy=False)
+        if kwargs:
+            # Formatting options are specific to the json module
+            return json.dumps(data, **kwargs)
+        return self.manager.gitlab.json_codec.dumps(data).decode()
 
     def __str__(self) -> str:
-        return f"{type(self)} => {self.asdict()}"
+        return f"{type(self)} => {self.asdict(copy=False)}"
 
     def pformat(self) -> str:
-        return f"{type(self)} => \n{pprint.pformat(self.asdict())}"
+        return f"{type(self)} => \n{pprint.pformat(self.asdict(copy=False))}"
 
     def pprint(self) -> None:
         print(self.pformat())
@@ -189,18 +362,32 @@ class RESTObject:
         return super() != other
 
     def __dir__(self) -> Iterable[str]:
-        return set(self.attributes).union(super().__dir__())
+        return (
+            set(self.attributes_view)
+            .union(self._get_manager_classes())
+            .union(super().__dir__())
+        )
 
     def __hash__(self) -> int:
         if not self.get_id():
             return super().__hash__()
         return hash(self.get_id())
 
-    def _create_managers(self) -> None:
+    @classmethod
+    def _get_manager_classes(cls) -> dict[str, type[RESTManager[Any]]]:
+        """Return the manager classes of the sub-resources, by attribute name.
+
+        The annotations are scanned once per class, on first use, as the
+        managers are usually defined after the object class in its module.
+        """
+        if "_manager_classes" in cls.__dict__:
+            return cls._manager_classes
+
         # NOTE(jlvillal): We are creating our managers by looking at the class
         # annotations. If an attribute is annotated as being a *Manager type
         # then we create the manager and assign it to the attribute.
-        for attr, annotation in sorted(self.__class__.__annotations__.items()):
+        managers: dict[str, type[RESTManager[Any]]] = {}
+        for attr, annotation in cls.__annotations__.items():
             # We ignore creating a manager for the 'manager' attribute as that
             # is done in the self.__init__() method
             if attr in ("manager",):
@@ -214,14 +401,19 @@ class RESTObject:
             # All *Manager classes are used except for the base "RESTManager" class
             if cls_name == "RESTManager" or not cls_name.endswith("Manager"):
                 continue
-            cls = getattr(self._module, cls_name)
-            manager = cls(self.manager.gitlab, parent=self)
-            # Since we have our own __setattr__ method, we can't use setattr()
-            self.__dict__[attr] = manager
+            managers[attr] = getattr(cls._module, cls_name)
+        cls._manager_classes = managers
+        return managers
+
+    def _create_managers(self) -> None:
+        """Create the managers of all the sub-resources now instead of on
+        first access."""
+        for attr in self._get_manager_classes():
+            getattr(self, attr)
 
     def _update_attrs(self, new_attrs: dict[str, Any]) -> None:
-        self.__dict__["_updated_attrs"] = {}
-        self.__dict__["_attrs"] = new_attrs
+        object.__setattr__(self, "_updated_attrs", {})
+        object.__setattr__(self, "_attrs", new_attrs)
 
     def get_id(self) -> int | str | None:
         """Returns the id of the resource."""
@@ -235,9 +427,11 @@ class RESTObject:
     @property
     def _repr_value(self) -> str | None:
         """Safely returns the human-readable resource name if present."""
-        if self._repr_attr is None or not hasattr(self, self._repr_attr):
+        # Read from the attributes, so that lazy objects are not hydrated
+        attributes = self.attributes_view
+        if self._repr_attr is None or self._repr_attr not in attributes:
             return None
-        repr_val = getattr(self, self._repr_attr)
+        repr_val = attributes[self._repr_attr]
         if TYPE_CHECKING:
             assert isinstance(repr_val, str)
         return repr_val
@@ -255,7 +449,52 @@ class RESTObject:
 TObjCls = TypeVar("TObjCls", bound=RESTObject)
 
 
-class RESTObjectList(Generic[TObjCls]):
+class _PaginatedList:
+    """Pagination information of a GitlabList wrapped by a generator."""
+
+    _list: GitlabList | AsyncGitlabList
+
+    def __len__(self) -> int:
+        return len(self._list)
+
+    @property
+    def current_page(self) -> int:
+        """The current page number."""
+        return self._list.current_page
+
+    @property
+    def prev_page(self) -> int | None:
+        """The previous page number.
+
+        If None, the current page is the first.
+        """
+        return self._list.prev_page
+
+    @property
+    def next_page(self) -> int | None:
+        """The next page number.
+
+        If None, the current page is the last.
+        """
+        return self._list.next_page
+
+    @property
+    def per_page(self) -> int | None:
+        """The number of items per page."""
+        return self._list.per_page
+
+    @property
+    def total_pages(self) -> int | None:
+        """The total number of pages."""
+        return self._list.total_pages
+
+    @property
+    def total(self) -> int | None:
+        """The total number of items."""
+        return self._list.total
+
+
+class RESTObjectList(_PaginatedList, Generic[TObjCls]):
     """Generator object representing a list of RESTObject's.
 
     This generator uses the Gitlab pagination system to fetch new data when
@@ -271,7 +510,10 @@ class RESTObjectList(Generic[TObjCls]):
     """
 
     def __init__(
-        self, manager: RESTManager[TObjCls], obj_cls: type[TObjCls], _list: GitlabList
+        self,
+        manager: RESTManager[TObjCls],
+        obj_cls: type[TObjCls],
+        _list: GitlabList | AsyncGitlabList,
     ) -> None:
         """Creates an objects list from a GitlabList.
 
@@ -281,60 +523,104 @@ class RESTObjectList(Generic[TObjCls]):
         Args:
             manager: the RESTManager to attach to the objects
             obj_cls: the class of the created objects
-            _list: the GitlabList holding the data
+            _list: the GitlabList (or AsyncGitlabList) holding the data
         """
         self.manager = manager
         self._obj_cls = obj_cls
         self._list = _list
 
-    def __iter__(self) -> RESTObjectList[TObjCls]:
+    def close(self) -> None:
+        """Stop prefetching the following pages, see
+        :meth:`gitlab.client.GitlabList.close`."""
+        close = getattr(self._list, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> RESTObjectList[TObjCls]:
         return self
 
-    def __len__(self) -> int:
-        return len(self._list)
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __iter__(self) -> RESTObjectList[TObjCls]:
+        return self
 
     def __next__(self) -> TObjCls:
         return self.next()
 
     def next(self) -> TObjCls:
+        if TYPE_CHECKING:
+            assert isinstance(self._list, GitlabList)
         data = self._list.next()
-        return self._obj_cls(self.manager, data, created_from_list=True)
+        return self.manager._create_listed_object(data, self._obj_cls)
 
-    @property
-    def current_page(self) -> int:
-        """The current page number."""
-        return self._list.current_page
+    def __aiter__(self) -> RESTObjectList[TObjCls]:
+        return self
 
-    @property
-    def prev_page(self) -> int | None:
-        """The previous page number.
+    async def __anext__(self) -> TObjCls:
+        return await self.anext()
 
-        If None, the current page is the first.
+    async def anext(self) -> TObjCls:
+        """Return the next object, fetching the next page if needed.
+
+        Only available for lists created by an asynchronous client.
         """
-        return self._list.prev_page
+        if not isinstance(self._list, AsyncGitlabList):
+            raise TypeError("Asynchronous iteration requires gitlab.AsyncGitlab")
+        data = await self._list.anext()
+        return self.manager._create_listed_object(data, self._obj_cls)
 
-    @property
-    def next_page(self) -> int | None:
-        """The next page number.
 
-        If None, the current page is the last.
-        """
-        return self._list.next_page
+class RESTDictList(_PaginatedList):
+    """Generator of the items of a list as plain dictionaries.
 
-    @property
-    def per_page(self) -> int | None:
-        """The number of items per page."""
-        return self._list.per_page
+    Like :class:`RESTObjectList`, it uses the Gitlab pagination system to fetch
+    new data when required, but the items are not wrapped into objects.
 
-    @property
-    def total_pages(self) -> int | None:
-        """The total number of pages."""
-        return self._list.total_pages
+    Note: you should not instantiate such objects, they are returned by calls
+    to ListMixin.iter_dicts()
 
-    @property
-    def total(self) -> int | None:
-        """The total number of items."""
-        return self._list.total
+    Args:
+        _list: A GitlabList object
+        fields: The keys kept in each item. All the keys are kept if None.
+    """
+
+    def __init__(
+        self, _list: GitlabList | AsyncGitlabList, fields: Sequence[str] | None = None
+    ) -> None:
+        self._list = _list
+        self.fields = fields
+
+    def _project(self, data: dict[str, Any]) -> dict[str, Any]:
+        if self.fields is None:
+            return data
+        return {field: data[field] for field in self.fields if field in data}
+
+    def __iter__(self) -> RESTDictList:
+        return self
+
+    def __next__(self) -> dict[str, Any]:
+        return self.next()
+
+    def next(self) -> dict[str, Any]:
+        if TYPE_CHECKING:
+            assert isinstance(self._list, GitlabList)
+        return self._project(self._list.next())
+
+    def __aiter__(self) -> RESTDictList:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        return await self.anext()
+
+    async def anext(self) -> dict[str, Any]:
+        """Return the next item, fetching the next page if needed.
+
+        Only available for lists created by an asynchronous client.
+        """
+        if not isinstance(self._list, AsyncGitlabList):
+            raise TypeError("Asynchronous iteration requires gitlab.AsyncGitlab")
+        return self._project(await self._list.anext())
 
 
 class RESTManager(Generic[TObjCls]):
@@ -352,6 +638,18 @@ class RESTManager(Generic[TObjCls]):
     _obj_cls: type[TObjCls]
     _from_parent_attrs: dict[str, Any] = {}
     _types: dict[str, type[g_types.GitlabAttribute]] = {}
+    #: The ``order_by`` value allowing keyset pagination of the listing, or
+    #: None if the endpoint only supports offset pagination
+    _keyset_order_by: ClassVar[str | None] = None
+    #: The only ``sort`` value allowing keyset pagination of the listing, or
+    #: None if both are allowed
+    _keyset_sort: ClassVar[str | None] = None
+    #: The filters selecting the objects by a time attribute, allowing sharded
+    #: listings by this attribute: ``{attribute: (after filter, before filter)}``
+    _shard_filters: ClassVar[dict[str, tuple[str, str]]] = {}
+    #: The attribute holding the full path of the objects, allowing the client
+    #: path cache to request them by numeric ID instead of by path
+    _full_path_attr: ClassVar[str | None] = None
 
     _computed_path: str
     _parent: RESTObject | None
@@ -392,3 +690,42 @@ class RESTManager(Generic[TObjCls]):
     @property
     def path(self) -> str:
         return self._computed_path
+
+    @property
+    def supports_keyset_pagination(self) -> bool:
+        """Whether the listing supports keyset pagination, which is used to
+        list all the objects with ``get_all=True``, and with iterators with
+        ``pagination="auto"``."""
+        return self._keyset_order_by is not None
+
+    def _create_listed_object(
+        self, data: dict[str, Any], obj_cls: type[TObjCls] | None = None
+    ) -> TObjCls:
+        """Create the object of an item of a listing, merged into the identity
+        map of the client if it has one."""
+        if obj_cls is None:
+            obj_cls = self._obj_cls
+        identity_map = self.gitlab.identity_map
+        if identity_map is None:
+            return obj_cls(self, data, created_from_list=True)
+        return identity_map.add(self, obj_cls, data, complete=False)
+
+    def _invalidate(self, id: str | int | None) -> None:
+        """Remove the object of a resource modified on the server from the
+        identity map of the client."""
+        identity_map = self.gitlab.identity_map
+        if identity_map is not None and id is not None:
+            identity_map.invalidate(self.path, id)
+
+    def _remember_path(self, data: dict[str, Any]) -> None:
+        """Remember the numeric ID of a resource in the path cache of the
+        client if it has one."""
+        path_cache = self.gitlab.path_cache
+        if path_cache is not None and self._full_path_attr is not None:
+            path_cache.add(self, data)
+
+    def _forget_path(self, id: str | int | None) -> None:
+        """Remove a deleted resource from the path cache of the client."""
+        path_cache = self.gitlab.path_cache
+        if path_cache is not None and self._full_path_attr is not None:
+            path_cache.invalidate(self, id)
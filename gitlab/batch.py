@@ -0,0 +1,279 @@
+"""
+Concurrent execution of create, update and delete operations, see
+:meth:`gitlab.Gitlab.batch`.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TYPE_CHECKING
+from urllib import parse
+
+import gitlab
+from gitlab import exceptions as exc
+from gitlab import utils
+
+if TYPE_CHECKING:
+    from gitlab.client import Gitlab
+    from gitlab.mixins import CreateMixin, DeleteMixin, UpdateMixin
+
+__all__ = ["BatchExecutor", "BatchReport", "BatchResult"]
+
+
+@dataclasses.dataclass
+class BatchResult:
+    """The outcome of an operation run by a :class:`BatchExecutor`."""
+
+    #: Identifies the operation in the checkpoint file
+    key: str
+    #: ``"create"``, ``"update"`` or ``"delete"``
+    operation: str
+    path: str
+    #: The value returned by the manager method
+    result: Any = None
+    #: The exception raised by the last attempt, if it failed
+    error: Exception | None = None
+    attempts: int = 0
+    #: Whether the operation was completed by a previous run
+    skipped: bool = False
+
+
+@dataclasses.dataclass
+class BatchReport:
+    """The outcomes of all the operations run by a :class:`BatchExecutor`."""
+
+    succeeded: list[BatchResult] = dataclasses.field(default_factory=list)
+    failed: list[BatchResult] = dataclasses.field(default_factory=list)
+    skipped: list[BatchResult] = dataclasses.field(default_factory=list)
+
+    @property
+    def retries(self) -> int:
+        """The number of operations attempted again after a transient error."""
+        return sum(
+            max(0, result.attempts - 1) for result in self.succeeded + self.failed
+        )
+
+
+class BatchExecutor:
+    """Run create, update and delete operations from any manager concurrently.
+
+    Operations start as soon as they are queued, and :meth:`wait` returns the
+    report once they all completed. Used as a context manager, the executor
+    waits for the operations and shuts down when exiting the ``with`` block.
+
+    Args:
+        gl: The client running the operations.
+        max_workers: Maximum number of operations run at the same time.
+        per_host: Maximum number of operations run at the same time against
+            the same GitLab host.
+        retries: Number of times an operation is attempted again after a
+            transient error, in addition to the retries of the client itself.
+        checkpoint: Path of a file recording the completed operations. When
+            the file exists, the operations it lists are skipped, so an
+            interrupted run can be resumed by running it again.
+    """
+
+    def __init__(
+        self,
+        gl: Gitlab,
+        max_workers: int = 8,
+        per_host: int | None = None,
+        retries: int = 0,
+        checkpoint: str | None = None,
+    ) -> None:
+        if isinstance(gl, gitlab.AsyncGitlab):
+            raise TypeError("Batch operations require a synchronous gitlab.Gitlab")
+        self.gitlab = gl
+        self.per_host = per_host
+        self.retries = retries
+        self.checkpoint = checkpoint
+        self.report = BatchReport()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="python-gitlab-batch"
+        )
+        self._futures: list[concurrent.futures.Future[BatchResult]] = []
+        self._hosts: dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+        self._completed: set[str] = set()
+        if checkpoint is not None and os.path.exists(checkpoint):
+            with open(checkpoint, encoding="utf-8") as f:
+                self._completed = {
+                    json.loads(line)["key"] for line in f if line.strip()
+                }
+
+    def __enter__(self) -> BatchExecutor:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
+
+    def create(
+        self,
+        manager: CreateMixin[Any],
+        data: dict[str, Any],
+        key: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Queue the creation of an object.
+
+        Args:
+            manager: The manager creating the object
+            data: Parameters to send to the server to create the resource
+            key: Identifies the operation in the checkpoint file. Defaults to
+                the path and data of the request.
+            **kwargs: Extra options to send to the server (e.g. sudo)
+        """
+        if key is None:
+            key = f"create {manager.path} {json.dumps(data, sort_keys=True)}"
+        self._submit(
+            key,
+            "create",
+            manager.path,
+            manager.gitlab.url,
+            lambda: manager.create(data, **kwargs),
+        )
+
+    def update(
+        self,
+        manager: UpdateMixin[Any],
+        id: str | int | None,
+        new_data: dict[str, Any],
+        key: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Queue the update of an object.
+
+        Args:
+            manager: The manager updating the object
+            id: ID of the object to update (can be None if not required)
+            new_data: the update data for the object
+            key: Identifies the operation in the checkpoint file. Defaults to
+                the path and data of the request.
+            **kwargs: Extra options to send to the server (e.g. sudo)
+        """
+        path = manager.path if id is None else f"{manager.path}/{id}"
+        if key is None:
+            key = f"update {path} {json.dumps(new_data, sort_keys=True)}"
+        self._submit(
+            key,
+            "update",
+            path,
+            manager.gitlab.url,
+            lambda: manager.update(id, new_data, **kwargs),
+        )
+
+    def delete(
+        self,
+        manager: DeleteMixin[Any],
+        id: str | int | None,
+        key: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Queue the deletion of an object.
+
+        Args:
+            manager: The manager deleting the object
+            id: ID of the object to delete
+            key: Identifies the operation in the checkpoint file. Defaults to
+                the path of the request.
+            **kwargs: Extra options to send to the server (e.g. sudo)
+        """
+        path = manager.path if id is None else f"{manager.path}/{id}"
+        if key is None:
+            key = f"delete {path}"
+        self._submit(
+            key,
+            "delete",
+            path,
+            manager.gitlab.url,
+            lambda: manager.delete(id, **kwargs),
+        )
+
+    def wait(self) -> BatchReport:
+        """Wait for the queued operations to complete.
+
+        Returns:
+            The report of all the operations queued so far.
+        """
+        futures, self._futures = self._futures, []
+        for future in futures:
+            result = future.result()
+            if result.skipped:
+                self.report.skipped.append(result)
+            elif result.error is None:
+                self.report.succeeded.append(result)
+            else:
+                self.report.failed.append(result)
+        return self.report
+
+    def shutdown(self) -> None:
+        """Wait for the queued operations and release the worker threads."""
+        self.wait()
+        self._executor.shutdown()
+
+    def _submit(
+        self, key: str, operation: str, path: str, url: str, function: Callable[[], Any]
+    ) -> None:
+        result = BatchResult(key=key, operation=operation, path=path)
+        if key in self._completed:
+            result.skipped = True
+            future: concurrent.futures.Future[BatchResult] = concurrent.futures.Future()
+            future.set_result(result)
+        else:
+            host = parse.urlparse(url).netloc
+            future = self._executor.submit(self._run, result, host, function)
+        self._futures.append(future)
+
+    def _host_semaphore(self, host: str) -> threading.Semaphore | None:
+        if self.per_host is None:
+            return None
+        with self._lock:
+            return self._hosts.setdefault(host, threading.Semaphore(self.per_host))
+
+    def _run(
+        self, result: BatchResult, host: str, function: Callable[[], Any]
+    ) -> BatchResult:
+        retry = utils.Retry(
+            max_retries=self.retries,
+            retry_transient_errors=True,
+            policy=self.gitlab.retry_policy,
+        )
+        semaphore = self._host_semaphore(host)
+        while True:
+            result.attempts += 1
+            try:
+                if semaphore is None:
+                    result.result = function()
+                else:
+                    with semaphore:
+                        result.result = function()
+            except exc.GitlabError as e:
+                result.error = e
+                wait_time = retry._get_wait_time_on_status(e.response_code)
+            except gitlab.client._TRANSIENT_EXCEPTIONS as e:
+                result.error = e
+                wait_time = retry._get_wait_time()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # e.g. invalid arguments, reported without aborting the batch
+                result.error = e
+                return result
+            else:
+                result.error = None
+                self._record(result)
+                return result
+
+            if wait_time is None:
+                return result
+            time.sleep(wait_time)
+
+    def _record(self, result: BatchResult) -> None:
+        if self.checkpoint is None:
+            return
+        with self._lock, open(self.checkpoint, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"key": result.key}) + "\n")
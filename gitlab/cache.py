@@ -0,0 +1,324 @@
+"""
+Response caches used by :class:`gitlab.Gitlab` to avoid downloading unchanged
+resources again.
+
+Cached ``GET`` responses are served directly while they are fresh (see the
+``ttl`` and ``ttl_rules`` arguments), and revalidated with ``If-None-Match``
+once they are stale: a ``304 Not Modified`` answer reuses the cached body.
+"""
+
+from __future__ import annotations
+
+import abc
+import collections
+import dataclasses
+import fnmatch
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
+__all__ = ["CachedResponse", "MemoryCache", "ResponseCache", "SQLiteCache"]
+
+# Headers describing how the body was transferred, not stored with the decoded body
+_TRANSFER_HEADERS = frozenset(
+    ("content-encoding", "content-length", "transfer-encoding")
+)
+
+
+@dataclasses.dataclass
+class CachedResponse:
+    """A cached ``GET`` response."""
+
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    etag: str | None = None
+    expires_at: float = 0.0
+
+    @classmethod
+    def create(
+        cls,
+        url: str,
+        status_code: int,
+        headers: Iterable[tuple[str, str]],
+        content: bytes,
+        ttl: float,
+    ) -> CachedResponse:
+        """Create the cache entry of a response received from the server."""
+        response = cls(url=url, status_code=status_code, headers={}, content=content)
+        response.update_headers(headers)
+        response.expires_at = time.monotonic() + ttl
+        return response
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self) -> bool:
+        """Whether the response can be used without revalidating it."""
+        return time.monotonic() < self.expires_at
+
+    def revalidated(
+        self, headers: Iterable[tuple[str, str]], ttl: float
+    ) -> CachedResponse:
+        """Return a copy of the response updated by a ``304 Not Modified``."""
+        response = dataclasses.replace(self, headers=dict(self.headers))
+        # The body is unchanged, so its type is kept whatever the 304 says
+        response.update_headers(
+            (key, value) for key, value in headers if key.lower() != "content-type"
+        )
+        response.expires_at = time.monotonic() + ttl
+        return response
+
+    def update_headers(self, headers: Iterable[tuple[str, str]]) -> None:
+        """Merge the headers received from the server."""
+        for key, value in headers:
+            if key.lower() in _TRANSFER_HEADERS:
+                continue
+            for existing in list(self.headers):
+                if existing.lower() == key.lower():
+                    del self.headers[existing]
+            self.headers[key] = value
+            if key.lower() == "etag":
+                self.etag = value
+
+
+class ResponseCache(abc.ABC):
+    """Base class for the response caches.
+
+    Args:
+        ttl: Number of seconds during which a response is served without
+            contacting the server. With the default of 0, every request is
+            revalidated with its ETag.
+        ttl_rules: ``(pattern, ttl)`` pairs overriding ``ttl`` for the API paths
+            matching the ``fnmatch`` pattern, e.g. ``("/projects/*/pipelines*", 30)``.
+            The first matching rule wins. A negative ttl disables caching.
+        max_entries: Maximum number of responses kept in the cache.
+        max_size: Maximum total size in bytes of the cached bodies.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0,
+        ttl_rules: Iterable[tuple[str, float]] = (),
+        max_entries: int | None = 1024,
+        max_size: int | None = 64 * 1024 * 1024,
+    ) -> None:
+        self.ttl = ttl
+        self.ttl_rules = list(ttl_rules)
+        self.max_entries = max_entries
+        self.max_size = max_size
+        #: Responses served from the cache without contacting the server
+        self.hits = 0
+        #: Responses revalidated with a ``304 Not Modified``
+        self.revalidations = 0
+        #: Requests for which no usable response was cached
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def ttl_for(self, path: str) -> float:
+        """Return the time to live of the responses for ``path``."""
+        for pattern, ttl in self.ttl_rules:
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return self.ttl
+
+    def _is_full(self, entries: int, size: int) -> bool:
+        if self.max_entries is not None and entries > self.max_entries:
+            return True
+        return self.max_size is not None and size > self.max_size
+
+    @abc.abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the response cached for ``key``, if any."""
+
+    @abc.abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None:
+        """Cache ``response`` for ``key``, evicting older entries if needed."""
+
+    @abc.abstractmethod
+    def invalidate(self, url: str) -> None:
+        """Remove the responses for ``url`` and the resources below it."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all the cached responses."""
+
+
+class MemoryCache(ResponseCache):
+    """An in-memory cache evicting the least recently used responses.
+
+    See :class:`ResponseCache` for the arguments.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._entries: collections.OrderedDict[str, CachedResponse] = (
+            collections.OrderedDict()
+        )
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = response
+            self._size += response.size
+            while self._entries and self._is_full(len(self._entries), self._size):
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, url: str) -> None:
+        with self._lock:
+            for key, response in list(self._entries.items()):
+                if response.url == url or response.url.startswith(f"{url}/"):
+                    self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key: str) -> None:
+        response = self._entries.pop(key, None)
+        if response is not None:
+            self._size -= response.size
+
+
+class SQLiteCache(ResponseCache):
+    """A cache stored in a SQLite database, which can be shared between runs
+    and processes.
+
+    Args:
+        path: Path of the database file.
+        *args: See :class:`ResponseCache`.
+        **kwargs: See :class:`ResponseCache`.
+    """
+
+    def __init__(self, path: str, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.path = path
+        self._connect()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The responses are kept in the database, which is opened again
+        state = super().__getstate__()
+        del state["_db"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._connect()
+
+    def _connect(self) -> None:
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, url TEXT NOT NULL, status_code INTEGER, "
+                "headers TEXT, content BLOB, etag TEXT, expires_at REAL, "
+                "size INTEGER, last_used REAL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_used "
+                "ON responses (last_used)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT url, status_code, headers, content, etag, expires_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+        url, status_code, headers, content, etag, expires_at = row
+        # Freshness is tracked with the wall clock on disk, and monotonic in memory
+        return CachedResponse(
+            url=url,
+            status_code=status_code,
+            headers=json.loads(headers),
+            content=content,
+            etag=etag,
+            expires_at=time.monotonic() + expires_at - time.time(),
+        )
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        expires_at = time.time() + response.expires_at - time.monotonic()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    json.dumps(response.headers),
+                    response.content,
+                    response.etag,
+                    expires_at,
+                    response.size,
+                    time.time(),
+                ),
+            )
+            self._evict()
+
+    def invalidate(self, url: str) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM responses WHERE url = ? OR substr(url, 1, ?) = ?",
+                (url, len(url) + 1, f"{url}/"),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+
+    def _evict(self) -> None:
+        entries, size = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if not self._is_full(entries, size):
+            return
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY last_used DESC"
+        ).fetchall()
+        evicted = []
+        while rows and self._is_full(entries, size):
+            key, entry_size = rows.pop()
+            evicted.append((key,))
+            entries -= 1
+            size -= entry_size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
@@ -225,7 +225,8 @@ def _get_base_parser(add_help: bool = True) -> argparse.ArgumentParser:
     parser.add_argument(
         "--pagination",
         help=(
-            "Whether to use keyset or offset pagination [env var: GITLAB_PAGINATION]"
+            "Whether to use keyset, offset or auto pagination "
+            "[env var: GITLAB_PAGINATION]"
         ),
         required=False,
         default=os.getenv("GITLAB_PAGINATION"),
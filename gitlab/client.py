@@ -2,23 +2,48 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import dataclasses
+import hashlib
 import os
 import re
-from typing import Any, BinaryIO, cast, TYPE_CHECKING
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, BinaryIO, cast, NoReturn, TYPE_CHECKING, TypeVar
 from urllib import parse
 
 import requests
 
 import gitlab
+import gitlab.batch
+import gitlab.cache
+import gitlab.coalesce
 import gitlab.config
 import gitlab.const
 import gitlab.exceptions
+import gitlab.identity
+import gitlab.instrumentation
+import gitlab.json_codecs
+import gitlab.path_cache
+import gitlab.ratelimit
+import gitlab.retry
 from gitlab import _backends, utils
 
+try:
+    import httpx
+
+    from ._backends.httpx_backend import AsyncHttpxBackend, HttpxBackend
+
+    _HTTPX_INSTALLED = True
+except ImportError:  # pragma: no cover
+    _HTTPX_INSTALLED = False
+
 try:
     import gql
     import gql.transport.exceptions
-    import httpx
+    import graphql
 
     from ._backends.graphql import GitlabAsyncTransport, GitlabTransport
 
@@ -34,6 +59,25 @@ REDIRECT_MSG = (
 )
 
 
+# Exceptions raised by the backends for which a request may be retried when
+# `retry_transient_errors` is enabled.
+_TRANSIENT_EXCEPTIONS: tuple[type[Exception], ...] = (
+    requests.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+)
+if _HTTPX_INSTALLED:
+    _TRANSIENT_EXCEPTIONS += (
+        httpx.TimeoutException,
+        httpx.NetworkError,
+        httpx.RemoteProtocolError,
+    )
+
+# Size of the chunks decoded when list items are streamed
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+_ResponseT = TypeVar("_ResponseT", "requests.Response", "httpx.Response")
+
 # https://docs.gitlab.com/ee/api/#offset-based-pagination
 _PAGINATION_URL = (
     f"https://python-gitlab.readthedocs.io/en/v{gitlab.__version__}/"
@@ -56,17 +100,53 @@ class Gitlab:
         http_username: Username for HTTP authentication
         http_password: Password for HTTP authentication
         api_version: Gitlab API version to use (support for 4 only)
-        pagination: Can be set to 'keyset' to use keyset pagination
+        pagination: Can be set to 'keyset' to use keyset pagination, to
+            'offset' to never switch to it automatically, or to 'auto' to also
+            use it for the iterators of the endpoints supporting it
         order_by: Set order_by globally
         user_agent: A custom user agent to use for making HTTP requests.
         retry_transient_errors: Whether to retry after 500, 502, 503, 504
             or 52x responses, or after a request timeout. Defaults to False.
         keep_base_url: keep user-provided base URL for pagination if it
             differs from response headers
+        cache: A :class:`gitlab.cache.ResponseCache` used to store GET responses
+            and revalidate them with their ETag.
+        rate_limiter: A :class:`gitlab.ratelimit.RateLimiter` pacing the requests
+            to stay under the server rate limits.
+        json_codec: The JSON codec encoding request bodies and decoding
+            responses: ``"json"`` (default), ``"orjson"``, ``"msgspec"``,
+            ``"auto"`` or a :class:`gitlab.json_codecs.JSONCodec`. The standard
+            library is used if the selected codec is not installed.
+        pool_connections: Number of hosts whose connections are pooled.
+        pool_maxsize: Maximum number of connections kept open to a host. Set it
+            to the number of threads sharing the client.
+        pool_block: Whether requests wait for a connection when
+            ``pool_maxsize`` connections are in use, instead of opening extra
+            connections that are closed after the request.
+        pool_idle_timeout: Number of seconds after which an idle connection is
+            closed instead of being reused.
+        coalescer: A :class:`gitlab.coalesce.RequestCoalescer` sending
+            identical GET requests made at the same time only once.
+        retry_policy: A :class:`gitlab.retry.RetryPolicy` pacing the retries,
+            with an optional retry budget and circuit breaker. Defaults to
+            exponential backoff with jitter.
+        identity_map: A :class:`gitlab.identity.IdentityMap` sharing the
+            objects retrieved several times, and returning the recently
+            retrieved ones without requesting them again.
+        path_cache: A :class:`gitlab.path_cache.PathCache` requesting the
+            projects, groups and namespaces retrieved by full path with their
+            numeric ID instead.
+        auto_hydrate: Whether lazy objects retrieve their data on the first
+            access to a missing attribute, together with the other lazy
+            objects of their manager. Not supported by
+            :class:`gitlab.AsyncGitlab`.
 
     Keyword Args:
         requests.Session session: HTTP Requests Session
-        RequestsBackend backend: Backend that will be used to make http requests
+        RequestsBackend backend: Backend that will be used to make http requests,
+            or its name: ``"requests"`` (default) or ``"httpx"``. The other
+            keyword arguments are passed to the backend, e.g. the pool limits
+            of :class:`~gitlab._backends.httpx_backend.HttpxBackend`.
     """
 
     def __init__(
@@ -86,6 +166,18 @@ class Gitlab:
         user_agent: str = gitlab.const.USER_AGENT,
         retry_transient_errors: bool = False,
         keep_base_url: bool = False,
+        cache: gitlab.cache.ResponseCache | None = None,
+        rate_limiter: gitlab.ratelimit.RateLimiter | None = None,
+        json_codec: str | gitlab.json_codecs.JSONCodec | None = None,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool | None = None,
+        pool_idle_timeout: float | None = None,
+        coalescer: gitlab.coalesce.RequestCoalescer | None = None,
+        retry_policy: gitlab.retry.RetryPolicy | None = None,
+        identity_map: gitlab.identity.IdentityMap | None = None,
+        path_cache: gitlab.path_cache.PathCache | None = None,
+        auto_hydrate: bool = False,
         **kwargs: Any,
     ) -> None:
         self._api_version = str(api_version)
@@ -97,6 +189,27 @@ class Gitlab:
         self.timeout = timeout
         self.retry_transient_errors = retry_transient_errors
         self.keep_base_url = keep_base_url
+        #: Cache of the GET responses, revalidated with their ETag
+        self.cache = cache
+        #: Rate limiter pacing the requests before they are sent
+        self.rate_limiter = rate_limiter
+        #: Codec encoding request bodies and decoding responses
+        self.json_codec = gitlab.json_codecs.get_codec(json_codec)
+        #: Coalescer sharing the results of identical GET requests in flight
+        self.coalescer = coalescer
+        #: Policy pacing the retries of the requests
+        self.retry_policy = retry_policy or gitlab.retry.RetryPolicy()
+        #: Identity map of the objects retrieved by the managers
+        self.identity_map = identity_map
+        #: Numeric IDs of the resources retrieved by full path
+        self.path_cache = path_cache
+        #: Whether lazy objects retrieve their data on attribute access
+        self.auto_hydrate = auto_hydrate
+        #: Callbacks called while the requests are sent
+        self.event_hooks = gitlab.instrumentation.Hooks()
+        #: Metrics of the requests sent, see :meth:`stats`
+        self.metrics = gitlab.instrumentation.MetricsCollector()
+        self.event_hooks.subscribe(self.metrics)
         #: Headers that will be used in request to GitLab
         self.headers = {"User-Agent": user_agent}
 
@@ -111,11 +224,22 @@ class Gitlab:
         self._set_auth_info()
 
         #: Create a session object for requests
-        _backend: type[_backends.DefaultBackend] = kwargs.pop(
-            "backend", _backends.DefaultBackend
+        _backend: type[_backends.DefaultBackend] | str = (
+            kwargs.pop("backend", None) or _backends.DefaultBackend
         )
-        self._backend = _backend(**kwargs)
-        self.session = self._backend.client
+        if isinstance(_backend, str):
+            _backend = _backends.get_backend_class(_backend)
+        pool_options = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "pool_idle_timeout": pool_idle_timeout,
+        }
+        # Only set options are passed, so that other backends keep working
+        self._pool_options = {
+            key: value for key, value in pool_options.items() if value is not None
+        }
+        self._create_backend(_backend, **self._pool_options, **kwargs)
 
         self.per_page = per_page
         self.pagination = pagination
@@ -216,6 +340,15 @@ class Gitlab:
         self.statistics = objects.ApplicationStatisticsManager(self)
         """See :class:`~gitlab.v4.objects.ApplicationStatisticsManager`"""
 
+    def _create_backend(
+        self, backend: type[_backends.DefaultBackend], **kwargs: Any
+    ) -> None:
+        if _HTTPX_INSTALLED and issubclass(backend, HttpxBackend):
+            # httpx configures SSL verification on the client, not per request
+            kwargs.setdefault("verify", self.ssl_verify)
+        self._backend = backend(**kwargs)
+        self.session = self._backend.client
+
     def __enter__(self) -> Gitlab:
         return self
 
@@ -225,10 +358,16 @@ class Gitlab:
     def __getstate__(self) -> dict[str, Any]:
         state = self.__dict__.copy()
         state.pop("_objects")
+        backend = state.get("_backend")
+        if backend is not None and state.get("session") is backend.client:
+            # The backend rebuilds its client if it cannot be pickled
+            del state["session"]
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         self.__dict__.update(state)
+        if "session" not in state and "_backend" in state:
+            self.session = self._backend.client
         # We only support v4 API at this time
         if self._api_version not in ("4",):
             raise ModuleNotFoundError(
@@ -280,6 +419,9 @@ class Gitlab:
         config = gitlab.config.GitlabConfigParser(
             gitlab_id=gitlab_id, config_files=config_files
         )
+        kwargs.setdefault("backend", config.backend)
+        if "path_cache" not in kwargs:
+            kwargs["path_cache"] = cls._path_cache_from_config(config)
         return cls(
             config.url,
             private_token=config.private_token,
@@ -296,6 +438,11 @@ class Gitlab:
             user_agent=config.user_agent,
             retry_transient_errors=config.retry_transient_errors,
             keep_base_url=config.keep_base_url,
+            json_codec=config.json_codec,
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+            pool_idle_timeout=config.pool_idle_timeout,
             **kwargs,
         )
 
@@ -352,8 +499,23 @@ class Gitlab:
             pagination=options.get("pagination") or config.pagination,
             order_by=options.get("order_by") or config.order_by,
             user_agent=options.get("user_agent") or config.user_agent,
+            json_codec=config.json_codec,
+            backend=config.backend,
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+            pool_idle_timeout=config.pool_idle_timeout,
+            path_cache=cls._path_cache_from_config(config),
         )
 
+    @staticmethod
+    def _path_cache_from_config(
+        config: gitlab.config.GitlabConfigParser,
+    ) -> gitlab.path_cache.PathCache | None:
+        if config.path_cache is None:
+            return None
+        return gitlab.path_cache.PathCache(config.path_cache)
+
     @staticmethod
     def _merge_auth(
         options: dict[str, Any], config: gitlab.config.GitlabConfigParser
@@ -608,7 +770,7 @@ class Gitlab:
         return url
 
     @staticmethod
-    def _check_redirects(result: requests.Response) -> None:
+    def _check_redirects(result: requests.Response | httpx.Response) -> None:
         # Check the requests history to detect 301/302 redirections.
         # If the initial verb is POST or PUT, the redirected request will use a
         # GET request, leading to unwanted behaviour.
@@ -624,10 +786,12 @@ class Gitlab:
             if item.request.method in ("GET", "HEAD"):
                 continue
             target = item.headers.get("location")
+            # httpx responses expose the reason as `reason_phrase`
+            reason = getattr(item, "reason", None) or getattr(item, "reason_phrase", "")
             raise gitlab.exceptions.RedirectError(
                 REDIRECT_MSG.format(
                     status_code=item.status_code,
-                    reason=item.reason,
+                    reason=reason,
                     source=item.url,
                     target=target,
                 )
@@ -677,6 +841,323 @@ class Gitlab:
         Raises:
             GitlabHttpError: When the return code is not 2xx
         """
+        request_kwargs = self._prepare_request(
+            verb,
+            path,
+            query_data=query_data,
+            post_data=post_data,
+            raw=raw,
+            streamed=streamed,
+            files=files,
+            timeout=timeout,
+            extra_headers=extra_headers,
+            **kwargs,
+        )
+        if retry_transient_errors is None:
+            retry_transient_errors = self.retry_transient_errors
+
+        event = gitlab.instrumentation.create_event(
+            verb, request_kwargs["url"], self._url
+        )
+        retry = utils.Retry(
+            max_retries=max_retries,
+            obey_rate_limit=obey_rate_limit,
+            retry_transient_errors=retry_transient_errors,
+            policy=self.retry_policy,
+            on_retry=self._retry_hook(event),
+        )
+
+        cache_key, cached = self._cache_lookup(verb, request_kwargs)
+        if cached is not None and cached.is_fresh():
+            return self._cached_response(cached).response
+
+        while True:
+            retry.check()
+            delay = self._rate_limit_delay()
+            if delay:
+                self._emit("on_rate_limited", event, wait=delay)
+                time.sleep(delay)
+            event.retries = retry.cur_retries
+            self._emit("on_request", event)
+            started = time.perf_counter()
+            try:
+                result = self._backend.http_request(**request_kwargs)
+            except _TRANSIENT_EXCEPTIONS as e:
+                self._emit(
+                    "on_response", event, elapsed=time.perf_counter() - started, error=e
+                )
+                retry.record_error()
+                if retry.handle_retry():
+                    continue
+                raise
+
+            self._emit_response(event, started, result, streamed)
+            retry.record_status(result.status_code)
+            self._check_redirects(result.response)
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(result.headers)
+
+            if result.status_code == 304 and cache_key and cached is not None:
+                return self._cache_revalidate(cache_key, cached, result).response
+
+            if 200 <= result.status_code < 300:
+                self._cache_store(verb, cache_key, request_kwargs["url"], result)
+                return result.response
+
+            if retry.handle_retry_on_status(
+                result.status_code, result.headers, result.reason
+            ):
+                continue
+
+            self._raise_for_status(result)
+
+    def batch(
+        self,
+        max_workers: int = 8,
+        per_host: int | None = None,
+        retries: int = 0,
+        checkpoint: str | None = None,
+    ) -> gitlab.batch.BatchExecutor:
+        """Create an executor running create, update and delete operations
+        concurrently.
+
+        Args:
+            max_workers: Maximum number of operations run at the same time.
+            per_host: Maximum number of operations run at the same time against
+                the same GitLab host.
+            retries: Number of times an operation is attempted again after a
+                transient error.
+            checkpoint: Path of a file recording the completed operations, used
+                to resume an interrupted run.
+
+        Returns:
+            A :class:`gitlab.batch.BatchExecutor`, to use as a context manager.
+        """
+        return gitlab.batch.BatchExecutor(
+            self,
+            max_workers=max_workers,
+            per_host=per_host,
+            retries=retries,
+            checkpoint=checkpoint,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return the metrics of the requests sent by the client.
+
+        Returns:
+            The number of requests, errors, retries and rate-limited waits,
+            the bytes sent and received, and per endpoint (e.g.
+            ``"GET /projects/{id}"``) the counts, status codes and latency
+            histogram. See :class:`gitlab.instrumentation.MetricsCollector`.
+        """
+        return self.metrics.snapshot()
+
+    def _emit(
+        self, name: str, event: gitlab.instrumentation.RequestEvent, **changes: Any
+    ) -> None:
+        # Each hook gets its own event, the base event changes between attempts
+        self.event_hooks.emit(name, dataclasses.replace(event, **changes))
+
+    def _emit_response(
+        self,
+        event: gitlab.instrumentation.RequestEvent,
+        started: float,
+        result: _backends.protocol.BackendResponse,
+        streamed: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - started
+        sent, received = gitlab.instrumentation.response_sizes(
+            result.response, streamed
+        )
+        self._emit(
+            "on_response",
+            event,
+            status_code=result.status_code,
+            elapsed=elapsed,
+            bytes_sent=sent,
+            bytes_received=received,
+        )
+
+    def _retry_hook(
+        self, event: gitlab.instrumentation.RequestEvent
+    ) -> Callable[[float, int | None], None]:
+        def on_retry(wait_time: float, status_code: int | None) -> None:
+            name = "on_rate_limited" if status_code == 429 else "on_retry"
+            self._emit(name, event, status_code=status_code, wait=wait_time)
+
+        return on_retry
+
+    def pool_stats(self) -> list[_backends.PoolStats]:
+        """Return the utilisation of the connection pools of the backend.
+
+        Returns:
+            The statistics of the connections to each host, or an empty list if
+            the backend does not report them.
+        """
+        pool_stats = getattr(self._backend, "pool_stats", None)
+        if pool_stats is None:
+            return []
+        return cast(list[_backends.PoolStats], pool_stats())
+
+    def _rate_limit_delay(self) -> float:
+        """Return how long to wait before sending a request."""
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.acquire()
+
+    def _cache_path(self, url: str) -> str:
+        """Return the API path matched against the cache TTL rules."""
+        if url.startswith(self._url):
+            return url[len(self._url) :]
+        return parse.urlparse(url).path
+
+    def _cache_lookup(
+        self, verb: str, request_kwargs: dict[str, Any]
+    ) -> tuple[str | None, gitlab.cache.CachedResponse | None]:
+        """Find the cached response of a request.
+
+        Stale responses are revalidated by adding their ETag to the request
+        headers.
+
+        Returns:
+            The cache key of the request, or None if its response is not cached,
+            and the cached response if one can be used.
+        """
+        if (
+            self.cache is None
+            or verb.lower() != "get"
+            or request_kwargs["stream"]
+            or self.cache.ttl_for(self._cache_path(request_kwargs["url"])) < 0
+        ):
+            return None, None
+
+        params = sorted(request_kwargs["params"].items(), key=lambda item: item[0])
+        identity = self._identity(request_kwargs["headers"].get("Sudo"))
+        key = (
+            f"{identity} {request_kwargs['url']}?{parse.urlencode(params, doseq=True)}"
+        )
+
+        cached = self.cache.get(key)
+        if cached is not None and not cached.is_fresh():
+            if cached.etag is None:
+                cached = None
+            else:
+                request_kwargs["headers"]["If-None-Match"] = cached.etag
+        if cached is None:
+            self.cache.misses += 1
+        return key, cached
+
+    def _identity(self, sudo: Any) -> str:
+        """Return a hash of the credentials a request is sent with."""
+        identity = repr(
+            (
+                self.private_token,
+                self.oauth_token,
+                self.job_token,
+                self.http_username,
+                sudo,
+            )
+        )
+        return hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+    def _coalesce_key(
+        self,
+        path: str,
+        query_data: dict[str, Any],
+        streamed: bool,
+        raw: bool,
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        """Return the key identifying identical GET requests, or None if the
+        request is not coalesced."""
+        if self.coalescer is None or streamed:
+            return None
+        options = sorted(kwargs.items(), key=lambda item: item[0])
+        params = sorted(query_data.items(), key=lambda item: item[0])
+        return (
+            f"{self._identity(self.headers.get('Sudo'))} {self._build_url(path)} "
+            f"{params!r} {options!r} {raw}"
+        )
+
+    def _cached_response(
+        self, cached: gitlab.cache.CachedResponse
+    ) -> _backends.DefaultResponse:
+        if TYPE_CHECKING:
+            assert self.cache is not None
+        self.cache.hits += 1
+        return self._backend.build_response(
+            cached.url, cached.status_code, cached.headers, cached.content
+        )
+
+    def _cache_revalidate(
+        self,
+        key: str,
+        cached: gitlab.cache.CachedResponse,
+        result: _backends.protocol.BackendResponse,
+    ) -> _backends.DefaultResponse:
+        """Refresh a cached response after a ``304 Not Modified``."""
+        if TYPE_CHECKING:
+            assert self.cache is not None
+        cached = cached.revalidated(
+            result.headers.items(), self.cache.ttl_for(self._cache_path(cached.url))
+        )
+        self.cache.set(key, cached)
+        self.cache.revalidations += 1
+        return self._backend.build_response(
+            cached.url, cached.status_code, cached.headers, cached.content
+        )
+
+    def _cache_store(
+        self,
+        verb: str,
+        key: str | None,
+        url: str,
+        result: _backends.protocol.BackendResponse,
+    ) -> None:
+        """Cache a successful GET response, or invalidate the responses of a
+        resource modified by another method."""
+        if self.cache is None:
+            return
+        if verb.lower() != "get":
+            self.cache.invalidate(url)
+            return
+        if key is None or result.status_code != 200:
+            return
+        if "no-store" in result.headers.get("Cache-Control", ""):
+            return
+
+        ttl = self.cache.ttl_for(self._cache_path(url))
+        if ttl <= 0 and "ETag" not in result.headers:
+            return
+        self.cache.set(
+            key,
+            gitlab.cache.CachedResponse.create(
+                url=url,
+                status_code=result.status_code,
+                headers=result.headers.items(),
+                content=result.content,
+                ttl=ttl,
+            ),
+        )
+
+    def _prepare_request(
+        self,
+        verb: str,
+        path: str,
+        query_data: dict[str, Any] | None = None,
+        post_data: dict[str, Any] | bytes | BinaryIO | None = None,
+        raw: bool = False,
+        streamed: bool = False,
+        files: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        extra_headers: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build the keyword arguments passed to the backend's ``http_request()``.
+
+        Returns:
+            The backend request arguments (method, url, params, body, ...).
+        """
         query_data = query_data or {}
         raw_url = self._build_url(path)
 
@@ -708,76 +1189,62 @@ class Gitlab:
         # If timeout was passed into kwargs, allow it to override the default
         if timeout is None:
             timeout = opts_timeout
-        if retry_transient_errors is None:
-            retry_transient_errors = self.retry_transient_errors
 
         # We need to deal with json vs. data when uploading files
         send_data = self._backend.prepare_send_data(files, post_data, raw)
         opts["headers"]["Content-type"] = send_data.content_type
+        json_data, data = send_data.json, send_data.data
+        if isinstance(json_data, (dict, list)) and not isinstance(
+            self.json_codec, gitlab.json_codecs.StdlibCodec
+        ):
+            # The backend would encode the body with the standard library
+            json_data, data = None, self.json_codec.dumps(json_data)
 
         if extra_headers is not None:
             opts["headers"].update(extra_headers)
 
-        retry = utils.Retry(
-            max_retries=max_retries,
-            obey_rate_limit=obey_rate_limit,
-            retry_transient_errors=retry_transient_errors,
-        )
-
-        while True:
-            try:
-                result = self._backend.http_request(
-                    method=verb,
-                    url=url,
-                    json=send_data.json,
-                    data=send_data.data,
-                    params=params,
-                    timeout=timeout,
-                    verify=verify,
-                    stream=streamed,
-                    **opts,
-                )
-            except (
-                requests.ConnectionError,
-                requests.exceptions.ChunkedEncodingError,
-                requests.exceptions.Timeout,
-            ):
-                if retry.handle_retry():
-                    continue
-                raise
-
-            self._check_redirects(result.response)
-
-            if 200 <= result.status_code < 300:
-                return result.response
+        return {
+            "method": verb,
+            "url": url,
+            "json": json_data,
+            "data": data,
+            "params": params,
+            "timeout": timeout,
+            "verify": verify,
+            "stream": streamed,
+            **opts,
+        }
 
-            if retry.handle_retry_on_status(
-                result.status_code, result.headers, result.reason
-            ):
-                continue
+    @staticmethod
+    def _raise_for_status(result: _backends.protocol.BackendResponse) -> NoReturn:
+        """Raise the exception matching an unsuccessful response.
 
-            error_message = result.content
-            try:
-                error_json = result.json()
-                for k in ("message", "error"):
-                    if k in error_json:
-                        error_message = error_json[k]
-            except (KeyError, ValueError, TypeError):
-                pass
-
-            if result.status_code == 401:
-                raise gitlab.exceptions.GitlabAuthenticationError(
-                    response_code=result.status_code,
-                    error_message=error_message,
-                    response_body=result.content,
-                )
+        Raises:
+            GitlabAuthenticationError: When the return code is 401
+            GitlabHttpError: For any other return code
+        """
+        error_message = result.content
+        try:
+            error_json = result.json()
+            for k in ("message", "error"):
+                if k in error_json:
+                    error_message = error_json[k]
+        except (KeyError, ValueError, TypeError):
+            pass
 
-            raise gitlab.exceptions.GitlabHttpError(
+        if result.status_code == 401:
+            raise gitlab.exceptions.GitlabAuthenticationError(
                 response_code=result.status_code,
                 error_message=error_message,
                 response_body=result.content,
             )
 
+        raise gitlab.exceptions.GitlabHttpError(
+            response_code=result.status_code,
+            error_message=error_message,
+            response_body=result.content,
+        )
+
     def http_get(
         self,
         path: str,
@@ -806,23 +1273,44 @@ class Gitlab:
             GitlabParsingError: If the json data could not be parsed
         """
         query_data = query_data or {}
-        result = self.http_request(
-            "get", path, query_data=query_data, streamed=streamed, **kwargs
-        )
+
+        def get() -> dict[str, Any] | requests.Response:
+            result = self.http_request(
+                "get", path, query_data=query_data, streamed=streamed, **kwargs
+            )
+            return self._process_get_result(result, streamed=streamed, raw=raw)
+
+        key = self._coalesce_key(path, query_data, streamed, raw, kwargs)
+        if key is None or self.coalescer is None:
+            return get()
+        return self.coalescer.do(key, get)
+
+    def _process_get_result(
+        self, result: _ResponseT, *, streamed: bool = False, raw: bool = False
+    ) -> dict[str, Any] | _ResponseT:
+        """Return the parsed JSON body of a GET response, or the response itself
+        if streamed, raw or not JSON."""
         content_type = utils.get_content_type(result.headers.get("Content-Type"))
 
         if content_type == "application/json" and not streamed and not raw:
-            try:
-                json_result = result.json()
-                if TYPE_CHECKING:
-                    assert isinstance(json_result, dict)
-                return json_result
-            except Exception as e:
-                raise gitlab.exceptions.GitlabParsingError(
-                    error_message="Failed to parse the server message"
-                ) from e
-        else:
-            return result
+            return self._parse_json(result)
+        return result
+
+    def _parse_json(self, result: requests.Response | httpx.Response) -> dict[str, Any]:
+        """Parse the JSON body of a response.
+
+        Raises:
+            GitlabParsingError: If the json data could not be parsed
+        """
+        try:
+            json_result = self.json_codec.loads(result.content)
+            if TYPE_CHECKING:
+                assert isinstance(json_result, dict)
+            return json_result
+        except Exception as e:
+            raise gitlab.exceptions.GitlabParsingError(
+                error_message="Failed to parse the server message"
+            ) from e
 
     def http_head(
         self, path: str, query_data: dict[str, Any] | None = None, **kwargs: Any
@@ -861,6 +1349,10 @@ class Gitlab:
                         'http://whatever/v4/api/projects')
             query_data: Data to send as query parameters
             iterator: Indicate if should return a generator (True)
+            prefetch: With `get_all` or `iterator`, the number of pages to
+                fetch concurrently when the total number of pages is known
+            streamed: Decode the items while the pages are received instead of
+                loading each page in memory
             **kwargs: Extra options to send to the server (e.g. sudo, page,
                       per_page)
 
@@ -876,6 +1368,7 @@ class Gitlab:
             GitlabParsingError: If the json data could not be parsed
         """
         query_data = query_data or {}
+        prefetch = kwargs.pop("prefetch", None)
 
         # Provide a `get_all`` param to avoid clashes with `all` API attributes.
         get_all = kwargs.pop("get_all", None)
@@ -899,14 +1392,30 @@ class Gitlab:
                 )
 
             # Generator requested
-            return GitlabList(self, url, query_data, **kwargs)
+            return GitlabList(self, url, query_data, prefetch=prefetch, **kwargs)
 
         if get_all is True:
-            return list(GitlabList(self, url, query_data, **kwargs))
+            return list(GitlabList(self, url, query_data, prefetch=prefetch, **kwargs))
 
         # pagination requested, we return a list
         gl_list = GitlabList(self, url, query_data, get_next=False, **kwargs)
         items = list(gl_list)
+        self._warn_on_partial_list(
+            gl_list, items, get_all=get_all, page=page, message_details=message_details
+        )
+        return items
+
+    @staticmethod
+    def _warn_on_partial_list(
+        gl_list: GitlabList | AsyncGitlabList,
+        items: list[dict[str, Any]],
+        *,
+        get_all: bool | None,
+        page: int | None,
+        message_details: utils.WarnMessageData | None,
+    ) -> None:
+        """Warn the user when a list() call without pagination arguments only
+        returned the first page of a larger result set."""
 
         def should_emit_warning() -> bool:
             # No warning is emitted if any of the following conditions apply:
@@ -928,7 +1437,7 @@ class Gitlab:
             return True
 
         if not should_emit_warning():
-            return items
+            return
 
         # Warn the user that they are only going to retrieve `per_page`
         # maximum items. This is a common cause of issues filed.
@@ -953,7 +1462,6 @@ class Gitlab:
             )
             show_caller = True
         utils.warn(message=message, category=UserWarning, show_caller=show_caller)
-        return items
 
     def http_post(
         self,
@@ -996,18 +1504,13 @@ class Gitlab:
             raw=raw,
             **kwargs,
         )
-        content_type = utils.get_content_type(result.headers.get("Content-Type"))
+        return self._process_post_result(result)
 
-        try:
-            if content_type == "application/json":
-                json_result = result.json()
-                if TYPE_CHECKING:
-                    assert isinstance(json_result, dict)
-                return json_result
-        except Exception as e:
-            raise gitlab.exceptions.GitlabParsingError(
-                error_message="Failed to parse the server message"
-            ) from e
+    def _process_post_result(self, result: _ResponseT) -> dict[str, Any] | _ResponseT:
+        """Return the parsed JSON body of a POST response if it is JSON."""
+        content_type = utils.get_content_type(result.headers.get("Content-Type"))
+        if content_type == "application/json":
+            return self._parse_json(result)
         return result
 
     def http_put(
@@ -1050,17 +1553,7 @@ class Gitlab:
             raw=raw,
             **kwargs,
         )
-        if result.status_code in gitlab.const.NO_JSON_RESPONSE_CODES:
-            return result
-        try:
-            json_result = result.json()
-            if TYPE_CHECKING:
-                assert isinstance(json_result, dict)
-            return json_result
-        except Exception as e:
-            raise gitlab.exceptions.GitlabParsingError(
-                error_message="Failed to parse the server message"
-            ) from e
+        return self._process_update_result(result)
 
     def http_patch(
         self,
@@ -1095,17 +1588,14 @@ class Gitlab:
         result = self.http_request(
             "patch", path, query_data=query_data, post_data=post_data, raw=raw, **kwargs
         )
+        return self._process_update_result(result)
+
+    def _process_update_result(self, result: _ResponseT) -> dict[str, Any] | _ResponseT:
+        """Return the parsed JSON body of a PUT/PATCH response, or the response
+        itself if the status code implies an empty body."""
         if result.status_code in gitlab.const.NO_JSON_RESPONSE_CODES:
             return result
-        try:
-            json_result = result.json()
-            if TYPE_CHECKING:
-                assert isinstance(json_result, dict)
-            return json_result
-        except Exception as e:
-            raise gitlab.exceptions.GitlabParsingError(
-                error_message="Failed to parse the server message"
-            ) from e
+        return self._parse_json(result)
 
     def http_delete(self, path: str, **kwargs: Any) -> requests.Response:
         """Make a DELETE request to the Gitlab server.
@@ -1145,59 +1635,493 @@ class Gitlab:
         return self.http_list("/search", query_data=data, **kwargs)
 
 
-class GitlabList:
-    """Generator representing a list of remote objects.
+class AsyncGitlab(Gitlab):
+    """Represents an asynchronous GitLab server connection.
 
-    The object handles the links returned by a query to the API, and will call
-    the API again when needed.
+    Accepts the same arguments as :class:`~gitlab.Gitlab`, but performs the
+    requests with an ``httpx.AsyncClient``. The HTTP methods, as well as the
+    ``get()``, ``list()``, ``create()``, ``update()``, ``delete()``,
+    ``refresh()`` and ``save()`` methods of managers and objects, return
+    awaitables.
+
+    Keyword Args:
+        httpx.AsyncClient client: An existing asynchronous httpx client
+        AsyncHttpxBackend backend: Backend that will be used to make http requests
     """
 
+    # pylint: disable=invalid-overridden-method
+
     def __init__(
         self,
-        gl: Gitlab,
-        url: str,
-        query_data: dict[str, Any],
-        get_next: bool = True,
+        url: str | None = None,
+        private_token: str | None = None,
+        oauth_token: str | None = None,
+        job_token: str | None = None,
+        ssl_verify: bool | str = True,
+        http_username: str | None = None,
+        http_password: str | None = None,
+        timeout: float | None = None,
+        api_version: str = "4",
+        per_page: int | None = None,
+        pagination: str | None = None,
+        order_by: str | None = None,
+        user_agent: str = gitlab.const.USER_AGENT,
+        retry_transient_errors: bool = False,
+        keep_base_url: bool = False,
+        cache: gitlab.cache.ResponseCache | None = None,
+        rate_limiter: gitlab.ratelimit.RateLimiter | None = None,
+        json_codec: str | gitlab.json_codecs.JSONCodec | None = None,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool | None = None,
+        pool_idle_timeout: float | None = None,
+        coalescer: gitlab.coalesce.RequestCoalescer | None = None,
+        retry_policy: gitlab.retry.RetryPolicy | None = None,
+        identity_map: gitlab.identity.IdentityMap | None = None,
+        path_cache: gitlab.path_cache.PathCache | None = None,
+        auto_hydrate: bool = False,
         **kwargs: Any,
     ) -> None:
-        self._gl = gl
-
-        # Preserve kwargs for subsequent queries
-        self._kwargs = kwargs.copy()
-
-        self._query(url, query_data, **self._kwargs)
-        self._get_next = get_next
-
-        # Remove query_parameters from kwargs, which are saved via the `next` URL
-        self._kwargs.pop("query_parameters", None)
+        if not _HTTPX_INSTALLED:
+            raise ImportError(
+                "The asynchronous client could not be initialized because "
+                "httpx is not installed. "
+                "Install it with 'pip install python-gitlab[httpx]'"
+            )
+        backend = kwargs.get("backend")
+        if backend is None or backend == "httpx":
+            kwargs["backend"] = AsyncHttpxBackend
+            kwargs.setdefault("verify", ssl_verify)
+        elif isinstance(backend, str):
+            raise ValueError("The asynchronous client only supports the httpx backend")
+        if auto_hydrate:
+            raise ValueError(
+                "Attributes cannot be retrieved on access with the asynchronous "
+                "client, await manager.hydrate(objects) instead"
+            )
+        super().__init__(
+            url,
+            private_token=private_token,
+            oauth_token=oauth_token,
+            job_token=job_token,
+            ssl_verify=ssl_verify,
+            http_username=http_username,
+            http_password=http_password,
+            timeout=timeout,
+            api_version=api_version,
+            per_page=per_page,
+            pagination=pagination,
+            order_by=order_by,
+            user_agent=user_agent,
+            retry_transient_errors=retry_transient_errors,
+            keep_base_url=keep_base_url,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            pool_idle_timeout=pool_idle_timeout,
+            coalescer=coalescer,
+            retry_policy=retry_policy,
+            identity_map=identity_map,
+            path_cache=path_cache,
+            auto_hydrate=auto_hydrate,
+            **kwargs,
+        )
 
-    def _query(
-        self, url: str, query_data: dict[str, Any] | None = None, **kwargs: Any
-    ) -> None:
+    async def __aenter__(self) -> AsyncGitlab:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await cast(httpx.AsyncClient, self.session).aclose()
+
+    async def auth(self) -> None:  # type: ignore[override]
+        """Performs an authentication using private token. Warns the user if a
+        potentially misconfigured URL is detected on the client or server side.
+
+        The `user` attribute will hold a `gitlab.objects.CurrentUser` object on
+        success.
+        """
+        self.user = await self._objects.CurrentUserManager(self).get()
+
+        if hasattr(self.user, "web_url") and hasattr(self.user, "username"):
+            self._check_url(self.user.web_url, path=self.user.username)
+
+    async def version(self) -> tuple[str, str]:  # type: ignore[override]
+        """Returns the version and revision of the gitlab server.
+
+        Returns:
+            The server version and server revision.
+                ('unknown', 'unknown') if the server doesn't perform as expected.
+        """
+        if self._server_version in (None, "unknown"):
+            try:
+                data = await self.http_get("/version")
+                if isinstance(data, dict):
+                    self._server_version = data["version"]
+                    self._server_revision = data["revision"]
+                else:
+                    self._server_version = "unknown"
+                    self._server_revision = "unknown"
+            except Exception:
+                self._server_version = "unknown"
+                self._server_revision = "unknown"
+
+        return cast(str, self._server_version), cast(str, self._server_revision)
+
+    @gitlab.exceptions.on_http_error(gitlab.exceptions.GitlabMarkdownError)
+    async def markdown(  # type: ignore[override]
+        self, text: str, gfm: bool = False, project: str | None = None, **kwargs: Any
+    ) -> str:
+        """Render an arbitrary Markdown document.
+
+        See :meth:`gitlab.Gitlab.markdown`.
+        """
+        post_data = {"text": text, "gfm": gfm}
+        if project is not None:
+            post_data["project"] = project
+        data = await self.http_post("/markdown", post_data=post_data, **kwargs)
+        if TYPE_CHECKING:
+            assert not isinstance(data, httpx.Response)
+            assert isinstance(data["html"], str)
+        return data["html"]
+
+    @gitlab.exceptions.on_http_error(gitlab.exceptions.GitlabLicenseError)
+    async def get_license(  # type: ignore[override]
+        self, **kwargs: Any
+    ) -> dict[str, str | dict[str, str]]:
+        """Retrieve information about the current license.
+
+        See :meth:`gitlab.Gitlab.get_license`.
+        """
+        result = await self.http_get("/license", **kwargs)
+        if isinstance(result, dict):
+            return result
+        return {}
+
+    async def http_request(  # type: ignore[override]
+        self,
+        verb: str,
+        path: str,
+        query_data: dict[str, Any] | None = None,
+        post_data: dict[str, Any] | bytes | BinaryIO | None = None,
+        raw: bool = False,
+        streamed: bool = False,
+        files: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        obey_rate_limit: bool = True,
+        retry_transient_errors: bool | None = None,
+        max_retries: int = 10,
+        extra_headers: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Make an HTTP request to the Gitlab server.
+
+        See :meth:`gitlab.Gitlab.http_request`.
+
+        Returns:
+            An httpx response object.
+        """
+        import anyio
+
+        request_kwargs = self._prepare_request(
+            verb,
+            path,
+            query_data=query_data,
+            post_data=post_data,
+            raw=raw,
+            streamed=streamed,
+            files=files,
+            timeout=timeout,
+            extra_headers=extra_headers,
+            **kwargs,
+        )
+        if retry_transient_errors is None:
+            retry_transient_errors = self.retry_transient_errors
+
+        event = gitlab.instrumentation.create_event(
+            verb, request_kwargs["url"], self._url
+        )
+        retry = utils.Retry(
+            max_retries=max_retries,
+            obey_rate_limit=obey_rate_limit,
+            retry_transient_errors=retry_transient_errors,
+            policy=self.retry_policy,
+            on_retry=self._retry_hook(event),
+        )
+
+        cache_key, cached = self._cache_lookup(verb, request_kwargs)
+        if cached is not None and cached.is_fresh():
+            return cast(httpx.Response, self._cached_response(cached).response)
+
+        backend = cast(AsyncHttpxBackend, self._backend)
+        while True:
+            retry.check()
+            delay = self._rate_limit_delay()
+            if delay:
+                self._emit("on_rate_limited", event, wait=delay)
+                await anyio.sleep(delay)
+            event.retries = retry.cur_retries
+            self._emit("on_request", event)
+            started = time.perf_counter()
+            try:
+                result = await backend.http_request(**request_kwargs)
+            except _TRANSIENT_EXCEPTIONS as e:
+                self._emit(
+                    "on_response", event, elapsed=time.perf_counter() - started, error=e
+                )
+                retry.record_error()
+                if await retry.async_handle_retry():
+                    continue
+                raise
+
+            self._emit_response(event, started, result, streamed)
+            retry.record_status(result.status_code)
+            self._check_redirects(result.response)
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(result.headers)
+
+            if result.status_code == 304 and cache_key and cached is not None:
+                revalidated = self._cache_revalidate(cache_key, cached, result)
+                return cast(httpx.Response, revalidated.response)
+
+            if 200 <= result.status_code < 300:
+                self._cache_store(verb, cache_key, request_kwargs["url"], result)
+                return result.response
+
+            if streamed:
+                await result.response.aread()
+
+            if await retry.async_handle_retry_on_status(
+                result.status_code, result.headers, result.reason
+            ):
+                continue
+
+            self._raise_for_status(result)
+
+    async def http_get(  # type: ignore[override]
+        self,
+        path: str,
+        query_data: dict[str, Any] | None = None,
+        streamed: bool = False,
+        raw: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, Any] | httpx.Response:
+        """Make a GET request to the Gitlab server.
+
+        See :meth:`gitlab.Gitlab.http_get`.
+        """
         query_data = query_data or {}
-        result = self._gl.http_request("get", url, query_data=query_data, **kwargs)
+
+        async def get() -> dict[str, Any] | httpx.Response:
+            result = await self.http_request(
+                "get", path, query_data=query_data, streamed=streamed, **kwargs
+            )
+            return self._process_get_result(result, streamed=streamed, raw=raw)
+
+        key = self._coalesce_key(path, query_data, streamed, raw, kwargs)
+        if key is None or self.coalescer is None:
+            return await get()
+        return await self.coalescer.async_do(key, get)
+
+    async def http_head(  # type: ignore[override]
+        self, path: str, query_data: dict[str, Any] | None = None, **kwargs: Any
+    ) -> httpx.Headers:
+        """Make a HEAD request to the Gitlab server.
+
+        See :meth:`gitlab.Gitlab.http_head`.
+        """
+        query_data = query_data or {}
+        result = await self.http_request("head", path, query_data=query_data, **kwargs)
+        return result.headers
+
+    async def http_list(  # type: ignore[override]
+        self,
+        path: str,
+        query_data: dict[str, Any] | None = None,
+        *,
+        iterator: bool | None = None,
+        message_details: utils.WarnMessageData | None = None,
+        **kwargs: Any,
+    ) -> AsyncGitlabList | list[dict[str, Any]]:
+        """Make a GET request to the Gitlab server for list-oriented queries.
+
+        See :meth:`gitlab.Gitlab.http_list`. If `iterator` is True an
+        :class:`~gitlab.client.AsyncGitlabList` is returned, to be consumed
+        with ``async for``. Pages are not prefetched, ``prefetch`` cannot be
+        set.
+        """
+        query_data = query_data or {}
+        if kwargs.pop("prefetch", None):
+            raise ValueError("Pages cannot be prefetched with the asynchronous client")
+
+        # Provide a `get_all`` param to avoid clashes with `all` API attributes.
+        get_all = kwargs.pop("get_all", None)
+
+        if get_all is None:
+            # For now, keep `all` without deprecation.
+            get_all = kwargs.pop("all", None)
+
+        url = self._build_url(path)
+
+        page = kwargs.get("page")
+
+        if iterator:
+            if page is not None:
+                utils.warn(
+                    message=(
+                        f"`{iterator=}` and `{page=}` were both specified. "
+                        f"`{page=}` will be ignored."
+                    ),
+                    category=UserWarning,
+                )
+
+            # Generator requested
+            return await AsyncGitlabList.create(self, url, query_data, **kwargs)
+
+        if get_all is True:
+            gl_list = await AsyncGitlabList.create(self, url, query_data, **kwargs)
+            return [item async for item in gl_list]
+
+        # pagination requested, we return a list
+        gl_list = await AsyncGitlabList.create(
+            self, url, query_data, get_next=False, **kwargs
+        )
+        items = [item async for item in gl_list]
+        self._warn_on_partial_list(
+            gl_list, items, get_all=get_all, page=page, message_details=message_details
+        )
+        return items
+
+    async def http_post(  # type: ignore[override]
+        self,
+        path: str,
+        query_data: dict[str, Any] | None = None,
+        post_data: dict[str, Any] | None = None,
+        raw: bool = False,
+        files: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any] | httpx.Response:
+        """Make a POST request to the Gitlab server.
+
+        See :meth:`gitlab.Gitlab.http_post`.
+        """
+        query_data = query_data or {}
+        post_data = post_data or {}
+
+        result = await self.http_request(
+            "post",
+            path,
+            query_data=query_data,
+            post_data=post_data,
+            files=files,
+            raw=raw,
+            **kwargs,
+        )
+        return self._process_post_result(result)
+
+    async def http_put(  # type: ignore[override]
+        self,
+        path: str,
+        query_data: dict[str, Any] | None = None,
+        post_data: dict[str, Any] | bytes | BinaryIO | None = None,
+        raw: bool = False,
+        files: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any] | httpx.Response:
+        """Make a PUT request to the Gitlab server.
+
+        See :meth:`gitlab.Gitlab.http_put`.
+        """
+        query_data = query_data or {}
+        post_data = post_data or {}
+
+        result = await self.http_request(
+            "put",
+            path,
+            query_data=query_data,
+            post_data=post_data,
+            files=files,
+            raw=raw,
+            **kwargs,
+        )
+        return self._process_update_result(result)
+
+    async def http_patch(  # type: ignore[override]
+        self,
+        path: str,
+        *,
+        query_data: dict[str, Any] | None = None,
+        post_data: dict[str, Any] | bytes | None = None,
+        raw: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, Any] | httpx.Response:
+        """Make a PATCH request to the Gitlab server.
+
+        See :meth:`gitlab.Gitlab.http_patch`.
+        """
+        query_data = query_data or {}
+        post_data = post_data or {}
+
+        result = await self.http_request(
+            "patch", path, query_data=query_data, post_data=post_data, raw=raw, **kwargs
+        )
+        return self._process_update_result(result)
+
+    async def http_delete(  # type: ignore[override]
+        self, path: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Make a DELETE request to the Gitlab server.
+
+        See :meth:`gitlab.Gitlab.http_delete`.
+        """
+        return await self.http_request("delete", path, **kwargs)
+
+
+class _BaseGitlabList:
+    """Pagination state shared by the synchronous and asynchronous lists."""
+
+    def __init__(self, gl: Gitlab, get_next: bool, kwargs: dict[str, Any]) -> None:
+        self._gl = gl
+        self._get_next = get_next
+        # Preserve kwargs for subsequent queries
+        self._kwargs = kwargs.copy()
+
+        self._next_url: str | None = None
+        self._current_page: str | None = None
+        self._prev_page: str | None = None
+        self._next_page: str | None = None
+        self._per_page: str | None = None
+        self._total_pages: str | None = None
+        self._total: str | None = None
+        self._data: Iterator[dict[str, Any]] = iter(())
+
+    def _process_response(self, result: Any) -> None:
         try:
             next_url = result.links["next"]["url"]
         except KeyError:
             next_url = None
 
         self._next_url = self._gl._check_url(next_url)
-        self._current_page: str | None = result.headers.get("X-Page")
-        self._prev_page: str | None = result.headers.get("X-Prev-Page")
-        self._next_page: str | None = result.headers.get("X-Next-Page")
-        self._per_page: str | None = result.headers.get("X-Per-Page")
-        self._total_pages: str | None = result.headers.get("X-Total-Pages")
-        self._total: str | None = result.headers.get("X-Total")
+        self._current_page = result.headers.get("X-Page")
+        self._prev_page = result.headers.get("X-Prev-Page")
+        self._next_page = result.headers.get("X-Next-Page")
+        self._per_page = result.headers.get("X-Per-Page")
+        self._total_pages = result.headers.get("X-Total-Pages")
+        self._total = result.headers.get("X-Total")
+
+        if self._kwargs.get("streamed"):
+            # The items are decoded while iterating, see _next_item()
+            return
 
         try:
-            self._data: list[dict[str, Any]] = result.json()
+            self._data = iter(self._gl.json_codec.loads(result.content))
         except Exception as e:
             raise gitlab.exceptions.GitlabParsingError(
                 error_message="Failed to parse the server message"
             ) from e
 
-        self._current = 0
-
     @property
     def current_page(self) -> int:
         """The current page number."""
@@ -1243,24 +2167,166 @@ class GitlabList:
             return int(self._total)
         return None
 
-    def __iter__(self) -> GitlabList:
-        return self
-
     def __len__(self) -> int:
         if self._total is None:
             return 0
         return int(self._total)
 
+    def _next_item(self) -> dict[str, Any] | None:
+        """Return the next item of the current page, or None if it is exhausted."""
+        try:
+            return next(self._data, None)
+        except ValueError as e:
+            raise gitlab.exceptions.GitlabParsingError(
+                error_message="Failed to parse the server message"
+            ) from e
+
+
+class GitlabList(_BaseGitlabList):
+    """Generator representing a list of remote objects.
+
+    The object handles the links returned by a query to the API, and will call
+    the API again when needed.
+
+    If ``prefetch`` is set and the server returned the total number of pages,
+    the remaining pages are requested concurrently by up to ``prefetch``
+    threads and yielded in order. Otherwise the ``next`` links are followed
+    one page at a time.
+
+    If ``streamed`` is set, the items are decoded from the response body as it
+    is received, so that a whole page is never held in memory. Pages are not
+    prefetched in this mode.
+
+    The prefetching threads stop once all the pages are consumed. To stop them
+    earlier, e.g. after breaking out of a loop, call :meth:`close` or use the
+    list as a context manager.
+    """
+
+    def __init__(
+        self,
+        gl: Gitlab,
+        url: str,
+        query_data: dict[str, Any],
+        get_next: bool = True,
+        prefetch: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(gl, get_next, kwargs)
+        self._query(url, query_data, **self._kwargs)
+
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._pending: collections.deque[concurrent.futures.Future[Any]] = (
+            collections.deque()
+        )
+        self._pages: Iterator[int] = iter(())
+        self._page_request: dict[str, Any] = {}
+        if prefetch and not self._kwargs.get("streamed") and self._can_prefetch():
+            self._start_prefetch(prefetch, url, query_data, self._kwargs)
+
+        # Remove query_parameters from kwargs, which are saved via the `next` URL
+        self._kwargs.pop("query_parameters", None)
+
+    def _query(
+        self, url: str, query_data: dict[str, Any] | None = None, **kwargs: Any
+    ) -> None:
+        query_data = query_data or {}
+        result = self._gl.http_request("get", url, query_data=query_data, **kwargs)
+        self._process_response(result)
+        if self._kwargs.get("streamed"):
+            self._data = utils._iter_json_array(
+                utils._iter_content(result, _STREAM_CHUNK_SIZE)
+            )
+
+    def _can_prefetch(self) -> bool:
+        # Pages can only be addressed by number with offset pagination, when
+        # GitLab returned the totals (i.e. for less than 10,000 items).
+        return (
+            self._get_next is True
+            and self._current_page is not None
+            and self._total_pages is not None
+        )
+
+    def _start_prefetch(
+        self, workers: int, url: str, query_data: dict[str, Any], kwargs: dict[str, Any]
+    ) -> None:
+        first_page = int(cast(str, self._current_page)) + 1
+        last_page = int(cast(str, self._total_pages))
+        if first_page > last_page:
+            return
+
+        self._pages = iter(range(first_page, last_page + 1))
+        self._page_request = {
+            "path": url,
+            "query_data": query_data,
+            **{k: v for k, v in kwargs.items() if k != "page"},
+        }
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="python-gitlab-prefetch"
+        )
+        # Keep at most `workers` pages in flight or buffered at any time
+        for _ in range(workers):
+            self._submit_next_page()
+
+    def _submit_next_page(self) -> None:
+        page = next(self._pages, None)
+        if page is None or self._executor is None:
+            return
+        self._pending.append(
+            self._executor.submit(
+                self._gl.http_request, "get", page=page, **self._page_request
+            )
+        )
+
+    def _next_prefetched_page(self) -> bool:
+        """Load the next prefetched page. Returns False when all are consumed."""
+        if self._executor is None:
+            return False
+        if not self._pending:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            return False
+
+        try:
+            result = self._pending.popleft().result()
+        except BaseException:
+            self.close()
+            raise
+        self._submit_next_page()
+        self._process_response(result)
+        return True
+
+    def close(self) -> None:
+        """Stop prefetching pages, cancelling the requests not sent yet."""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._pending.clear()
+
+    def __enter__(self) -> GitlabList:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __iter__(self) -> GitlabList:
+        return self
+
     def __next__(self) -> dict[str, Any]:
         return self.next()
 
     def next(self) -> dict[str, Any]:
-        try:
-            item = self._data[self._current]
-            self._current += 1
+        item = self._next_item()
+        if item is not None:
             return item
-        except IndexError:
-            pass
+
+        if self._executor is not None:
+            if self._next_prefetched_page():
+                return self.next()
+            raise StopIteration
 
         if self._next_url and self._get_next is True:
             self._query(self._next_url, **self._kwargs)
@@ -1269,6 +2335,124 @@ class GitlabList:
         raise StopIteration
 
 
+class AsyncGitlabList(_BaseGitlabList):
+    """Asynchronous generator representing a list of remote objects.
+
+    Use :meth:`create` to fetch the first page, then iterate with ``async for``.
+    Following pages are requested from the API when needed. As with
+    :class:`GitlabList`, ``streamed`` decodes the items while they are received.
+    """
+
+    def __init__(self, gl: AsyncGitlab, get_next: bool = True, **kwargs: Any) -> None:
+        super().__init__(gl, get_next, kwargs)
+        self._chunks: AsyncIterator[bytes] | None = None
+        self._parser = utils._JSONArrayParser()
+
+    @classmethod
+    async def create(
+        cls,
+        gl: AsyncGitlab,
+        url: str,
+        query_data: dict[str, Any],
+        get_next: bool = True,
+        **kwargs: Any,
+    ) -> AsyncGitlabList:
+        """Create the list and fetch its first page."""
+        gl_list = cls(gl, get_next=get_next, **kwargs)
+        await gl_list._query(url, query_data, **gl_list._kwargs)
+
+        # Remove query_parameters from kwargs, which are saved via the `next` URL
+        gl_list._kwargs.pop("query_parameters", None)
+        return gl_list
+
+    async def _query(
+        self, url: str, query_data: dict[str, Any] | None = None, **kwargs: Any
+    ) -> None:
+        if TYPE_CHECKING:
+            assert isinstance(self._gl, AsyncGitlab)
+        query_data = query_data or {}
+        result = await self._gl.http_request(
+            "get", url, query_data=query_data, **kwargs
+        )
+        self._process_response(result)
+        if self._kwargs.get("streamed"):
+            self._chunks = result.aiter_bytes(_STREAM_CHUNK_SIZE)
+            self._parser = utils._JSONArrayParser()
+
+    async def _read_chunk(self) -> None:
+        """Decode the items of the next chunk of a streamed page."""
+        if TYPE_CHECKING:
+            assert self._chunks is not None
+        chunk = await anext(self._chunks, None)
+        try:
+            if chunk is None:
+                self._chunks = None
+                self._data = iter(self._parser.feed(b"", final=True))
+            else:
+                self._data = iter(self._parser.feed(chunk))
+        except ValueError as e:
+            raise gitlab.exceptions.GitlabParsingError(
+                error_message="Failed to parse the server message"
+            ) from e
+
+    def __aiter__(self) -> AsyncGitlabList:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        return await self.anext()
+
+    async def anext(self) -> dict[str, Any]:
+        while True:
+            item = self._next_item()
+            if item is not None:
+                return item
+
+            if self._chunks is not None:
+                await self._read_chunk()
+                continue
+
+            if not (self._next_url and self._get_next is True):
+                raise StopAsyncIteration
+            await self._query(self._next_url, **self._kwargs)
+
+
+class _DocumentCache:
+    """A bounded LRU cache of parsed GraphQL documents, keyed by query string."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._documents: collections.OrderedDict[str, Any] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get(self, query: str) -> Any:
+        with self._lock:
+            document = self._documents.get(query)
+            if document is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._documents.move_to_end(query)
+            return document
+
+    def put(self, query: str, document: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._documents[query] = document
+            self._documents.move_to_end(query)
+            while len(self._documents) > self.maxsize:
+                self._documents.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+
+
 class _BaseGraphQL:
     def __init__(
         self,
@@ -1282,6 +2466,9 @@ class _BaseGraphQL:
         max_retries: int = 10,
         obey_rate_limit: bool = True,
         retry_transient_errors: bool = False,
+        retry_policy: gitlab.retry.RetryPolicy | None = None,
+        document_cache_size: int = 128,
+        schema: str | graphql.GraphQLSchema | None = None,
     ) -> None:
         if not _GQL_INSTALLED:
             raise ImportError(
@@ -1298,8 +2485,57 @@ class _BaseGraphQL:
         self._max_retries = max_retries
         self._obey_rate_limit = obey_rate_limit
         self._retry_transient_errors = retry_transient_errors
+        self._retry_policy = retry_policy or gitlab.retry.RetryPolicy()
         self._client_opts = self._get_client_opts()
         self._fetch_schema_from_transport = fetch_schema_from_transport
+        #: Parsed documents of the queries executed, see :meth:`compile`
+        self.document_cache = _DocumentCache(document_cache_size)
+        self._schema = (
+            graphql.build_schema(schema) if isinstance(schema, str) else schema
+        )
+
+    def compile(self, request: str) -> Any:
+        """Parse a GraphQL document, and validate it against the schema.
+
+        The parsed documents are cached by query string, so that executing the
+        same query again does not parse and validate it again. The document
+        returned can also be kept and passed to ``execute`` instead of the
+        query string.
+
+        Args:
+            request: The GraphQL query string
+
+        Returns:
+            The parsed document.
+
+        Raises:
+            GraphQLError: If the query has a syntax error or, when the client
+                has a schema, does not match it
+        """
+        cached = self.document_cache.get(request)
+        if cached is not None:
+            return cached
+
+        document: Any = gql.gql(request)
+        if self._schema is not None:
+            # gql>=4 wraps the parsed document in a GraphQLRequest
+            node: graphql.DocumentNode = getattr(document, "document", document)
+            errors = graphql.validate(self._schema, node)
+            if errors:
+                raise errors[0]
+        self.document_cache.put(request, document)
+        return document
+
+    def _prepare_document(self, request: Any) -> Any:
+        """Return the document to execute for a query string or a compiled
+        document."""
+        document = self.compile(request) if isinstance(request, str) else request
+        # gql sets the variables of deprecated calls on the request itself, so
+        # each call gets its own request sharing the cached document
+        request_class = getattr(gql, "GraphQLRequest", None)
+        if request_class is not None and isinstance(document, request_class):
+            return request_class(document)
+        return document
 
     def _get_client_opts(self) -> dict[str, Any]:
         headers = {"User-Agent": self._user_agent}
@@ -1328,6 +2564,9 @@ class GraphQL(_BaseGraphQL):
         max_retries: int = 10,
         obey_rate_limit: bool = True,
         retry_transient_errors: bool = False,
+        retry_policy: gitlab.retry.RetryPolicy | None = None,
+        document_cache_size: int = 128,
+        schema: str | graphql.GraphQLSchema | None = None,
     ) -> None:
         super().__init__(
             url=url,
@@ -1339,6 +2578,9 @@ class GraphQL(_BaseGraphQL):
             max_retries=max_retries,
             obey_rate_limit=obey_rate_limit,
             retry_transient_errors=retry_transient_errors,
+            retry_policy=retry_policy,
+            document_cache_size=document_cache_size,
+            schema=schema,
         )
 
         self._http_client = client or httpx.Client(**self._client_opts)
@@ -1347,7 +2589,6 @@ class GraphQL(_BaseGraphQL):
             transport=self._transport,
             fetch_schema_from_transport=fetch_schema_from_transport,
         )
-        self._gql = gql.gql
 
     def __enter__(self) -> GraphQL:
         return self
@@ -1355,18 +2596,26 @@ class GraphQL(_BaseGraphQL):
     def __exit__(self, *args: Any) -> None:
         self._http_client.close()
 
-    def execute(self, request: str, *args: Any, **kwargs: Any) -> Any:
-        parsed_document = self._gql(request)
+    def execute(self, request: str | Any, *args: Any, **kwargs: Any) -> Any:
+        parsed_document = self._prepare_document(request)
         retry = utils.Retry(
             max_retries=self._max_retries,
             obey_rate_limit=self._obey_rate_limit,
             retry_transient_errors=self._retry_transient_errors,
+            policy=self._retry_policy,
         )
 
         while True:
+            retry.check()
             try:
                 result = self._client.execute(parsed_document, *args, **kwargs)
+            except _TRANSIENT_EXCEPTIONS:
+                retry.record_error()
+                if retry.handle_retry():
+                    continue
+                raise
             except gql.transport.exceptions.TransportServerError as e:
+                retry.record_status(e.code)
                 if retry.handle_retry_on_status(
                     status_code=e.code, headers=self._transport.response_headers
                 ):
@@ -1381,6 +2630,7 @@ class GraphQL(_BaseGraphQL):
                     response_code=e.code, error_message=str(e)
                 )
 
+            retry.record_status(200)
             return result
 
 
@@ -1398,6 +2648,9 @@ class AsyncGraphQL(_BaseGraphQL):
         max_retries: int = 10,
         obey_rate_limit: bool = True,
         retry_transient_errors: bool = False,
+        retry_policy: gitlab.retry.RetryPolicy | None = None,
+        document_cache_size: int = 128,
+        schema: str | graphql.GraphQLSchema | None = None,
     ) -> None:
         super().__init__(
             url=url,
@@ -1409,6 +2662,9 @@ class AsyncGraphQL(_BaseGraphQL):
             max_retries=max_retries,
             obey_rate_limit=obey_rate_limit,
             retry_transient_errors=retry_transient_errors,
+            retry_policy=retry_policy,
+            document_cache_size=document_cache_size,
+            schema=schema,
         )
 
         self._http_client = client or httpx.AsyncClient(**self._client_opts)
@@ -1417,7 +2673,6 @@ class AsyncGraphQL(_BaseGraphQL):
             transport=self._transport,
             fetch_schema_from_transport=fetch_schema_from_transport,
         )
-        self._gql = gql.gql
 
     async def __aenter__(self) -> AsyncGraphQL:
         return self
@@ -1425,21 +2680,29 @@ class AsyncGraphQL(_BaseGraphQL):
     async def __aexit__(self, *args: Any) -> None:
         await self._http_client.aclose()
 
-    async def execute(self, request: str, *args: Any, **kwargs: Any) -> Any:
-        parsed_document = self._gql(request)
+    async def execute(self, request: str | Any, *args: Any, **kwargs: Any) -> Any:
+        parsed_document = self._prepare_document(request)
         retry = utils.Retry(
             max_retries=self._max_retries,
             obey_rate_limit=self._obey_rate_limit,
             retry_transient_errors=self._retry_transient_errors,
+            policy=self._retry_policy,
         )
 
         while True:
+            retry.check()
             try:
                 result = await self._client.execute_async(
                     parsed_document, *args, **kwargs
                 )
+            except _TRANSIENT_EXCEPTIONS:
+                retry.record_error()
+                if await retry.async_handle_retry():
+                    continue
+                raise
             except gql.transport.exceptions.TransportServerError as e:
-                if retry.handle_retry_on_status(
+                retry.record_status(e.code)
+                if await retry.async_handle_retry_on_status(
                     status_code=e.code, headers=self._transport.response_headers
                 ):
                     continue
@@ -1453,4 +2716,5 @@ class AsyncGraphQL(_BaseGraphQL):
                     response_code=e.code, error_message=str(e)
                 )
 
+            retry.record_status(200)
             return result
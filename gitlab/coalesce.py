@@ -0,0 +1,139 @@
+"""
+Request coalescing used by :class:`gitlab.Gitlab` to send identical ``GET``
+requests made at the same time only once ("single-flight").
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+__all__ = ["RequestCoalescer"]
+
+T = TypeVar("T")
+
+
+class _Call:
+    """A request in flight, and its outcome once completed."""
+
+    def __init__(self, event: Any) -> None:
+        self.event = event
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class RequestCoalescer:
+    """Share the result of identical ``GET`` requests made at the same time.
+
+    The first request sent for a key is in flight until it completes. Identical
+    requests made meanwhile wait for it and get its result, or its exception,
+    instead of sending their own request. A coalescer can be shared by several
+    clients, e.g. the thread-local clients of a
+    :class:`~gitlab.parallel.GitlabPool`.
+    """
+
+    def __init__(self) -> None:
+        #: Requests sent to the server
+        self.calls = 0
+        #: Requests served by the result of an identical request in flight
+        self.saved = 0
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._async_calls: dict[str, _Call] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        # The requests in flight belong to the threads of this process
+        state["_calls"] = {}
+        state["_async_calls"] = {}
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def do(self, key: str, function: Callable[[], T]) -> T:
+        """Call ``function`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identifies identical requests.
+            function: Sends the request and returns its result.
+
+        Returns:
+            The result of the call in flight for ``key``.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call(threading.Event())
+                self.calls += 1
+            else:
+                self.saved += 1
+
+        if not leader:
+            call.event.wait()
+            shared: T = self._outcome(call)
+            return shared
+
+        try:
+            result = function()
+            call.result = self._snapshot(result)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return result
+
+    async def async_do(self, key: str, function: Callable[[], Awaitable[T]]) -> T:
+        """Await ``function`` unless a call for ``key`` is already in flight.
+
+        See :meth:`do`.
+        """
+        import anyio
+
+        with self._lock:
+            call = self._async_calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._async_calls[key] = _Call(anyio.Event())
+                self.calls += 1
+            else:
+                self.saved += 1
+
+        if not leader:
+            await call.event.wait()
+            shared: T = self._outcome(call)
+            return shared
+
+        try:
+            result = await function()
+            call.result = self._snapshot(result)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._async_calls[key]
+            call.event.set()
+        return result
+
+    @staticmethod
+    def _snapshot(result: Any) -> Any:
+        """Return a copy of a result that no caller can modify."""
+        if isinstance(result, (dict, list)):
+            # The callers may modify the nested objects of a parsed document
+            return copy.deepcopy(result)
+        return copy.copy(result)
+
+    @classmethod
+    def _outcome(cls, call: _Call) -> Any:
+        if call.error is not None:
+            raise call.error
+        return cls._snapshot(call.result)
@@ -108,6 +108,13 @@ class GitlabConfigParser:
         self.url: str | None = None
         self.user_agent: str = USER_AGENT
         self.keep_base_url: bool = False
+        self.json_codec: str | None = None
+        self.backend: str | None = None
+        self.pool_connections: int | None = None
+        self.pool_maxsize: int | None = None
+        self.pool_block: bool | None = None
+        self.pool_idle_timeout: float | None = None
+        self.path_cache: str | None = None
 
         self._files = _get_config_files(config_files)
         if self._files:
@@ -257,6 +264,71 @@ class GitlabConfigParser:
         except _CONFIG_PARSER_ERRORS:
             pass
 
+        try:
+            self.json_codec = _config.get("global", "json_codec")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+        try:
+            self.json_codec = _config.get(self.gitlab_id, "json_codec")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+
+        try:
+            self.backend = _config.get("global", "backend")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+        try:
+            self.backend = _config.get(self.gitlab_id, "backend")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+
+        try:
+            self.pool_connections = _config.getint("global", "pool_connections")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+        try:
+            self.pool_connections = _config.getint(self.gitlab_id, "pool_connections")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+
+        try:
+            self.pool_maxsize = _config.getint("global", "pool_maxsize")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+        try:
+            self.pool_maxsize = _config.getint(self.gitlab_id, "pool_maxsize")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+
+        try:
+            self.pool_block = _config.getboolean("global", "pool_block")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+        try:
+            self.pool_block = _config.getboolean(self.gitlab_id, "pool_block")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+
+        try:
+            self.pool_idle_timeout = _config.getfloat("global", "pool_idle_timeout")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+        try:
+            self.pool_idle_timeout = _config.getfloat(
+                self.gitlab_id, "pool_idle_timeout"
+            )
+        except _CONFIG_PARSER_ERRORS:
+            pass
+
+        try:
+            self.path_cache = _config.get("global", "path_cache")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+        try:
+            self.path_cache = _config.get(self.gitlab_id, "path_cache")
+        except _CONFIG_PARSER_ERRORS:
+            pass
+
     def _get_values_from_helper(self) -> None:
         """Update attributes that may get values from an external helper program"""
         for attr in HELPER_ATTRIBUTES:
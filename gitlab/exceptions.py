@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import functools
+import inspect
+from collections.abc import Awaitable
 from typing import Any, Callable, cast, TYPE_CHECKING, TypeVar
 
+from gitlab import instrumentation
+
 
 class GitlabError(Exception):
     def __init__(
@@ -54,6 +58,10 @@ class GitlabConnectionError(GitlabError):
     pass
 
 
+class GitlabCircuitOpenError(GitlabConnectionError):
+    pass
+
+
 class GitlabOperationError(GitlabError):
     pass
 
@@ -339,13 +347,38 @@ def on_http_error(error: type[Exception]) -> Callable[[__F], __F]:
         The exception type to raise -- must inherit from GitlabError
     """
 
+    async def await_and_translate(
+        awaitable: Awaitable[Any], operation: Any = None
+    ) -> Any:
+        token = instrumentation.set_operation(operation)
+        try:
+            return await awaitable
+        except GitlabHttpError as e:
+            raise error(e.error_message, e.response_code, e.response_body) from e
+        finally:
+            instrumentation.reset_operation(token)
+
     def wrap(f: __F) -> __F:
         @functools.wraps(f)
         def wrapped_f(*args: Any, **kwargs: Any) -> Any:
+            # Tell the hooks which method sends the requests
+            operation = (
+                instrumentation.describe_operation(args[0], f.__name__)
+                if args
+                else None
+            )
+            token = instrumentation.set_operation(operation)
             try:
-                return f(*args, **kwargs)
+                result = f(*args, **kwargs)
             except GitlabHttpError as e:
                 raise error(e.error_message, e.response_code, e.response_body) from e
+            finally:
+                instrumentation.reset_operation(token)
+            # Methods of asynchronous clients return awaitables, the
+            # exception is only raised once they are awaited.
+            if inspect.isawaitable(result):
+                return await_and_translate(result, operation)
+            return result
 
         return cast(__F, wrapped_f)
 
@@ -366,6 +399,7 @@ __all__ = [
     "GitlabCancelError",
     "GitlabCherryPickError",
     "GitlabCiLintError",
+    "GitlabCircuitOpenError",
     "GitlabConnectionError",
     "GitlabCreateError",
     "GitlabDeactivateError",
@@ -0,0 +1,164 @@
+"""
+Identity map used by :class:`gitlab.Gitlab` to share the objects retrieved
+several times, and to serve recent ones without requesting them again.
+"""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import threading
+import time
+from typing import Any, TYPE_CHECKING, TypeVar
+
+from gitlab import utils
+
+if TYPE_CHECKING:
+    from gitlab.base import RESTManager, RESTObject
+
+__all__ = ["IdentityMap"]
+
+TObj = TypeVar("TObj", bound="RESTObject")
+
+
+def _key(path: str, id: Any) -> tuple[str, str] | None:
+    """Return the key of a resource, with its ID encoded as in its URL."""
+    if not isinstance(id, (int, str)) or isinstance(id, bool):
+        return None
+    return path, str(utils.EncodedId(id))
+
+
+@dataclasses.dataclass
+class _Entry:
+    object: Any
+    #: Whether the object was retrieved with ``get()`` instead of listed
+    complete: bool
+    #: When the complete data of the object was retrieved
+    fetched_at: float
+
+
+class IdentityMap:
+    """Share a single object per resource, keyed by manager path and ID.
+
+    Objects retrieved with ``get()`` are returned by the next ``get()`` of the
+    same resource without sending a request while they are fresh, i.e. for
+    ``ttl`` seconds. Listed objects hold partial data: they are merged into the
+    object of the resource, but do not make it fresh. Updating, deleting or
+    refreshing an object removes it from the map.
+
+    Args:
+        ttl: Number of seconds during which a retrieved object is returned
+            without requesting it again.
+        maxsize: Maximum number of objects kept, the least recently used are
+            removed first.
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 10_000) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        #: ``get()`` calls served from the map
+        self.hits = 0
+        #: ``get()`` calls sending a request
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[tuple[str, str], _Entry] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def lookup(self, path: str, id: Any) -> Any:
+        """Return the fresh object retrieved for a resource, if any.
+
+        Args:
+            path: The path of the manager of the resource
+            id: The ID of the resource
+        """
+        key = _key(path, id)
+        with self._lock:
+            entry = None if key is None else self._entries.get(key)
+            if (
+                key is None
+                or entry is None
+                or not entry.complete
+                or time.monotonic() - entry.fetched_at >= self.ttl
+            ):
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry.object
+
+    def add(
+        self,
+        manager: RESTManager[Any],
+        obj_cls: type[TObj],
+        data: dict[str, Any],
+        complete: bool,
+    ) -> TObj:
+        """Return the object of a resource, updated with data received from the
+        server.
+
+        Args:
+            manager: The manager of the resource
+            obj_cls: The class of the object
+            data: The attributes received from the server
+            complete: Whether the data was retrieved with ``get()``, or is only
+                a partial representation from a list
+        """
+        id_attr = obj_cls._id_attr
+        key = None if id_attr is None else _key(manager.path, data.get(id_attr))
+        if key is None:
+            return obj_cls(manager, data, created_from_list=not complete)
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not isinstance(entry.object, obj_cls):
+                obj = obj_cls(manager, data, created_from_list=not complete)
+                self._entries[key] = _Entry(obj, complete, now if complete else 0.0)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                return obj
+
+            # Attributes only found in a list or in get() data are both kept,
+            # the changes made locally are kept as well
+            obj = entry.object
+            object.__setattr__(obj, "_attrs", {**obj._attrs, **data})
+            if complete:
+                entry.complete = True
+                entry.fetched_at = now
+                object.__setattr__(obj, "_created_from_list", False)
+                object.__setattr__(obj, "_lazy", False)
+            self._entries.move_to_end(key)
+            result: TObj = obj
+            return result
+
+    def invalidate(self, path: str, id: Any) -> None:
+        """Remove the object of a resource.
+
+        Args:
+            path: The path of the manager of the resource
+            id: The ID of the resource
+        """
+        key = _key(path, id)
+        if key is None:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all the objects."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,445 @@
+"""
+Instrumentation of the requests sent by :class:`gitlab.Gitlab`: event hooks,
+the metrics returned by :meth:`gitlab.Gitlab.stats`, and their export to
+Prometheus and OpenTelemetry.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import dataclasses
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+__all__ = ["Hooks", "MetricsCollector", "OpenTelemetryHooks", "RequestEvent"]
+
+log = logging.getLogger(__name__)
+
+#: Upper bounds, in seconds, of the buckets of the latency histograms
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Path segments holding an ID: numbers and URL-encoded paths
+_ID_SEGMENT = re.compile(r"/(?:\d+|[^/]*%2F[^/]*)(?=/|$)", re.IGNORECASE)
+# The first path segment after the path of a manager, for its methods taking
+# the ID of an object, which may also be a SHA, a branch name or a username
+_OBJECT_SEGMENT = re.compile(r"^/[^/]+")
+_ID_METHODS = frozenset({"delete", "get", "head", "set", "update"})
+# The template of the endpoints counted beyond MetricsCollector.max_endpoints
+_OTHER_ENDPOINTS = "{other}"
+
+
+@dataclasses.dataclass
+class RequestEvent:
+    """Describes a request sent to GitLab, passed to the hooks."""
+
+    #: The HTTP method, e.g. ``"GET"``
+    method: str
+    url: str
+    #: The API path with the IDs replaced, e.g. ``"/projects/{id}/issues"``
+    url_template: str
+    #: The class name of the manager sending the request, if any
+    manager: str | None = None
+    #: The name of the manager or object method sending the request, if any
+    operation: str | None = None
+    #: The number of retries before this attempt
+    retries: int = 0
+    status_code: int | None = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    #: Number of seconds taken by the attempt
+    elapsed: float = 0.0
+    #: Number of seconds waited before the next attempt, for ``on_retry`` and
+    #: ``on_rate_limited``
+    wait: float = 0.0
+    #: The exception raised instead of receiving a response
+    error: Exception | None = None
+
+
+HookCallback = Callable[[RequestEvent], Any]
+
+
+class Hooks:
+    """Callbacks called with a :class:`RequestEvent` while requests are sent.
+
+    - ``on_request``: before each attempt of a request is sent.
+    - ``on_response``: once the response of an attempt is received, or the
+      attempt failed with a connection error or a timeout.
+    - ``on_retry``: before waiting to retry a request.
+    - ``on_rate_limited``: before waiting because of the rate limit, either after
+      a ``429 Too Many Requests`` response or to follow the client rate limiter.
+
+    Exceptions raised by the callbacks are logged and do not affect the
+    requests.
+    """
+
+    EVENTS = ("on_request", "on_response", "on_retry", "on_rate_limited")
+
+    def __init__(self) -> None:
+        self.on_request: list[HookCallback] = []
+        self.on_response: list[HookCallback] = []
+        self.on_retry: list[HookCallback] = []
+        self.on_rate_limited: list[HookCallback] = []
+
+    def subscribe(self, subscriber: Any) -> None:
+        """Register the ``on_*`` methods of ``subscriber`` for their events."""
+        for name in self.EVENTS:
+            callback = getattr(subscriber, name, None)
+            if callback is not None:
+                getattr(self, name).append(callback)
+
+    def unsubscribe(self, subscriber: Any) -> None:
+        """Remove the ``on_*`` methods of ``subscriber`` registered with
+        :meth:`subscribe`."""
+        for name in self.EVENTS:
+            callback = getattr(subscriber, name, None)
+            callbacks: list[HookCallback] = getattr(self, name)
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def emit(self, name: str, event: RequestEvent) -> None:
+        """Call the callbacks registered for an event."""
+        for callback in getattr(self, name):
+            try:
+                callback(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.exception("The %s hook %r failed", name, callback)
+
+
+@dataclasses.dataclass
+class _Operation:
+    manager: str
+    method: str
+    #: The path of the manager or object, and its template
+    path: str | None
+    template: str | None
+    #: Whether the path segment following ``path`` is the ID of an object
+    object_id: bool = False
+
+
+_operation: contextvars.ContextVar[_Operation | None] = contextvars.ContextVar(
+    "gitlab_operation", default=None
+)
+
+
+def describe_operation(target: Any, method: str) -> _Operation:
+    """Describe a method of a manager or object sending requests."""
+    manager = getattr(target, "manager", target)
+    path = getattr(manager, "path", None)
+    template = getattr(type(manager), "_path", None)
+    if manager is not target and isinstance(path, str):
+        encoded_id = getattr(target, "encoded_id", None)
+        if encoded_id is not None:
+            path = f"{path}/{encoded_id}"
+            template = f"{template}/{{id}}"
+    return _Operation(
+        manager=type(manager).__name__,
+        method=method,
+        path=path if isinstance(path, str) else None,
+        template=template if isinstance(template, str) else None,
+        object_id=manager is target and method in _ID_METHODS,
+    )
+
+
+def set_operation(operation: _Operation | None) -> contextvars.Token[Any]:
+    """Record the operation sending the next requests of the current context."""
+    return _operation.set(operation)
+
+
+def reset_operation(token: contextvars.Token[Any]) -> None:
+    _operation.reset(token)
+
+
+def create_event(method: str, url: str, api_url: str) -> RequestEvent:
+    """Describe a request, with the manager method sending it, if any."""
+    path = url[len(api_url) :] if url.startswith(api_url) else url
+    operation = _operation.get()
+    if operation is None:
+        return RequestEvent(
+            method=method.upper(), url=url, url_template=_ID_SEGMENT.sub("/{id}", path)
+        )
+
+    if (
+        operation.path is not None
+        and operation.template is not None
+        and path.startswith(operation.path)
+    ):
+        rest = path[len(operation.path) :]
+        if operation.object_id:
+            rest = _OBJECT_SEGMENT.sub("/{id}", rest)
+        template = operation.template + _ID_SEGMENT.sub("/{id}", rest)
+    else:
+        template = _ID_SEGMENT.sub("/{id}", path)
+    # The templates of the managers name their IDs, e.g. {project_id}
+    template = re.sub(r"\{\w+\}", "{id}", template)
+    return RequestEvent(
+        method=method.upper(),
+        url=url,
+        url_template=template,
+        manager=operation.manager,
+        operation=operation.method,
+    )
+
+
+def response_sizes(response: Any, streamed: bool) -> tuple[int, int]:
+    """Return the sizes of the request and response bodies of a response."""
+    try:
+        request = response.request
+    except (AttributeError, RuntimeError):
+        # httpx raises a RuntimeError for responses built without a request
+        request = None
+    sent = getattr(request, "headers", {}).get("Content-Length") or 0
+    if streamed:
+        received = response.headers.get("Content-Length") or 0
+    else:
+        received = len(response.content)
+    return int(sent), int(received)
+
+
+@dataclasses.dataclass
+class _Endpoint:
+    count: int = 0
+    errors: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    buckets: list[int] = dataclasses.field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    statuses: dict[str, int] = dataclasses.field(default_factory=dict)
+
+
+class MetricsCollector:
+    """Count the requests of a client and their latency, per endpoint.
+
+    Each client has one, subscribed to its hooks. Endpoints are identified by
+    the method and URL template of the requests, e.g. ``GET /projects/{id}``.
+
+    Args:
+        max_endpoints: Maximum number of endpoints counted separately. The
+            requests of the other endpoints are counted together, under the
+            ``{other}`` template.
+    """
+
+    def __init__(self, max_endpoints: int = 500) -> None:
+        self.max_endpoints = max_endpoints
+        self._lock = threading.Lock()
+        self._endpoints: dict[tuple[str, str], _Endpoint] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _endpoint(self, event: RequestEvent) -> _Endpoint:
+        key = (event.method, event.url_template)
+        endpoint = self._endpoints.get(key)
+        if endpoint is None and len(self._endpoints) >= self.max_endpoints:
+            key = (event.method, _OTHER_ENDPOINTS)
+            endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = _Endpoint()
+        return endpoint
+
+    def on_response(self, event: RequestEvent) -> None:
+        status = "error" if event.status_code is None else str(event.status_code)
+        with self._lock:
+            endpoint = self._endpoint(event)
+            endpoint.count += 1
+            if event.status_code is None or event.status_code >= 400:
+                endpoint.errors += 1
+            endpoint.statuses[status] = endpoint.statuses.get(status, 0) + 1
+            endpoint.latency_sum += event.elapsed
+            endpoint.latency_max = max(endpoint.latency_max, event.elapsed)
+            endpoint.buckets[bisect.bisect_left(LATENCY_BUCKETS, event.elapsed)] += 1
+            self.bytes_sent += event.bytes_sent
+            self.bytes_received += event.bytes_received
+
+    def on_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._endpoint(event).retries += 1
+
+    def on_rate_limited(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._endpoint(event).rate_limited += 1
+
+    def reset(self) -> None:
+        """Forget the requests counted so far."""
+        with self._lock:
+            self._endpoints.clear()
+            self.bytes_sent = 0
+            self.bytes_received = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the metrics collected so far, see :meth:`gitlab.Gitlab.stats`."""
+        with self._lock:
+            endpoints = {
+                f"{method} {template}": {
+                    "count": endpoint.count,
+                    "errors": endpoint.errors,
+                    "retries": endpoint.retries,
+                    "rate_limited": endpoint.rate_limited,
+                    "statuses": dict(endpoint.statuses),
+                    "latency": {
+                        "sum": endpoint.latency_sum,
+                        "max": endpoint.latency_max,
+                        "mean": (
+                            endpoint.latency_sum / endpoint.count
+                            if endpoint.count
+                            else 0.0
+                        ),
+                        "buckets": dict(
+                            zip(
+                                [*map(str, LATENCY_BUCKETS), "+Inf"],
+                                _cumulative(endpoint.buckets),
+                            )
+                        ),
+                    },
+                }
+                for (method, template), endpoint in self._endpoints.items()
+            }
+            totals = self._endpoints.values()
+            return {
+                "requests": sum(endpoint.count for endpoint in totals),
+                "errors": sum(endpoint.errors for endpoint in totals),
+                "retries": sum(endpoint.retries for endpoint in totals),
+                "rate_limited": sum(endpoint.rate_limited for endpoint in totals),
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "endpoints": endpoints,
+            }
+
+    def to_prometheus(self, prefix: str = "python_gitlab") -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines = [
+                f"# HELP {prefix}_requests_total Responses received from GitLab.",
+                f"# TYPE {prefix}_requests_total counter",
+            ]
+            for (method, template), endpoint in endpoints:
+                for status, count in sorted(endpoint.statuses.items()):
+                    labels = _labels(method=method, endpoint=template, status=status)
+                    lines.append(f"{prefix}_requests_total{{{labels}}} {count}")
+
+            name = f"{prefix}_request_duration_seconds"
+            lines += [
+                f"# HELP {name} Time taken by the requests.",
+                f"# TYPE {name} histogram",
+            ]
+            for (method, template), endpoint in endpoints:
+                labels = _labels(method=method, endpoint=template)
+                bounds = [*map(str, LATENCY_BUCKETS), "+Inf"]
+                for bound, count in zip(bounds, _cumulative(endpoint.buckets)):
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {endpoint.latency_sum}")
+                lines.append(f"{name}_count{{{labels}}} {endpoint.count}")
+
+            for metric, help_text in (
+                ("retries", "Requests retried after a transient error."),
+                ("rate_limited", "Waits caused by the rate limit."),
+            ):
+                lines += [
+                    f"# HELP {prefix}_{metric}_total {help_text}",
+                    f"# TYPE {prefix}_{metric}_total counter",
+                ]
+                for (method, template), endpoint in endpoints:
+                    labels = _labels(method=method, endpoint=template)
+                    value = getattr(endpoint, metric)
+                    lines.append(f"{prefix}_{metric}_total{{{labels}}} {value}")
+
+            for direction, value in (
+                ("sent", self.bytes_sent),
+                ("received", self.bytes_received),
+            ):
+                lines += [
+                    f"# HELP {prefix}_bytes_{direction}_total Bytes of the bodies "
+                    f"{direction}.",
+                    f"# TYPE {prefix}_bytes_{direction}_total counter",
+                    f"{prefix}_bytes_{direction}_total {value}",
+                ]
+        return "\n".join(lines) + "\n"
+
+
+def _cumulative(buckets: list[int]) -> list[int]:
+    counts = []
+    total = 0
+    for count in buckets:
+        total += count
+        counts.append(total)
+    return counts
+
+
+def _labels(**labels: str) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+    return ",".join(f'{name}="{escape(value)}"' for name, value in labels.items())
+
+
+class OpenTelemetryHooks:
+    """Record each request attempt as an OpenTelemetry client span.
+
+    Subscribe it to the hooks of a client with
+    ``gl.event_hooks.subscribe(OpenTelemetryHooks())``.
+
+    Args:
+        tracer: The tracer creating the spans. Defaults to the tracer of the
+            ``opentelemetry`` global tracer provider.
+
+    Raises:
+        ImportError: If no tracer is given and opentelemetry is not installed
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        self._span_options: dict[str, Any] = {}
+        try:
+            from opentelemetry import trace
+
+            self._span_options["kind"] = trace.SpanKind.CLIENT
+        except ImportError:
+            if tracer is None:
+                raise
+        else:
+            if tracer is None:
+                tracer = trace.get_tracer("python-gitlab")
+        self.tracer = tracer
+
+    def on_response(self, event: RequestEvent) -> None:
+        end = time.time_ns()
+        attributes: dict[str, Any] = {
+            "http.request.method": event.method,
+            "url.full": event.url,
+            "url.template": event.url_template,
+            "http.request.body.size": event.bytes_sent,
+            "http.response.body.size": event.bytes_received,
+        }
+        if event.retries:
+            attributes["http.request.resend_count"] = event.retries
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.manager is not None:
+            attributes["gitlab.manager"] = event.manager
+        if event.operation is not None:
+            attributes["gitlab.operation"] = event.operation
+
+        span = self.tracer.start_span(
+            f"{event.method} {event.url_template}",
+            start_time=end - int(event.elapsed * 1e9),
+            attributes=attributes,
+            **self._span_options,
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+        span.end(end_time=end)
@@ -0,0 +1,137 @@
+"""
+JSON codecs used by :class:`gitlab.Gitlab` to encode request bodies and decode
+responses.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Protocol
+
+__all__ = ["JSONCodec", "MsgspecCodec", "OrjsonCodec", "StdlibCodec", "get_codec"]
+
+
+class JSONCodec(Protocol):
+    #: The name used to select the codec
+    name: str
+
+    def loads(self, data: bytes | str) -> Any: ...
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+
+class StdlibCodec:
+    """The codec of the :mod:`json` module of the standard library."""
+
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+_STDLIB = StdlibCodec()
+
+
+class OrjsonCodec:
+    """A codec using ``orjson``.
+
+    The standard library is used for the documents orjson does not support,
+    such as integers larger than 64 bits.
+
+    Raises:
+        ImportError: If orjson is not installed
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return _STDLIB.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+        except self._orjson.JSONEncodeError:
+            return _STDLIB.dumps(obj)
+
+
+class MsgspecCodec:
+    """A codec using ``msgspec``.
+
+    The standard library is used for the documents msgspec does not support.
+
+    Raises:
+        ImportError: If msgspec is not installed
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError:
+            return _STDLIB.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (self._msgspec.EncodeError, TypeError):
+            return _STDLIB.dumps(obj)
+
+
+_CODECS: dict[str, type[StdlibCodec | OrjsonCodec | MsgspecCodec]] = {
+    codec.name: codec for codec in (StdlibCodec, OrjsonCodec, MsgspecCodec)
+}
+
+
+def get_codec(codec: str | JSONCodec | None = None) -> JSONCodec:
+    """Return the codec selected by its name.
+
+    Args:
+        codec: ``"json"``, ``"orjson"`` or ``"msgspec"``, ``"auto"`` to use the
+            fastest installed codec, or a codec instance. Defaults to ``"json"``.
+
+    Returns:
+        The selected codec, or the standard library codec if the selected
+        codec is not installed.
+
+    Raises:
+        ValueError: If the codec name is unknown
+    """
+    if codec is None:
+        return StdlibCodec()
+    if not isinstance(codec, str):
+        return codec
+    if codec == "auto":
+        names = ["orjson", "msgspec"]
+    elif codec in _CODECS:
+        names = [codec]
+    else:
+        raise ValueError(
+            f"Unknown JSON codec {codec!r}, use one of "
+            f"{', '.join(['auto', *_CODECS])}"
+        )
+
+    for name in names:
+        try:
+            return _CODECS[name]()
+        except ImportError:
+            continue
+    return StdlibCodec()
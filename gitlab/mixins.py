@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import concurrent.futures
+import copy
+import datetime
 import enum
-from collections.abc import Iterator
+import threading
+import weakref
+from collections.abc import Awaitable, Iterable, Iterator, Sequence
 from types import ModuleType
-from typing import Any, Callable, Literal, overload, TYPE_CHECKING
+from typing import Any, Callable, cast, Literal, overload, TYPE_CHECKING
 
 import requests
 
@@ -91,15 +96,211 @@ class GetMixin(HeadMixin[base.TObjCls]):
         """
         if isinstance(id, str):
             id = utils.EncodedId(id)
-        path = f"{self.path}/{id}"
+        path_cache = (
+            self.gitlab.path_cache if self._full_path_attr is not None else None
+        )
+        numeric_id = None if path_cache is None else path_cache.get(self, id)
         if lazy is True:
             if TYPE_CHECKING:
                 assert self._obj_cls._id_attr is not None
-            return self._obj_cls(self, {self._obj_cls._id_attr: id}, lazy=lazy)
-        server_data = self.gitlab.http_get(path, **kwargs)
+            lazy_id = id if numeric_id is None else numeric_id
+            return self._obj_cls(self, {self._obj_cls._id_attr: lazy_id}, lazy=lazy)
+
+        if numeric_id is None:
+            return utils._chain_result(self._get(id, kwargs), self._remember_object)
+        if isinstance(self.gitlab, gitlab.AsyncGitlab):
+            return cast(
+                base.TObjCls, self._async_get_cached_path(id, numeric_id, kwargs)
+            )
+        try:
+            obj = self._get(numeric_id, kwargs)
+        except exc.GitlabHttpError as e:
+            if e.response_code != 404:
+                raise
+            obj = None
+        if self._cached_path_valid(id, obj):
+            return cast(base.TObjCls, obj)
+        return self._remember_object(self._get(id, kwargs))
+
+    def _get(self, id: str | int, kwargs: dict[str, Any]) -> base.TObjCls:
+        path = f"{self.path}/{id}"
+        # Options such as sudo or statistics change the data returned
+        identity_map = None if kwargs else self.gitlab.identity_map
+        if identity_map is None:
+            server_data = self.gitlab.http_get(path, **kwargs)
+            return utils._chain_result(
+                server_data, lambda data: self._obj_cls(self, data)
+            )
+
+        obj = identity_map.lookup(self.path, id)
+        if obj is not None:
+            if isinstance(self.gitlab, gitlab.AsyncGitlab):
+                return cast(base.TObjCls, _completed(obj))
+            return cast(base.TObjCls, obj)
+        server_data = self.gitlab.http_get(path)
+        return utils._chain_result(
+            server_data,
+            lambda data: identity_map.add(self, self._obj_cls, data, complete=True),
+        )
+
+    async def _async_get_cached_path(
+        self, id: str | int, numeric_id: int, kwargs: dict[str, Any]
+    ) -> base.TObjCls:
+        try:
+            obj = await cast(Awaitable[base.TObjCls], self._get(numeric_id, kwargs))
+        except exc.GitlabHttpError as e:
+            if e.response_code != 404:
+                raise
+            obj = None
+        if self._cached_path_valid(id, obj):
+            return cast(base.TObjCls, obj)
+        obj = await cast(Awaitable[base.TObjCls], self._get(id, kwargs))
+        return self._remember_object(obj)
+
+    def _cached_path_valid(self, id: str | int, obj: base.TObjCls | None) -> bool:
+        """Return whether an object requested with the numeric ID cached for
+        the path ``id`` still has this path, and forget the ID otherwise."""
+        path_cache = self.gitlab.path_cache
         if TYPE_CHECKING:
-            assert not isinstance(server_data, requests.Response)
-        return self._obj_cls(self, server_data, lazy=lazy)
+            assert path_cache is not None
+        if obj is not None and path_cache.confirm(self, id, obj._attrs):
+            return True
+        # Deleted, renamed or moved: the path is resolved by the server again
+        path_cache.invalidate(self, id)
+        return False
+
+    def _remember_object(self, obj: base.TObjCls) -> base.TObjCls:
+        self._remember_path(obj._attrs)
+        return obj
+
+    def get_many(
+        self,
+        ids: Iterable[str | int],
+        concurrency: int = 8,
+        lazy: bool = False,
+        **kwargs: Any,
+    ) -> list[base.TObjCls | Exception]:
+        """Retrieve several objects concurrently.
+
+        The requests share the client session, and are retried and rate limited
+        like the ones sent by :meth:`get`.
+
+        Args:
+            ids: IDs of the objects to retrieve
+            concurrency: Maximum number of requests sent at the same time
+            lazy: If True, don't request the server, but create lazy objects
+                like :meth:`get`. With the ``auto_hydrate`` option of the
+                client, the first access to a missing attribute of one of them
+                retrieves the data of the objects that were not hydrated yet,
+                up to 20 at a time.
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
+        Returns:
+            The generated RESTObjects, in the order of ``ids``. When an object
+            cannot be retrieved, the exception raised by :meth:`get` takes its
+            place instead of aborting the other requests.
+        """
+        ids = list(ids)
+        if lazy:
+            objects: list[base.TObjCls] = [self.get(id, lazy=True) for id in ids]
+            if self.gitlab.auto_hydrate:
+                batch = _LazyBatch(objects)
+                for obj in objects:
+                    object.__setattr__(obj, "_lazy_batch", batch)
+            return list(objects)
+        if isinstance(self.gitlab, gitlab.AsyncGitlab):
+            return cast(
+                list[base.TObjCls | Exception],
+                self._async_get_many(ids, concurrency, kwargs),
+            )
+
+        def get(id: str | int) -> base.TObjCls | Exception:
+            try:
+                return self.get(id, **kwargs)
+            except Exception as e:
+                return e
+
+        workers = max(1, min(concurrency, len(ids)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(get, ids))
+
+    def hydrate(
+        self, objects: Iterable[base.TObjCls], concurrency: int = 8
+    ) -> list[base.TObjCls | Exception]:
+        """Retrieve the data of lazy objects concurrently.
+
+        The objects are updated in place, like with :meth:`get_many`, the
+        requests share the client session and are sent at most ``concurrency``
+        at a time. The local changes of the objects are kept.
+
+        Args:
+            objects: Lazy objects created by this manager
+            concurrency: Maximum number of requests sent at the same time
+
+        Returns:
+            The objects, in the order of ``objects``. When an object cannot be
+            retrieved, it stays lazy and the exception raised by :meth:`get`
+            takes its place.
+        """
+        objects = list(objects)
+        ids = [cast(Any, obj.get_id()) for obj in objects]
+        results = self.get_many(ids, concurrency)
+
+        def update(
+            results: list[base.TObjCls | Exception],
+        ) -> list[base.TObjCls | Exception]:
+            hydrated: list[base.TObjCls | Exception] = []
+            for obj, result in zip(objects, results):
+                if isinstance(result, Exception):
+                    hydrated.append(result)
+                    continue
+                attrs = result._attrs
+                if self.gitlab.identity_map is not None:
+                    # The object of the map keeps its own attributes
+                    attrs = copy.deepcopy(attrs)
+                object.__setattr__(obj, "_attrs", attrs)
+                object.__setattr__(obj, "_lazy", False)
+                hydrated.append(obj)
+            return hydrated
+
+        return utils._chain_result(results, update)
+
+    def _hydrate_lazy(self, obj: base.TObjCls) -> None:
+        """Retrieve the data of a lazy object on the first access to a missing
+        attribute, along with the next lazy objects of its batch."""
+        lazy_batch: _LazyBatch | None = getattr(obj, "_lazy_batch", None)
+        if lazy_batch is None:
+            objects = [obj]
+        else:
+            objects = [cast(base.TObjCls, other) for other in lazy_batch.take(obj)]
+        results = self.hydrate(objects)
+        if lazy_batch is not None:
+            for other, result in zip(objects[1:], results[1:]):
+                if isinstance(result, Exception):
+                    lazy_batch.fail(other, result)
+        if isinstance(results[0], Exception):
+            raise results[0]
+
+    async def _async_get_many(
+        self, ids: list[str | int], concurrency: int, kwargs: dict[str, Any]
+    ) -> list[base.TObjCls | Exception]:
+        import anyio
+
+        results: dict[int, base.TObjCls | Exception] = {}
+        limiter = anyio.CapacityLimiter(concurrency)
+
+        async def get(index: int, id: str | int) -> None:
+            async with limiter:
+                try:
+                    obj = self.get(id, **kwargs)
+                    results[index] = await cast(Awaitable[base.TObjCls], obj)
+                except Exception as e:
+                    results[index] = e
+
+        async with anyio.create_task_group() as task_group:
+            for index, id in enumerate(ids):
+                task_group.start_soon(get, index, id)
+        return [results[index] for index in range(len(ids))]
 
 
 class GetWithoutIdMixin(HeadMixin[base.TObjCls]):
@@ -120,9 +321,7 @@ class GetWithoutIdMixin(HeadMixin[base.TObjCls]):
             GitlabGetError: If the server cannot perform the request
         """
         server_data = self.gitlab.http_get(self.path, **kwargs)
-        if TYPE_CHECKING:
-            assert not isinstance(server_data, requests.Response)
-        return self._obj_cls(self, server_data)
+        return utils._chain_result(server_data, lambda data: self._obj_cls(self, data))
 
 
 class RefreshMixin(_RestObjectBase):
@@ -152,15 +351,244 @@ class RefreshMixin(_RestObjectBase):
             if TYPE_CHECKING:
                 assert self.manager.path is not None
             path = self.manager.path
+        identity_map = self.manager.gitlab.identity_map
+        if identity_map is not None:
+            identity_map.invalidate(self.manager.path, self.encoded_id)
         server_data = self.manager.gitlab.http_get(path, **kwargs)
-        if TYPE_CHECKING:
-            assert not isinstance(server_data, requests.Response)
-        self._update_attrs(server_data)
+        return utils._chain_result(server_data, self._update_attrs)
+
+
+async def _completed(value: Any) -> Any:
+    """Return a value from an awaitable, for the methods of asynchronous
+    clients."""
+    return value
+
+
+# The lazy objects of a batch are hydrated together, up to this many at once
+_HYDRATE_BATCH_SIZE = 20
+
+
+class _LazyBatch:
+    """The lazy objects created by the same ``get_many(lazy=True)`` call.
+
+    The objects waiting to be hydrated are referenced weakly, in creation
+    order. An object whose data could not be retrieved along with another one
+    keeps its exception, raised on the next access to the object.
+    """
+
+    def __init__(self, objects: Iterable[base.RESTObject]) -> None:
+        self._lock = threading.Lock()
+        self._waiting: weakref.WeakValueDictionary[int, base.RESTObject] = (
+            weakref.WeakValueDictionary((id(obj), obj) for obj in objects)
+        )
+        self._errors: dict[int, Exception] = {}
+
+    def take(self, obj: base.RESTObject) -> list[base.RESTObject]:
+        """Return ``obj`` and the next lazy objects of the batch to hydrate.
+
+        Raises:
+            Exception: The exception raised while retrieving ``obj`` with a
+                previous batch. The next access retrieves it again.
+        """
+        with self._lock:
+            self._waiting.pop(id(obj), None)
+            error = self._errors.pop(id(obj), None)
+            if error is not None:
+                raise error
+            objects = [obj]
+            for key, other in list(self._waiting.items()):
+                if len(objects) >= _HYDRATE_BATCH_SIZE:
+                    break
+                del self._waiting[key]
+                if other._lazy:
+                    objects.append(other)
+            return objects
+
+    def fail(self, obj: base.RESTObject, error: Exception) -> None:
+        """Keep the exception raised while retrieving ``obj``."""
+        with self._lock:
+            self._errors[id(obj)] = error
+            # Forgotten with the object, so that its ID cannot be reused
+            weakref.finalize(obj, self._forget, id(obj))
+
+    def _forget(self, key: int) -> None:
+        with self._lock:
+            self._errors.pop(key, None)
+
+
+# A window of a sharded listing is split when it has more pages than this
+_SHARD_MAX_PAGES = 10
+_SHARD_MIN_WINDOW = datetime.timedelta(seconds=1)
+
+_Window = tuple[datetime.datetime, datetime.datetime]
+
+
+def _split_window(window: _Window, parts: int) -> list[_Window]:
+    start, end = window
+    step = (end - start) / parts
+    bounds = [start + step * index for index in range(parts)] + [end]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _as_datetime(value: datetime.datetime | str) -> datetime.datetime:
+    """Return a bound of a sharded listing as an aware datetime, naive values
+    and dates being in UTC."""
+    if isinstance(value, str):
+        # fromisoformat() only accepts the "Z" suffix since Python 3.11
+        if value.endswith(("Z", "z")):
+            value = f"{value[:-1]}+00:00"
+        value = datetime.datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value
 
 
 class ListMixin(HeadMixin[base.TObjCls]):
     _list_filters: tuple[str, ...] = ()
 
+    def _wrap_list_result(
+        self,
+        obj: (
+            gitlab.client.GitlabList
+            | gitlab.client.AsyncGitlabList
+            | list[dict[str, Any]]
+        ),
+    ) -> base.RESTObjectList[base.TObjCls] | list[base.TObjCls]:
+        if isinstance(obj, list):
+            return [self._create_listed_object(item) for item in obj]
+        return base.RESTObjectList(self, self._obj_cls, obj)
+
+    def _list_sharded(self, kwargs: dict[str, Any]) -> list[base.TObjCls]:
+        """List the objects of a period by listing time windows concurrently.
+
+        Windows whose listing has more than ``_SHARD_MAX_PAGES`` pages are split
+        in two instead of being listed. The filters of ``_shard_filters``
+        include their bounds, so the items of the windows are merged by id.
+        """
+        shard_by: str = kwargs.pop("shard_by")
+        shards: int = kwargs.pop("shards", 8)
+        since = kwargs.pop("since", None)
+        until = kwargs.pop("until", None)
+        for key in ("get_all", "all", "page"):
+            kwargs.pop(key, None)
+        filters = self._shard_filters.get(shard_by)
+        if filters is None:
+            supported = ", ".join(repr(name) for name in self._shard_filters)
+            raise ValueError(
+                f"Cannot shard {self.path} by {shard_by!r}, supported time "
+                f"attributes: {supported or 'none'}"
+            )
+        if since is None:
+            raise ValueError("A sharded listing requires the start of the period")
+        if until is None:
+            until = datetime.datetime.now(datetime.timezone.utc)
+
+        path, data = self._list_query(kwargs)
+        windows = _split_window((_as_datetime(since), _as_datetime(until)), shards)
+        after, before = filters
+
+        def query(window: _Window) -> dict[str, Any]:
+            return {**data, after: window[0].isoformat(), before: window[1].isoformat()}
+
+        if isinstance(self.gitlab, gitlab.AsyncGitlab):
+            return cast(
+                list[base.TObjCls],
+                self._async_list_sharded(path, query, windows, shards, shard_by),
+            )
+
+        def fetch(window: _Window) -> tuple[list[dict[str, Any]], list[_Window]]:
+            gl_list = self.gitlab.http_list(path, iterator=True, **query(window))
+            if TYPE_CHECKING:
+                assert isinstance(gl_list, gitlab.client.GitlabList)
+            if self._is_dense(gl_list, window):
+                return [], _split_window(window, 2)
+            return list(gl_list), []
+
+        items: list[dict[str, Any]] = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=shards) as executor:
+            pending = {executor.submit(fetch, window) for window in windows}
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    window_items, subwindows = future.result()
+                    items.extend(window_items)
+                    pending |= {executor.submit(fetch, sub) for sub in subwindows}
+        return self._merge_shards(items, shard_by, data.get("sort"))
+
+    async def _async_list_sharded(
+        self,
+        path: str,
+        query: Callable[[_Window], dict[str, Any]],
+        windows: list[_Window],
+        shards: int,
+        shard_by: str,
+    ) -> list[base.TObjCls]:
+        import anyio
+
+        items: list[dict[str, Any]] = []
+        errors: list[Exception] = []
+        limiter = anyio.CapacityLimiter(shards)
+
+        async with anyio.create_task_group() as task_group:
+
+            async def fetch(window: _Window) -> None:
+                subwindows: list[_Window] = []
+                async with limiter:
+                    if errors:
+                        return
+                    try:
+                        gl_list = await cast(
+                            Awaitable[gitlab.client.AsyncGitlabList],
+                            self.gitlab.http_list(path, iterator=True, **query(window)),
+                        )
+                        if self._is_dense(gl_list, window):
+                            subwindows = _split_window(window, 2)
+                        else:
+                            items.extend([item async for item in gl_list])
+                    except Exception as e:
+                        # Raised after the task group, not in an exception group.
+                        # The windows not started yet are skipped.
+                        errors.append(e)
+                for subwindow in subwindows:
+                    task_group.start_soon(fetch, subwindow)
+
+            for window in windows:
+                task_group.start_soon(fetch, window)
+
+        if errors:
+            raise errors[0]
+        return self._merge_shards(items, shard_by, query(windows[0]).get("sort"))
+
+    @staticmethod
+    def _is_dense(
+        gl_list: gitlab.client.GitlabList | gitlab.client.AsyncGitlabList,
+        window: _Window,
+    ) -> bool:
+        """Whether a window of a sharded listing has too many pages to be
+        listed sequentially."""
+        if window[1] - window[0] <= _SHARD_MIN_WINDOW:
+            return False
+        if gl_list.total_pages is None:
+            # The totals are not returned beyond 10,000 items
+            return gl_list.next_page is not None
+        return gl_list.total_pages > _SHARD_MAX_PAGES
+
+    def _merge_shards(
+        self, items: list[dict[str, Any]], shard_by: str, sort: str | None
+    ) -> list[base.TObjCls]:
+        id_attr = self._obj_cls._id_attr or "id"
+        unique: dict[Any, dict[str, Any]] = {}
+        for item in items:
+            unique.setdefault(item.get(id_attr, id(item)), item)
+        merged = sorted(
+            unique.values(),
+            key=lambda item: str(item.get(shard_by) or ""),
+            reverse=sort != "asc",
+        )
+        return [self._create_listed_object(item) for item in merged]
+
     @overload
     def list(
         self, *, iterator: Literal[False] = False, **kwargs: Any
@@ -188,6 +616,17 @@ class ListMixin(HeadMixin[base.TObjCls]):
             page: ID of the page to return (starts with page 1)
             iterator: If set to True and no pagination option is
                 defined, return a generator instead of a list
+            shard_by: List all the objects whose time attribute, e.g.
+                ``created_at`` or ``updated_at``, is between ``since`` and
+                ``until``, by listing time windows concurrently. The manager
+                must declare the filters of the attribute. The objects are
+                returned in a list, ``iterator`` cannot be set.
+            shards: Number of windows listed at the same time with
+                ``shard_by``. Windows with too many items are split further.
+            since: Start of the listed period, with ``shard_by``, as a
+                datetime or an ISO 8601 string, in UTC if it has no time zone
+            until: End of the listed period, with ``shard_by``, like
+                ``since``. Defaults to the current time.
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Returns:
@@ -197,7 +636,44 @@ class ListMixin(HeadMixin[base.TObjCls]):
             GitlabAuthenticationError: If authentication is not correct
             GitlabListError: If the server cannot perform the request
         """
+        if "shard_by" in kwargs:
+            if iterator:
+                raise ValueError("A sharded listing cannot be used with iterator=True")
+            return self._list_sharded(kwargs)
+        path, data = self._list_query(kwargs, iterator=iterator)
+        obj = self.gitlab.http_list(path, iterator=iterator, **data)
+        return utils._chain_result(obj, self._wrap_list_result)
+
+    @exc.on_http_error(exc.GitlabListError)
+    def iter_dicts(
+        self, *, fields: Sequence[str] | None = None, **kwargs: Any
+    ) -> base.RESTDictList:
+        """Retrieve the objects as plain dictionaries, without creating objects.
+
+        The items are fetched page by page while iterating, like with
+        ``list(iterator=True)``.
+
+        Args:
+            fields: The keys to keep in each item. All the keys are kept if
+                None.
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
+        Returns:
+            A generator of the items
+
+        Raises:
+            GitlabAuthenticationError: If authentication is not correct
+            GitlabListError: If the server cannot perform the request
+        """
+        path, data = self._list_query(kwargs, iterator=True)
+        obj = self.gitlab.http_list(path, iterator=True, **data)
+        return utils._chain_result(
+            obj, lambda gl_list: base.RESTDictList(gl_list, fields)
+        )
 
+    def _list_query(
+        self, kwargs: dict[str, Any], iterator: bool = False
+    ) -> tuple[str, dict[str, Any]]:
         data, _ = utils._transform_types(
             data=kwargs,
             custom_types=self._types,
@@ -215,13 +691,37 @@ class ListMixin(HeadMixin[base.TObjCls]):
         if self.gitlab.order_by:
             data.setdefault("order_by", self.gitlab.order_by)
 
+        get_all = data.get("get_all", data.get("all"))
+        if data.get("pagination") == "auto":
+            del data["pagination"]
+            if iterator or get_all:
+                self._use_keyset_pagination(data)
+        elif "pagination" not in data and get_all and not iterator:
+            # The totals of a listing are only exposed by iterators
+            self._use_keyset_pagination(data)
+
         # Allow to overwrite the path, handy for custom listings
         path = data.pop("path", self.path)
+        return path, data
 
-        obj = self.gitlab.http_list(path, iterator=iterator, **data)
-        if isinstance(obj, list):
-            return [self._obj_cls(self, item, created_from_list=True) for item in obj]
-        return base.RESTObjectList(self, self._obj_cls, obj)
+    def _use_keyset_pagination(self, data: dict[str, Any]) -> None:
+        """Switch a listing of all the objects to keyset pagination, whose
+        pages are as fast to fetch at any depth: by default with
+        ``get_all=True``, and with ``pagination="auto"`` for iterators too.
+
+        Requests selecting a page, or an order the endpoint does not support
+        with keyset pagination, keep offset pagination.
+        """
+        order_by = self._keyset_order_by
+        if order_by is None or "page" in data:
+            return
+        if data.get("order_by", order_by) != order_by:
+            return
+        sort = self._keyset_sort
+        if sort is not None and data.get("sort", sort) != sort:
+            return
+        data["order_by"] = order_by
+        data["pagination"] = "keyset"
 
 
 class RetrieveMixin(ListMixin[base.TObjCls], GetMixin[base.TObjCls]): ...
@@ -256,9 +756,7 @@ class CreateMixin(base.RESTManager[base.TObjCls]):
         # Handle specific URL for creation
         path = kwargs.pop("path", self.path)
         server_data = self.gitlab.http_post(path, post_data=data, files=files, **kwargs)
-        if TYPE_CHECKING:
-            assert not isinstance(server_data, requests.Response)
-        return self._obj_cls(self, server_data)
+        return utils._chain_result(server_data, lambda data: self._obj_cls(self, data))
 
 
 @enum.unique
@@ -323,11 +821,20 @@ class UpdateMixin(base.RESTManager[base.TObjCls]):
             data=new_data, custom_types=self._types, transform_data=False
         )
 
+        self._invalidate(id)
         http_method = self._get_update_method()
         result = http_method(path, post_data=new_data, files=files, **kwargs)
         if TYPE_CHECKING:
             assert not isinstance(result, requests.Response)
-        return result
+        if self._full_path_attr is None:
+            return result
+
+        def remember(data: dict[str, Any]) -> dict[str, Any]:
+            # A renamed or moved resource is requested by its new path
+            self._remember_path(data)
+            return data
+
+        return utils._chain_result(result, remember)
 
 
 class SetMixin(base.RESTManager[base.TObjCls]):
@@ -350,9 +857,7 @@ class SetMixin(base.RESTManager[base.TObjCls]):
         path = f"{self.path}/{utils.EncodedId(key)}"
         data = {"value": value}
         server_data = self.gitlab.http_put(path, post_data=data, **kwargs)
-        if TYPE_CHECKING:
-            assert not isinstance(server_data, requests.Response)
-        return self._obj_cls(self, server_data)
+        return utils._chain_result(server_data, lambda data: self._obj_cls(self, data))
 
 
 class DeleteMixin(base.RESTManager[base.TObjCls]):
@@ -373,7 +878,10 @@ class DeleteMixin(base.RESTManager[base.TObjCls]):
         else:
             path = f"{self.path}/{utils.EncodedId(id)}"
 
-        self.gitlab.http_delete(path, **kwargs)
+        self._invalidate(id)
+        self._forget_path(id)
+        result = self.gitlab.http_delete(path, **kwargs)
+        return utils._chain_result(result, lambda _: None)
 
 
 class CRUDMixin(
@@ -438,6 +946,9 @@ class SaveMixin(_RestObjectBase):
         if TYPE_CHECKING:
             assert isinstance(self.manager, UpdateMixin)
         server_data = self.manager.update(obj_id, updated_data, **kwargs)
+        return utils._chain_result(server_data, self._update_saved_attrs)
+
+    def _update_saved_attrs(self, server_data: dict[str, Any]) -> dict[str, Any]:
         self._update_attrs(server_data)
         return server_data
 
@@ -465,7 +976,7 @@ class ObjectDeleteMixin(_RestObjectBase):
         if TYPE_CHECKING:
             assert isinstance(self.manager, DeleteMixin)
             assert self.encoded_id is not None
-        self.manager.delete(self.encoded_id, **kwargs)
+        return self.manager.delete(self.encoded_id, **kwargs)
 
 
 class UserAgentDetailMixin(_RestObjectBase):
@@ -783,8 +1294,9 @@ class TimeTrackingMixin(_RestObjectBase):
         """
         # Use the existing time_stats attribute if it exist, otherwise make an
         # API call
-        if "time_stats" in self.attributes:
-            time_stats = self.attributes["time_stats"]
+        attributes = self.attributes_view
+        if "time_stats" in attributes:
+            time_stats = copy.deepcopy(attributes["time_stats"])
             if TYPE_CHECKING:
                 assert isinstance(time_stats, dict)
             return time_stats
@@ -1003,8 +1515,7 @@ class UploadMixin(_RestObjectBase):
         """
         if TYPE_CHECKING:
             assert isinstance(self._upload_path, str)
-        data = self.attributes
-        return self._upload_path.format(**data)
+        return self._upload_path.format(**self.attributes_view)
 
     @cli.register_custom_action(
         cls_names=("Project", "ProjectWiki"), required=("filename", "filepath")
@@ -0,0 +1,293 @@
+"""
+Helpers to use a :class:`gitlab.Gitlab` client from several threads or
+processes.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import copy
+import dataclasses
+import io
+import multiprocessing.context
+import os
+import pickle
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Generic, TYPE_CHECKING, TypeVar
+
+import gitlab
+from gitlab import base, instrumentation, ratelimit
+
+if TYPE_CHECKING:
+    from gitlab.client import Gitlab
+
+__all__ = ["GitlabPool", "MapResult", "process_map"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclasses.dataclass
+class MapResult(Generic[T, R]):
+    """The outcome of calling a function on an item, see :meth:`GitlabPool.map`
+    and :func:`process_map`."""
+
+    item: T
+    #: The value returned by the function
+    result: R | None = None
+    #: The exception raised by the function, if it failed
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the function returned without raising an exception."""
+        return self.error is None
+
+
+class GitlabPool:
+    """Thread-local clients sharing the configuration and connections of a client.
+
+    Each thread gets its own copy of ``gl``, with its own ``headers``,
+    ``user`` and managers, so that a thread setting a header or calling
+    :meth:`gitlab.Gitlab.auth` does not affect the others. The copies share the
+    authentication, the HTTP session and its connection pool, the response
+    cache and the rate limiter of ``gl``. Size the connection pool of ``gl``
+    for the threads, e.g. with ``pool_maxsize=max_workers`` and
+    ``pool_block=True``.
+
+    Used as a context manager, the pool releases its worker threads when
+    exiting the ``with`` block.
+
+    Args:
+        gl: The client the thread-local clients are copied from.
+        max_workers: Number of threads used by :meth:`map`.
+    """
+
+    def __init__(self, gl: Gitlab, max_workers: int = 8) -> None:
+        if isinstance(gl, gitlab.AsyncGitlab):
+            raise TypeError("A client pool requires a synchronous gitlab.Gitlab")
+        self.gitlab = gl
+        self.max_workers = max_workers
+        self._local = threading.local()
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> GitlabPool:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def client(self) -> Gitlab:
+        """The client of the current thread, created on first use."""
+        client: Gitlab | None = getattr(self._local, "client", None)
+        if client is None:
+            client = _copy_client(self.gitlab)
+            self._local.client = client
+        return client
+
+    def map(
+        self, function: Callable[[Gitlab, T], R], items: Iterable[T]
+    ) -> list[MapResult[T, R]]:
+        """Call a function on each item from the threads of the pool.
+
+        Exceptions raised by the function are collected instead of being
+        raised, so that a failing item does not stop the others.
+
+        Args:
+            function: Called with the client of the thread and an item.
+            items: The items to call the function on.
+
+        Returns:
+            A :class:`MapResult` per item, in the order of the items.
+        """
+        executor = self._get_executor()
+        futures = [
+            (item, executor.submit(self._call, function, item)) for item in items
+        ]
+        results: list[MapResult[T, R]] = []
+        for item, future in futures:
+            try:
+                results.append(MapResult(item, result=future.result()))
+            except Exception as e:
+                results.append(MapResult(item, error=e))
+        return results
+
+    def close(self) -> None:
+        """Release the worker threads of the pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="python-gitlab-pool",
+                )
+            return self._executor
+
+    def _call(self, function: Callable[[Gitlab, T], R], item: T) -> R:
+        return function(self.client, item)
+
+
+def _copy_client(gl: Gitlab) -> Gitlab:
+    """Copy a client, sharing its backend but not its per-thread state."""
+    client = copy.copy(gl)
+    client.headers = dict(gl.headers)
+    client.user = None
+    for name, value in vars(gl).items():
+        if isinstance(value, base.RESTManager) and value.gitlab is gl:
+            setattr(client, name, type(value)(client))
+    return client
+
+
+def process_map(
+    gl: Gitlab,
+    function: Callable[[Gitlab, T], R],
+    items: Iterable[T],
+    max_workers: int | None = None,
+    mp_context: multiprocessing.context.BaseContext | None = None,
+) -> Iterator[MapResult[T, R]]:
+    """Call a function on each item from a pool of processes.
+
+    Each process rebuilds a copy of ``gl`` with its own connections, once. The
+    items and results are pickled with references to the client instead of the
+    client itself: objects of ``gl``, such as lazy objects, belong to the copy
+    of the worker process, and the objects returned by the function belong to
+    ``gl`` again. The copies do not share the response cache of ``gl``.
+
+    Exceptions raised by the function are collected instead of being raised,
+    so that a failing item does not stop the others.
+
+    Args:
+        gl: The client the clients of the processes are copied from.
+        function: Called with the client of the process and an item. It must
+            be picklable, e.g. defined at the top level of a module.
+        items: The items to call the function on.
+        max_workers: Number of processes. Defaults to the number of CPUs.
+        mp_context: The ``multiprocessing`` context used to start the
+            processes.
+
+    Returns:
+        A :class:`MapResult` per item, in the order of the items, yielded as
+        soon as it is available.
+    """
+    if isinstance(gl, gitlab.AsyncGitlab):
+        raise TypeError("A process pool requires a synchronous gitlab.Gitlab")
+    return _process_map(
+        gl, function, items, max_workers or os.cpu_count() or 1, mp_context
+    )
+
+
+def _process_map(
+    gl: Gitlab,
+    function: Callable[[Gitlab, T], R],
+    items: Iterable[T],
+    max_workers: int,
+    mp_context: multiprocessing.context.BaseContext | None,
+) -> Iterator[MapResult[T, R]]:
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        # Shared memory can only be passed to the processes as they start
+        initargs=(_describe_client(gl), ratelimit._get_shared_values()),
+    ) as executor:
+        # Only a few items per process are pickled ahead of the results
+        pending: collections.deque[tuple[T, concurrent.futures.Future[bytes]]] = (
+            collections.deque()
+        )
+        for item in items:
+            future = executor.submit(_run, function, _dumps(item, gl))
+            pending.append((item, future))
+            if len(pending) >= 2 * max_workers:
+                yield _result(gl, *pending.popleft())
+        while pending:
+            yield _result(gl, *pending.popleft())
+
+
+#: The client of a worker process of :func:`process_map`
+_worker: dict[str, Gitlab] = {}
+
+_CLIENT_ID = "gitlab.parallel.client"
+
+
+class _ClientPickler(pickle.Pickler):
+    """Pickle references to a client instead of the client itself."""
+
+    def __init__(self, file: io.BytesIO, gl: Gitlab) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.gitlab = gl
+
+    def persistent_id(self, obj: Any) -> str | None:
+        return _CLIENT_ID if obj is self.gitlab else None
+
+
+class _ClientUnpickler(pickle.Unpickler):
+    """Resolve the references to a client pickled by :class:`_ClientPickler`."""
+
+    def __init__(self, file: io.BytesIO, gl: Gitlab) -> None:
+        super().__init__(file)
+        self.gitlab = gl
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid != _CLIENT_ID:
+            raise pickle.UnpicklingError(f"Unsupported persistent id {pid!r}")
+        return self.gitlab
+
+
+def _dumps(obj: Any, gl: Gitlab) -> bytes:
+    file = io.BytesIO()
+    _ClientPickler(file, gl).dump(obj)
+    return file.getvalue()
+
+
+def _loads(data: bytes, gl: Gitlab) -> Any:
+    return _ClientUnpickler(io.BytesIO(data), gl).load()
+
+
+def _describe_client(gl: Gitlab) -> bytes:
+    """Pickle a client without its connections, see :func:`_init_worker`."""
+    client = _copy_client(gl)
+    backend_class = type(gl._backend)
+    # Connections, cache entries, objects and requests in flight cannot be
+    # sent to another process
+    del client._backend
+    del client.session
+    client.cache = None
+    client.identity_map = None
+    client.coalescer = None
+    # Hooks may not be picklable, each process collects its own metrics
+    client.event_hooks = instrumentation.Hooks()
+    client.metrics = instrumentation.MetricsCollector()
+    client.event_hooks.subscribe(client.metrics)
+    return pickle.dumps((client, backend_class), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _init_worker(descriptor: bytes, shared_values: dict[str, Any]) -> None:
+    ratelimit._install_shared_values(shared_values)
+    client, backend_class = pickle.loads(descriptor)
+    client._create_backend(backend_class, **client._pool_options)
+    _worker["client"] = client
+
+
+def _run(function: Callable[[Gitlab, Any], Any], data: bytes) -> bytes:
+    client = _worker["client"]
+    item = _loads(data, client)
+    return _dumps(function(client, item), client)
+
+
+def _result(
+    gl: Gitlab, item: T, future: concurrent.futures.Future[bytes]
+) -> MapResult[T, R]:
+    try:
+        result: R = _loads(future.result(), gl)
+    except Exception as e:
+        return MapResult(item, error=e)
+    return MapResult(item, result=result)
@@ -0,0 +1,182 @@
+"""
+Cache of the numeric IDs of projects, groups and namespaces retrieved by their
+full path, used by :class:`gitlab.Gitlab` to request them by ID instead.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, TYPE_CHECKING
+from urllib import parse
+
+from gitlab import utils
+
+if TYPE_CHECKING:
+    from gitlab.base import RESTManager
+
+__all__ = ["PathCache"]
+
+_logger = logging.getLogger(__name__)
+
+#: Version of the format of the cache files
+_FILE_VERSION = 1
+
+
+def _scope(manager: RESTManager[Any]) -> str:
+    """Return the scope of the paths of a manager, e.g.
+    ``https://gitlab.com/api/v4/projects``."""
+    return f"{manager.gitlab.api_url}{manager.path}"
+
+
+def _path(id: Any) -> str | None:
+    """Return the full path of a resource, or None if ``id`` is a numeric ID."""
+    if not isinstance(id, str) or id.isdigit():
+        return None
+    # Paths are case insensitive, and ``id`` may already be encoded
+    return parse.unquote(str(utils.EncodedId(id))).lower()
+
+
+class PathCache:
+    """Map the full paths of projects, groups and namespaces to their IDs.
+
+    Once a resource was retrieved by its full path (e.g. ``group/project``),
+    the next requests of the same path use its numeric ID instead, which GitLab
+    resolves faster. A path whose ID returns a 404, or now belongs to another
+    path because the resource was renamed or moved, is resolved again.
+
+    Args:
+        filename: Path of a JSON file keeping the IDs between processes, e.g.
+            between invocations of the CLI. The file is read when the cache is
+            created and written each time an ID is added or removed.
+    """
+
+    def __init__(self, filename: str | None = None) -> None:
+        self.filename = None if filename is None else os.path.expanduser(filename)
+        #: Paths resolved from the cache
+        self.hits = 0
+        #: Paths requested without a known ID
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._ids: dict[str, dict[str, int]] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self._ids.values())
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, manager: RESTManager[Any], id: Any) -> int | None:
+        """Return the numeric ID of a resource, if its full path is known.
+
+        Args:
+            manager: The manager of the resource
+            id: The full path of the resource
+        """
+        path = _path(id)
+        if path is None:
+            return None
+        with self._lock:
+            numeric_id = self._ids.get(_scope(manager), {}).get(path)
+            if numeric_id is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return numeric_id
+
+    def add(self, manager: RESTManager[Any], data: dict[str, Any]) -> None:
+        """Remember the numeric ID and full path of a resource.
+
+        Args:
+            manager: The manager of the resource
+            data: The attributes received from the server
+        """
+        attr = manager._full_path_attr
+        numeric_id = data.get("id")
+        path = _path(data.get(attr)) if attr is not None else None
+        if path is None or not isinstance(numeric_id, int):
+            return
+        with self._lock:
+            ids = self._ids.setdefault(_scope(manager), {})
+            if ids.get(path) == numeric_id:
+                return
+            # The previous path of a renamed resource may now be free
+            for stale in [p for p, i in ids.items() if i == numeric_id]:
+                del ids[stale]
+            ids[path] = numeric_id
+            self._save()
+
+    def confirm(self, manager: RESTManager[Any], id: Any, data: dict[str, Any]) -> bool:
+        """Remember the attributes of a resource requested with the numeric ID
+        cached for a path, and return whether the resource still has this path.
+
+        Args:
+            manager: The manager of the resource
+            id: The full path the numeric ID was cached for
+            data: The attributes received from the server
+        """
+        self.add(manager, data)
+        attr = manager._full_path_attr
+        return attr is not None and _path(data.get(attr)) == _path(id)
+
+    def invalidate(self, manager: RESTManager[Any], id: Any) -> None:
+        """Forget a resource, by full path or numeric ID.
+
+        Args:
+            manager: The manager of the resource
+            id: The full path or numeric ID of the resource
+        """
+        path = _path(id)
+        with self._lock:
+            ids = self._ids.get(_scope(manager), {})
+            if path is not None:
+                stale = [path] if path in ids else []
+            else:
+                stale = [p for p, i in ids.items() if str(i) == str(id)]
+            if not stale:
+                return
+            for p in stale:
+                del ids[p]
+            self._save()
+
+    def clear(self) -> None:
+        """Forget all the resources."""
+        with self._lock:
+            self._ids.clear()
+            self._save()
+
+    def _load(self) -> None:
+        if self.filename is None or not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, encoding="utf-8") as f:
+                content = json.load(f)
+            if content.get("version") == _FILE_VERSION:
+                self._ids = content["ids"]
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            _logger.warning("Ignoring invalid path cache %s: %s", self.filename, e)
+
+    def _save(self) -> None:
+        if self.filename is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Written to a temporary file first so that other processes never
+            # read a partial file
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": _FILE_VERSION, "ids": self._ids}, f)
+            os.replace(tmp, self.filename)
+        except OSError as e:
+            _logger.warning("Could not write path cache %s: %s", self.filename, e)
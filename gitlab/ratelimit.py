@@ -0,0 +1,231 @@
+"""
+Client-side rate limiting, used by :class:`gitlab.Gitlab` to pace requests before
+they are sent instead of waiting for ``429 Too Many Requests`` responses.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import struct
+import threading
+import time
+import uuid
+import weakref
+from collections.abc import Callable, Mapping
+from typing import Any, TypeVar
+
+try:
+    import fcntl
+
+    _FCNTL_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _FCNTL_AVAILABLE = False
+
+__all__ = ["RateLimiter"]
+
+_T = TypeVar("_T")
+
+_STATE_FORMAT = "d"
+
+#: The shared memory of the limiters known to this process, by token
+_shared_values: weakref.WeakValueDictionary[str, Any] = weakref.WeakValueDictionary()
+
+
+class _LocalState:
+    """State shared by the threads of a process."""
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def transact(self, update: Callable[[float], float]) -> float:
+        with self._lock:
+            self._value = update(self._value)
+            return self._value
+
+
+class _SharedMemoryState:
+    """State shared with the child processes through shared memory.
+
+    Shared memory can only be handed over when a process is started. Pickled
+    at any other time, e.g. to send a client to the workers of
+    :func:`gitlab.parallel.process_map`, the state only holds a token, resolved
+    against the shared memory that the process received with
+    :func:`shared_values`.
+    """
+
+    def __init__(self) -> None:
+        self._value = multiprocessing.Value(_STATE_FORMAT, 0.0)
+        self._token = uuid.uuid4().hex
+        _shared_values[self._token] = self._value
+
+    def __getstate__(self) -> dict[str, Any]:
+        if multiprocessing.context.get_spawning_popen() is not None:
+            # Inherited by the process being started
+            return self.__dict__.copy()
+        return {"_token": self._token}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if "_value" in state:
+            _shared_values[self._token] = self._value
+            return
+        value = _shared_values.get(self._token)
+        if value is None:
+            raise RuntimeError(
+                "The shared memory of a RateLimiter can only be used by the "
+                "processes started with it, e.g. by multiprocessing or "
+                "gitlab.parallel.process_map"
+            )
+        self._value = value
+
+    def transact(self, update: Callable[[float], float]) -> float:
+        with self._value.get_lock():
+            self._value.value = update(self._value.value)
+            return float(self._value.value)
+
+
+def _get_shared_values() -> dict[str, Any]:
+    """Return the shared memory of the limiters of this process, to pass to a
+    process when it is started."""
+    return dict(_shared_values)
+
+
+def _install_shared_values(values: dict[str, Any]) -> None:
+    """Make the shared memory received from the parent process available to
+    the limiters unpickled in this process."""
+    _shared_values.update(values)
+
+
+class _FileState:
+    """State shared by any process through a locked file."""
+
+    def __init__(self, path: str) -> None:
+        if not _FCNTL_AVAILABLE:  # pragma: no cover
+            raise NotImplementedError(
+                "Sharing a rate limit through a file requires fcntl (POSIX only)"
+            )
+        self.path = path
+
+    def transact(self, update: Callable[[float], float]) -> float:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            data = os.pread(fd, struct.calcsize(_STATE_FORMAT), 0)
+            value = struct.unpack(_STATE_FORMAT, data)[0] if data else 0.0
+            value = update(value)
+            os.pwrite(fd, struct.pack(_STATE_FORMAT, value), 0)
+            return float(value)
+        finally:
+            os.close(fd)
+
+
+def _parse_header(
+    headers: Mapping[str, str], name: str, type_: Callable[[str], _T]
+) -> _T | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return type_(value)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """A token bucket pacing the requests sent to GitLab.
+
+    The bucket holds up to ``burst`` requests and refills at ``rate`` requests
+    per second. When ``rate`` is not set, it is learned from the
+    ``RateLimit-Limit`` response header. The ``RateLimit-Remaining`` and
+    ``RateLimit-Reset`` headers keep the bucket from exceeding what the server
+    still allows, so that requests wait before being sent instead of being
+    rejected.
+
+    Args:
+        rate: Number of requests per second.
+        burst: Number of requests that can be sent without waiting.
+        period: Number of seconds ``RateLimit-Limit`` applies to.
+        path: Path of a file used to share the budget with other processes,
+            e.g. several jobs running on the same host.
+        shared_memory: Whether to share the budget with the processes started
+            by ``multiprocessing`` or :func:`gitlab.parallel.process_map`
+            after the limiter was created, with the default start method.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int = 10,
+        period: float = 60.0,
+        path: str | None = None,
+        shared_memory: bool = False,
+    ) -> None:
+        if path is not None and shared_memory:
+            raise ValueError("Only one of path and shared_memory can be used")
+        self.rate = rate
+        self.burst = burst
+        self.period = period
+        self._learn_rate = rate is None
+        self._state: _LocalState | _SharedMemoryState | _FileState
+        if path is not None:
+            self._state = _FileState(path)
+        elif shared_memory:
+            self._state = _SharedMemoryState()
+        else:
+            self._state = _LocalState()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        if isinstance(self._state, _LocalState):
+            # Another process has its own budget
+            state["_state"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self._state is None:
+            self._state = _LocalState()
+
+    def _interval(self) -> float:
+        return 1 / self.rate if self.rate else 0.0
+
+    def acquire(self) -> float:
+        """Take a request from the bucket.
+
+        The state holds the time at which the bucket will be full again. Each
+        request reserves its own slot, so concurrent callers are spread out
+        instead of all waking up at once.
+
+        Returns:
+            The number of seconds to wait before sending the request.
+        """
+        interval = self._interval()
+        tolerance = interval * (self.burst - 1)
+        now = time.time()
+        full_at = self._state.transact(lambda value: max(value, now) + interval)
+        return max(0.0, full_at - interval - tolerance - now)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Adjust the bucket to the rate limit headers of a response.
+
+        Headers whose value is not a number are ignored."""
+        limit = _parse_header(headers, "RateLimit-Limit", int)
+        if limit and self._learn_rate:
+            self.rate = limit / self.period
+
+        remaining = _parse_header(headers, "RateLimit-Remaining", int)
+        if remaining is None:
+            return
+
+        interval = self._interval()
+        tolerance = interval * (self.burst - 1)
+        reset = _parse_header(headers, "RateLimit-Reset", float)
+        if remaining <= 0 and reset is not None:
+            # Nothing is allowed before the reset, then requests resume at `rate`
+            full_at = reset + tolerance
+        else:
+            # Leave at most `remaining` requests in the bucket
+            full_at = time.time() + tolerance - (remaining - 1) * interval
+        self._state.transact(lambda value: max(value, full_at))
@@ -0,0 +1,205 @@
+"""
+Retry policies used by :class:`gitlab.Gitlab` and the GraphQL clients to retry
+requests failing with a transient error without piling onto a degraded server.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any
+
+from gitlab import exceptions as exc
+
+__all__ = ["CircuitBreaker", "RetryBudget", "RetryPolicy"]
+
+
+class _Locked:
+    """Recreate the lock of the state shared by threads when unpickled."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class RetryBudget(_Locked):
+    """Limit the retries of transient errors to a share of the requests.
+
+    Each request adds ``ratio`` tokens to the budget, up to ``capacity``, and
+    each retry takes one. Once the budget is spent, failing requests are not
+    retried until enough requests were sent again, so that retries cannot
+    multiply the load on a degraded server.
+
+    Args:
+        ratio: Number of retries allowed per request.
+        minimum: Number of retries allowed before any request was sent.
+        capacity: Maximum number of retries saved in the budget.
+    """
+
+    def __init__(self, ratio: float = 0.2, minimum: int = 10, capacity: int = 100):
+        super().__init__()
+        self.ratio = ratio
+        self.capacity = capacity
+        #: Number of retries currently allowed
+        self.tokens = float(minimum)
+
+    def deposit(self) -> None:
+        """Record a request."""
+        with self._lock:
+            self.tokens = min(float(self.capacity), self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a retry from the budget.
+
+        Returns:
+            Whether the retry is allowed.
+        """
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker(_Locked):
+    """Fail fast while the server keeps failing.
+
+    After ``failure_threshold`` consecutive server errors or timeouts, the
+    circuit opens: requests raise
+    :class:`~gitlab.exceptions.GitlabCircuitOpenError` without being sent.
+    Once ``recovery_time`` elapsed, a single request is let through to probe
+    the server. Its success closes the circuit, its failure keeps it open for
+    another ``recovery_time``.
+
+    Args:
+        failure_threshold: Number of consecutive failures opening the circuit.
+        recovery_time: Number of seconds before probing the server again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0):
+        super().__init__()
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        #: Number of consecutive failures
+        self.failures = 0
+        self._probe_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests currently fail fast."""
+        return self._probe_at is not None
+
+    def check(self) -> None:
+        """Let a request through, unless the circuit is open.
+
+        Raises:
+            GitlabCircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self._probe_at is None:
+                return
+            now = time.monotonic()
+            if now >= self._probe_at:
+                # Probe the server, the next one waits for another period
+                self._probe_at = now + self.recovery_time
+                return
+            wait_time = self._probe_at - now
+        raise exc.GitlabCircuitOpenError(
+            f"The server failed {self.failures} times in a row, "
+            f"retry in {wait_time:.1f} seconds"
+        )
+
+    def record_success(self) -> None:
+        """Record a request answered by the server."""
+        with self._lock:
+            self.failures = 0
+            self._probe_at = None
+
+    def record_failure(self) -> None:
+        """Record a server error or a timeout."""
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self._probe_at = time.monotonic() + self.recovery_time
+
+
+class RetryPolicy:
+    """How requests failing with a transient error are retried.
+
+    The delay between attempts uses decorrelated jitter: each delay is drawn
+    between ``base_delay`` and three times the previous one, capped at
+    ``max_delay``, so that clients failing at the same time do not retry in
+    lockstep. A policy can be shared by several clients, including the GraphQL
+    ones, to share its budget and circuit breaker.
+
+    Args:
+        base_delay: Number of seconds to wait before the first retry.
+        max_delay: Maximum number of seconds to wait between attempts.
+        jitter: Whether to randomize the delays. Without jitter, the delay
+            doubles after each attempt.
+        budget: Limits the number of retries to a share of the requests.
+        circuit_breaker: Fails requests fast while the server keeps failing.
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 0.1,
+        max_delay: float = 60.0,
+        jitter: bool = True,
+        budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.budget = budget
+        self.circuit_breaker = circuit_breaker
+
+    def backoff(self, attempt: int, previous: float | None) -> float:
+        """Return the number of seconds to wait before a retry.
+
+        Args:
+            attempt: Number of retries already made for the request.
+            previous: The delay before the previous retry, if any.
+        """
+        if not self.jitter:
+            return float(min(self.max_delay, self.base_delay * 2**attempt))
+        upper = max(self.base_delay, (previous or self.base_delay) * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def start_request(self) -> None:
+        """Record a new request."""
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def allow_retry(self) -> bool:
+        """Return whether a transient error can be retried."""
+        return self.budget is None or self.budget.withdraw()
+
+    def check(self) -> None:
+        """Raise if requests currently fail fast.
+
+        Raises:
+            GitlabCircuitOpenError: If the circuit breaker is open
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.check()
+
+    def record_success(self) -> None:
+        """Record a request answered by the server."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success()
+
+    def record_failure(self) -> None:
+        """Record a server error or a timeout."""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure()
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import codecs
 import dataclasses
 import email.message
+import inspect
+import json
 import logging
 import pathlib
+import re
 import time
 import traceback
 import urllib.parse
 import warnings
-from collections.abc import Iterator, MutableMapping
-from typing import Any, Callable, Literal
+from collections.abc import Iterable, Iterator, MutableMapping
+from typing import Any, Callable, cast, Literal, TypeVar
 
 import requests
 
 from gitlab import const, types
+from gitlab.retry import RetryPolicy
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
 
 
 class _StdoutStream:
@@ -66,6 +73,14 @@ class MaskingFormatter(logging.Formatter):
         return self._filter(original)
 
 
+def _iter_content(response: Any, chunk_size: int) -> Iterator[bytes]:
+    """Iterate over the body of a response received by a synchronous backend,
+    either a ``requests.Response`` or an ``httpx.Response``."""
+    if isinstance(response, requests.Response):
+        return response.iter_content(chunk_size=chunk_size)
+    return cast(Iterator[bytes], response.iter_bytes(chunk_size))
+
+
 def response_content(
     response: requests.Response,
     streamed: bool,
@@ -75,7 +90,7 @@ def response_content(
     iterator: bool,
 ) -> bytes | Iterator[Any] | None:
     if iterator:
-        return response.iter_content(chunk_size=chunk_size)
+        return _iter_content(response, chunk_size)
 
     if streamed is False:
         return response.content
@@ -83,23 +98,60 @@ def response_content(
     if action is None:
         action = _StdoutStream()
 
-    for chunk in response.iter_content(chunk_size=chunk_size):
+    for chunk in _iter_content(response, chunk_size):
         if chunk:
             action(chunk)
     return None
 
 
 class Retry:
+    """The retries of a request, paced by a :class:`gitlab.retry.RetryPolicy`."""
+
     def __init__(
         self,
         max_retries: int,
         obey_rate_limit: bool | None = True,
         retry_transient_errors: bool | None = False,
+        policy: RetryPolicy | None = None,
+        on_retry: Callable[[float, int | None], Any] | None = None,
     ) -> None:
         self.cur_retries = 0
         self.max_retries = max_retries
         self.obey_rate_limit = obey_rate_limit
         self.retry_transient_errors = retry_transient_errors
+        self.policy = policy or RetryPolicy()
+        #: Called with the wait time and the status code, if any, before waiting
+        #: to retry
+        self.on_retry = on_retry
+        self._wait_time: float | None = None
+        self.policy.start_request()
+
+    def check(self) -> None:
+        """Raise if the requests currently fail fast.
+
+        Raises:
+            GitlabCircuitOpenError: If the circuit breaker of the policy is open
+        """
+        self.policy.check()
+
+    def record_status(self, status_code: int | None) -> None:
+        """Record the status of a response for the circuit breaker."""
+        if status_code in const.RETRYABLE_TRANSIENT_ERROR_CODES:
+            self.policy.record_failure()
+        elif status_code != 429:
+            self.policy.record_success()
+
+    def record_error(self) -> None:
+        """Record a timeout or a connection error for the circuit breaker."""
+        self.policy.record_failure()
+
+    def _notify(self, wait_time: float, status_code: int | None) -> None:
+        if self.on_retry is not None:
+            self.on_retry(wait_time, status_code)
+
+    def _backoff(self) -> float:
+        self._wait_time = self.policy.backoff(self.cur_retries, self._wait_time)
+        return self._wait_time
 
     def _retryable_status_code(self, status_code: int | None, reason: str = "") -> bool:
         if status_code == 429 and self.obey_rate_limit:
@@ -114,14 +166,15 @@ class Retry:
 
         return False
 
-    def handle_retry_on_status(
+    def _get_wait_time_on_status(
         self,
         status_code: int | None,
         headers: MutableMapping[str, str] | None = None,
         reason: str = "",
-    ) -> bool:
+    ) -> float | None:
+        """Return how long to wait before retrying, or None if we should not."""
         if not self._retryable_status_code(status_code, reason):
-            return False
+            return None
 
         if headers is None:
             headers = {}
@@ -129,27 +182,176 @@ class Retry:
         # Response headers documentation:
         # https://docs.gitlab.com/ee/user/admin_area/settings/user_and_ip_rate_limits.html#response-headers
         if self.max_retries == -1 or self.cur_retries < self.max_retries:
-            wait_time = 2**self.cur_retries * 0.1
+            # Rate limited requests are paced by the server, not by the budget
+            if status_code != 429 and not self.policy.allow_retry():
+                return None
+            wait_time: float
             if "Retry-After" in headers:
                 wait_time = int(headers["Retry-After"])
             elif "RateLimit-Reset" in headers:
                 wait_time = max(0, int(headers["RateLimit-Reset"]) - time.time())
+            else:
+                wait_time = self._backoff()
             self.cur_retries += 1
-            time.sleep(wait_time)
-            return True
+            return wait_time
 
-        return False
+        return None
 
-    def handle_retry(self) -> bool:
-        if self.retry_transient_errors and (
-            self.max_retries == -1 or self.cur_retries < self.max_retries
+    def _get_wait_time(self) -> float | None:
+        """Return how long to wait before retrying after a transient error,
+        or None if we should not."""
+        if (
+            self.retry_transient_errors
+            and (self.max_retries == -1 or self.cur_retries < self.max_retries)
+            and self.policy.allow_retry()
         ):
-            wait_time = 2**self.cur_retries * 0.1
+            wait_time = self._backoff()
             self.cur_retries += 1
-            time.sleep(wait_time)
-            return True
+            return wait_time
 
-        return False
+        return None
+
+    def handle_retry_on_status(
+        self,
+        status_code: int | None,
+        headers: MutableMapping[str, str] | None = None,
+        reason: str = "",
+    ) -> bool:
+        wait_time = self._get_wait_time_on_status(status_code, headers, reason)
+        if wait_time is None:
+            return False
+        self._notify(wait_time, status_code)
+        time.sleep(wait_time)
+        return True
+
+    def handle_retry(self) -> bool:
+        wait_time = self._get_wait_time()
+        if wait_time is None:
+            return False
+        self._notify(wait_time, None)
+        time.sleep(wait_time)
+        return True
+
+    async def async_handle_retry_on_status(
+        self,
+        status_code: int | None,
+        headers: MutableMapping[str, str] | None = None,
+        reason: str = "",
+    ) -> bool:
+        """Same as :meth:`handle_retry_on_status` without blocking the event loop."""
+        wait_time = self._get_wait_time_on_status(status_code, headers, reason)
+        if wait_time is None:
+            return False
+        self._notify(wait_time, status_code)
+        import anyio
+
+        await anyio.sleep(wait_time)
+        return True
+
+    async def async_handle_retry(self) -> bool:
+        """Same as :meth:`handle_retry` without blocking the event loop."""
+        wait_time = self._get_wait_time()
+        if wait_time is None:
+            return False
+        self._notify(wait_time, None)
+        import anyio
+
+        await anyio.sleep(wait_time)
+        return True
+
+
+_T = TypeVar("_T")
+
+
+def _chain_result(value: Any, callback: Callable[[Any], _T]) -> _T:
+    """Apply ``callback`` to the result of an HTTP method.
+
+    When the client is asynchronous (``gitlab.AsyncGitlab``) the HTTP methods
+    return awaitables. In that case a coroutine applying ``callback`` to the
+    awaited value is returned instead, so that manager methods can be shared by
+    both clients.
+    """
+    if inspect.isawaitable(value):
+        awaitable = value
+
+        async def _await_and_apply() -> _T:
+            return callback(await awaitable)
+
+        return cast(_T, _await_and_apply())
+    return callback(value)
+
+
+class _JSONArrayParser:
+    """Incrementally decode the items of a JSON array received in chunks."""
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        # One of "start", "first", "value", "separator" or "end"
+        self._expect = "start"
+
+    def feed(self, chunk: bytes, final: bool = False) -> list[Any]:
+        """Add a chunk of the document.
+
+        Args:
+            chunk: The next bytes of the document
+            final: Whether this is the last chunk
+
+        Returns:
+            The items completely decoded from the data received so far.
+
+        Raises:
+            ValueError: If the document is not a valid JSON array
+        """
+        buffer = self._buffer + self._text_decoder.decode(chunk, final)
+        items = []
+        pos = 0
+        while True:
+            pos = _JSON_WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if self._expect == "end":
+                raise ValueError(f"Extra data after the JSON array at {pos}")
+            if self._expect == "start":
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._expect = "first"
+                pos += 1
+            elif char == "]" and self._expect in ("first", "separator"):
+                self._expect = "end"
+                pos += 1
+            elif self._expect == "separator":
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']' at {pos}")
+                self._expect = "value"
+                pos += 1
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # A number at the end of the buffer may not be complete yet
+                if end == len(buffer) and not final:
+                    break
+                items.append(item)
+                self._expect = "separator"
+                pos = end
+        self._buffer = buffer[pos:]
+        if final and self._expect != "end":
+            raise ValueError("Unterminated JSON array")
+        return items
+
+
+def _iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the items of a JSON array as they are decoded from ``chunks``."""
+    parser = _JSONArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.feed(b"", final=True)
 
 
 def _transform_types(
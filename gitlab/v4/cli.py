@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import argparse
-import json
 import operator
 import sys
 from typing import Any, TYPE_CHECKING
 
 import gitlab
 import gitlab.base
+import gitlab.json_codecs
 import gitlab.v4.objects
 from gitlab import cli
 from gitlab.exceptions import GitlabCiLintError
@@ -433,22 +433,24 @@ def get_dict(
         return obj
 
     if fields:
-        return {k: v for k, v in obj.attributes.items() if k in fields}
-    return obj.attributes
+        return {k: v for k, v in obj.attributes_view.items() if k in fields}
+    return obj.asdict(with_parent_attrs=True, copy=False)
 
 
 class JSONPrinter:
     @staticmethod
-    def display(d: str | dict[str, Any], **_kwargs: Any) -> None:
-        print(json.dumps(d))
+    def display(d: str | dict[str, Any], **kwargs: Any) -> None:
+        json_codec = kwargs.get("json_codec") or gitlab.json_codecs.StdlibCodec()
+        print(json_codec.dumps(d).decode())
 
     @staticmethod
     def display_list(
         data: list[str | dict[str, Any] | gitlab.base.RESTObject],
         fields: list[str],
-        **_kwargs: Any,
+        **kwargs: Any,
     ) -> None:
-        print(json.dumps([get_dict(obj, fields) for obj in data]))
+        json_codec = kwargs.get("json_codec") or gitlab.json_codecs.StdlibCodec()
+        print(json_codec.dumps([get_dict(obj, fields) for obj in data]).decode())
 
 
 class YAMLPrinter:
@@ -514,7 +516,7 @@ class LegacyPrinter:
             if obj._id_attr:
                 id = getattr(obj, obj._id_attr, None)
                 print(f"{obj._id_attr}: {id}")
-            attrs = obj.attributes
+            attrs = obj.asdict(with_parent_attrs=True, copy=False)
             if obj._id_attr:
                 attrs.pop(obj._id_attr)
             display_dict(attrs, padding)
@@ -586,14 +588,17 @@ def run(
 
     printer: JSONPrinter | LegacyPrinter | YAMLPrinter = PRINTERS[output]()
 
+    codec = gl.json_codec
     if isinstance(data, dict):
-        printer.display(data, verbose=True, obj=data)
+        printer.display(data, verbose=True, obj=data, json_codec=codec)
     elif isinstance(data, list):
-        printer.display_list(data, fields, verbose=verbose)
+        printer.display_list(data, fields, verbose=verbose, json_codec=codec)
     elif isinstance(data, gitlab.base.RESTObjectList):
-        printer.display_list(list(data), fields, verbose=verbose)
+        printer.display_list(list(data), fields, verbose=verbose, json_codec=codec)
     elif isinstance(data, gitlab.base.RESTObject):
-        printer.display(get_dict(data, fields), verbose=verbose, obj=data)
+        printer.display(
+            get_dict(data, fields), verbose=verbose, obj=data, json_codec=codec
+        )
     elif isinstance(data, str):
         print(data)
     elif isinstance(data, bytes):
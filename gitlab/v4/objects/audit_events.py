@@ -25,6 +25,9 @@ class AuditEvent(RESTObject):
 class AuditEventManager(RetrieveMixin[AuditEvent]):
     _path = "/audit_events"
     _obj_cls = AuditEvent
+    _shard_filters = {"created_at": ("created_after", "created_before")}
+    _keyset_order_by = "id"
+    _keyset_sort = "desc"
     _list_filters = ("created_after", "created_before", "entity_type", "entity_id")
 
 
@@ -35,6 +38,9 @@ class GroupAuditEvent(RESTObject):
 class GroupAuditEventManager(RetrieveMixin[GroupAuditEvent]):
     _path = "/groups/{group_id}/audit_events"
     _obj_cls = GroupAuditEvent
+    _shard_filters = {"created_at": ("created_after", "created_before")}
+    _keyset_order_by = "id"
+    _keyset_sort = "desc"
     _from_parent_attrs = {"group_id": "id"}
     _list_filters = ("created_after", "created_before")
 
@@ -46,6 +52,9 @@ class ProjectAuditEvent(RESTObject):
 class ProjectAuditEventManager(RetrieveMixin[ProjectAuditEvent]):
     _path = "/projects/{project_id}/audit_events"
     _obj_cls = ProjectAuditEvent
+    _shard_filters = {"created_at": ("created_after", "created_before")}
+    _keyset_order_by = "id"
+    _keyset_sort = "desc"
     _from_parent_attrs = {"project_id": "id"}
     _list_filters = ("created_after", "created_before")
 
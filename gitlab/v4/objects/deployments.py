@@ -73,6 +73,7 @@ class ProjectDeploymentManager(
 ):
     _path = "/projects/{project_id}/deployments"
     _obj_cls = ProjectDeployment
+    _shard_filters = {"updated_at": ("updated_after", "updated_before")}
     _from_parent_attrs = {"project_id": "id"}
     _list_filters = (
         "order_by",
@@ -262,6 +262,7 @@ class Group(SaveMixin, ObjectDeleteMixin, RESTObject):
 class GroupManager(CRUDMixin[Group]):
     _path = "/groups"
     _obj_cls = Group
+    _full_path_attr = "full_path"
     _list_filters = (
         "skip_groups",
         "all_available",
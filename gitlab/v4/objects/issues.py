@@ -55,6 +55,10 @@ class Issue(RESTObject):
 class IssueManager(RetrieveMixin[Issue]):
     _path = "/issues"
     _obj_cls = Issue
+    _shard_filters = {
+        "created_at": ("created_after", "created_before"),
+        "updated_at": ("updated_after", "updated_before"),
+    }
     _list_filters = (
         "state",
         "labels",
@@ -83,6 +87,10 @@ class GroupIssue(RESTObject):
 class GroupIssueManager(ListMixin[GroupIssue]):
     _path = "/groups/{group_id}/issues"
     _obj_cls = GroupIssue
+    _shard_filters = {
+        "created_at": ("created_after", "created_before"),
+        "updated_at": ("updated_after", "updated_before"),
+    }
     _from_parent_attrs = {"group_id": "id"}
     _list_filters = (
         "state",
@@ -229,6 +237,10 @@ class ProjectIssue(
 class ProjectIssueManager(CRUDMixin[ProjectIssue]):
     _path = "/projects/{project_id}/issues"
     _obj_cls = ProjectIssue
+    _shard_filters = {
+        "created_at": ("created_after", "created_before"),
+        "updated_at": ("updated_after", "updated_before"),
+    }
     _from_parent_attrs = {"project_id": "id"}
     _list_filters = (
         "iids",
@@ -345,6 +345,8 @@ class ProjectJob(RefreshMixin, RESTObject):
 class ProjectJobManager(RetrieveMixin[ProjectJob]):
     _path = "/projects/{project_id}/jobs"
     _obj_cls = ProjectJob
+    _keyset_order_by = "id"
+    _keyset_sort = "desc"
     _from_parent_attrs = {"project_id": "id"}
     _list_filters = ("scope", "order_by", "sort")
     _types = {"scope": ArrayAttribute}
@@ -69,6 +69,10 @@ class MergeRequest(RESTObject):
 class MergeRequestManager(ListMixin[MergeRequest]):
     _path = "/merge_requests"
     _obj_cls = MergeRequest
+    _shard_filters = {
+        "created_at": ("created_after", "created_before"),
+        "updated_at": ("updated_after", "updated_before"),
+    }
     _list_filters = (
         "state",
         "order_by",
@@ -116,6 +120,10 @@ class GroupMergeRequest(RESTObject):
 class GroupMergeRequestManager(ListMixin[GroupMergeRequest]):
     _path = "/groups/{group_id}/merge_requests"
     _obj_cls = GroupMergeRequest
+    _shard_filters = {
+        "created_at": ("created_after", "created_before"),
+        "updated_at": ("updated_after", "updated_before"),
+    }
     _from_parent_attrs = {"group_id": "id"}
     _list_filters = (
         "state",
@@ -448,6 +456,10 @@ class ProjectMergeRequest(
 class ProjectMergeRequestManager(CRUDMixin[ProjectMergeRequest]):
     _path = "/projects/{project_id}/merge_requests"
     _obj_cls = ProjectMergeRequest
+    _shard_filters = {
+        "created_at": ("created_after", "created_before"),
+        "updated_at": ("updated_after", "updated_before"),
+    }
     _from_parent_attrs = {"project_id": "id"}
     _optional_get_attrs = (
         "render_html",
@@ -16,6 +16,7 @@ class Namespace(RESTObject):
 class NamespaceManager(RetrieveMixin[Namespace]):
     _path = "/namespaces"
     _obj_cls = Namespace
+    _full_path_attr = "full_path"
     _list_filters = ("search",)
 
     @cli.register_custom_action(
@@ -102,6 +102,7 @@ class ProjectPipelineManager(
 ):
     _path = "/projects/{project_id}/pipelines"
     _obj_cls = ProjectPipeline
+    _shard_filters = {"updated_at": ("updated_after", "updated_before")}
     _from_parent_attrs = {"project_id": "id"}
     _list_filters = (
         "scope",
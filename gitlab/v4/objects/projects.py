@@ -677,6 +677,11 @@ class Project(
 class ProjectManager(CRUDMixin[Project]):
     _path = "/projects"
     _obj_cls = Project
+    _shard_filters = {
+        "last_activity_at": ("last_activity_after", "last_activity_before")
+    }
+    _keyset_order_by = "id"
+    _full_path_attr = "path_with_namespace"
     # Please keep these _create_attrs in same order as they are at:
     # https://docs.gitlab.com/ee/api/projects.html#create-project
     _create_attrs = RequiredOptional(
@@ -398,6 +398,8 @@ class User(SaveMixin, ObjectDeleteMixin, RESTObject):
 class UserManager(CRUDMixin[User]):
     _path = "/users"
     _obj_cls = User
+    _shard_filters = {"created_at": ("created_after", "created_before")}
+    _keyset_order_by = "id"
 
     _list_filters = (
         "username",
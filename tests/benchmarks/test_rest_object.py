@@ -0,0 +1,74 @@
+"""
+Memory and time needed to build the objects of a list result.
+
+Run with ``tox -e benchmark`` or ``pytest -s tests/benchmarks``.
+"""
+
+import time
+import tracemalloc
+from typing import Any
+
+import pytest
+
+import gitlab
+from gitlab.v4.objects import Project, ProjectManager
+
+ITEMS = 2_000
+
+
+@pytest.fixture(scope="module")
+def projects() -> ProjectManager:
+    gl = gitlab.Gitlab("http://localhost")
+    return gl.projects
+
+
+@pytest.fixture(scope="module")
+def items() -> list[dict[str, Any]]:
+    return [
+        {"id": i, "name": f"project-{i}", "path_with_namespace": f"group/project-{i}"}
+        for i in range(ITEMS)
+    ]
+
+
+def _build(
+    projects: ProjectManager, items: list[dict[str, Any]], eager: bool
+) -> list[Project]:
+    objects = [Project(projects, item, created_from_list=True) for item in items]
+    if eager:
+        # How every object was built before managers were created on access
+        for obj in objects:
+            obj._create_managers()
+    return objects
+
+
+def _measure(
+    projects: ProjectManager, items: list[dict[str, Any]], eager: bool
+) -> tuple[float, int]:
+    start = time.perf_counter()
+    objects = _build(projects, items, eager)
+    elapsed = time.perf_counter() - start
+    del objects
+
+    tracemalloc.start()
+    try:
+        objects = _build(projects, items, eager)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(objects) == ITEMS
+    return elapsed, size
+
+
+def test_list_objects_create_managers_on_access(
+    projects: ProjectManager, items: list[dict[str, Any]]
+) -> None:
+    eager_time, eager_size = _measure(projects, items, eager=True)
+    lazy_time, lazy_size = _measure(projects, items, eager=False)
+
+    print(
+        f"\n{ITEMS} projects, "
+        f"{len(Project._get_manager_classes())} managers per project\n"
+        f"  eager managers: {eager_time:.3f}s {eager_size / ITEMS:.0f} B/object\n"
+        f"  lazy managers:  {lazy_time:.3f}s {lazy_size / ITEMS:.0f} B/object"
+    )
+    assert lazy_size * 10 < eager_size
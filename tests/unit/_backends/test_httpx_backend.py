@@ -0,0 +1,218 @@
+import pickle
+import sys
+import types
+
+import httpx
+import pytest
+import respx
+
+import gitlab
+from gitlab._backends import get_backend_class, PoolStats, RequestsBackend
+from gitlab._backends.httpx_backend import AsyncHttpxBackend, HttpxBackend
+
+API_URL = "http://localhost/api/v4"
+
+
+@pytest.fixture
+def gl_httpx() -> gitlab.Gitlab:
+    return gitlab.Gitlab(
+        "http://localhost", private_token="private_token", backend="httpx"
+    )
+
+
+def test_get_backend_class():
+    assert get_backend_class("requests") is RequestsBackend
+    assert get_backend_class("httpx") is HttpxBackend
+    with pytest.raises(ValueError, match="Unknown backend"):
+        get_backend_class("urllib")
+
+
+def test_backend_configures_pool_limits():
+    backend = HttpxBackend(
+        http2=False, max_connections=4, max_keepalive_connections=2, keepalive_expiry=30
+    )
+
+    pool = backend.client._transport._pool
+    assert pool._max_connections == 4
+    assert pool._max_keepalive_connections == 2
+    assert pool._keepalive_expiry == 30
+    assert pool._http2 is False
+
+
+def test_backend_applies_pool_options():
+    backend = HttpxBackend(
+        http2=False, pool_maxsize=8, pool_block=True, pool_idle_timeout=60
+    )
+
+    pool = backend.client._transport._pool
+    assert pool._max_connections == 8
+    assert pool._max_keepalive_connections == 8
+    assert pool._keepalive_expiry == 60
+
+
+def test_async_backend_applies_pool_options():
+    backend = AsyncHttpxBackend(pool_maxsize=8)
+
+    pool = backend.client._transport._pool
+    assert pool._max_connections == 100
+    assert pool._max_keepalive_connections == 8
+
+
+def test_pool_stats(server):
+    backend = HttpxBackend(http2=False, pool_maxsize=4)
+    url = f"http://127.0.0.1:{server.server_port}/"
+
+    for _ in range(3):
+        backend.http_request("get", url)
+    streamed = backend.http_request("get", url, stream=True)
+
+    assert backend.pool_stats() == [
+        PoolStats(
+            host=f"http://127.0.0.1:{server.server_port}", in_use=1, idle=0, maxsize=4
+        )
+    ]
+    streamed.response.read()
+    assert backend.pool_stats()[0].idle == 1
+
+
+@pytest.mark.parametrize("http2", [True, False])
+def test_backend_uses_http2_only_if_requested(monkeypatch, http2):
+    monkeypatch.setitem(sys.modules, "h2", types.ModuleType("h2"))
+
+    options = {"http2": True} if http2 else {}
+    backend = HttpxBackend(**options)
+
+    assert backend.client._transport._pool._http2 is http2
+
+
+def test_pool_stats_without_httpcore_pool():
+    backend = HttpxBackend(transport=httpx.MockTransport(lambda request: None))
+
+    assert backend.pool_stats() == []
+
+
+def test_gitlab_with_httpx_backend_pickle(gl_httpx):
+    unpickled = pickle.loads(pickle.dumps(gl_httpx))
+
+    assert isinstance(unpickled.session, httpx.Client)
+    assert unpickled.session is unpickled._backend.client
+    assert unpickled.session is not gl_httpx.session
+    assert unpickled._backend.client._transport._pool._max_keepalive_connections == 20
+
+
+def test_backend_with_existing_client_cannot_be_pickled():
+    with pytest.raises(TypeError, match="existing httpx client"):
+        pickle.dumps(HttpxBackend(client=httpx.Client()))
+
+
+def test_gitlab_selects_backend_by_name(gl_httpx):
+    assert isinstance(gl_httpx._backend, HttpxBackend)
+    assert isinstance(gl_httpx.session, httpx.Client)
+
+
+def test_gitlab_passes_ssl_verify_to_backend(monkeypatch):
+    options = {}
+
+    def init(self, **kwargs):
+        options.update(kwargs)
+        self._client = None
+
+    monkeypatch.setattr(HttpxBackend, "__init__", init)
+    gitlab.Gitlab("http://localhost", ssl_verify="/ca.pem", backend=HttpxBackend)
+
+    assert options == {"verify": "/ca.pem"}
+
+
+def test_http_get_sends_auth_header(gl_httpx, respx_mock: respx.MockRouter):
+    route = respx_mock.get(f"{API_URL}/projects/1").mock(
+        return_value=httpx.Response(200, json={"id": 1, "name": "project1"})
+    )
+
+    project = gl_httpx.projects.get(1)
+
+    assert project.name == "project1"
+    assert route.calls.last.request.headers["PRIVATE-TOKEN"] == "private_token"
+
+
+def test_http_post_sends_json_body(gl_httpx, respx_mock: respx.MockRouter):
+    route = respx_mock.post(f"{API_URL}/projects").mock(
+        return_value=httpx.Response(201, json={"id": 1, "name": "project1"})
+    )
+
+    gl_httpx.projects.create({"name": "project1"})
+
+    assert route.calls.last.request.content == b'{"name":"project1"}'
+
+
+def test_http_request_raises_on_error(gl_httpx, respx_mock: respx.MockRouter):
+    respx_mock.get(f"{API_URL}/projects/1").mock(
+        return_value=httpx.Response(404, json={"message": "404 Not Found"})
+    )
+
+    with pytest.raises(gitlab.GitlabGetError, match="404 Not Found"):
+        gl_httpx.projects.get(1)
+
+
+def test_http_request_retries_transient_errors(
+    gl_httpx, respx_mock: respx.MockRouter, monkeypatch
+):
+    monkeypatch.setattr("time.sleep", lambda _: None)
+    respx_mock.get(f"{API_URL}/projects/1").mock(
+        side_effect=[httpx.ConnectError("down"), httpx.Response(200, json={"id": 1})]
+    )
+
+    data = gl_httpx.http_get("/projects/1", retry_transient_errors=True)
+
+    assert data == {"id": 1}
+
+
+def test_list_follows_pages(gl_httpx, respx_mock: respx.MockRouter):
+    respx_mock.get(f"{API_URL}/projects", params={"page": "2"}).mock(
+        return_value=httpx.Response(200, json=[{"id": 2}])
+    )
+    respx_mock.get(f"{API_URL}/projects").mock(
+        return_value=httpx.Response(
+            200,
+            json=[{"id": 1}],
+            headers={"Link": f'<{API_URL}/projects?page=2>; rel="next"'},
+        )
+    )
+
+    projects = gl_httpx.projects.list(get_all=True)
+
+    assert [project.id for project in projects] == [1, 2]
+
+
+def test_streamed_list(gl_httpx, respx_mock: respx.MockRouter, monkeypatch):
+    monkeypatch.setattr(gitlab.client, "_STREAM_CHUNK_SIZE", 4)
+    respx_mock.get(f"{API_URL}/projects").mock(
+        return_value=httpx.Response(200, json=[{"id": 1}, {"id": 2}])
+    )
+
+    projects = gl_httpx.projects.list(iterator=True, streamed=True)
+
+    assert [project.id for project in projects] == [1, 2]
+
+
+def test_streamed_download(gl_httpx, respx_mock: respx.MockRouter):
+    respx_mock.get(f"{API_URL}/projects/1/repository/archive").mock(
+        return_value=httpx.Response(200, content=b"archive")
+    )
+    chunks = []
+
+    gl_httpx.projects.get(1, lazy=True).repository_archive(
+        streamed=True, action=chunks.append
+    )
+
+    assert b"".join(chunks) == b"archive"
+
+
+def test_from_config_selects_backend(tmp_path):
+    config_file = tmp_path / "python-gitlab.cfg"
+    config_file.write_text(
+        "[global]\ndefault = one\n\n[one]\nurl = http://localhost\nbackend = httpx\n"
+    )
+
+    gl = gitlab.Gitlab.from_config("one", [str(config_file)])
+
+    assert isinstance(gl._backend, HttpxBackend)
@@ -1,4 +1,5 @@
 import pytest
+import requests
 from requests_toolbelt.multipart.encoder import MultipartEncoder  # type: ignore
 
 from gitlab._backends import requests_backend
@@ -49,3 +50,70 @@ class TestRequestsBackend:
         assert isinstance(result.data, MultipartEncoder)
         assert isinstance(result.data.fields["test_data"], str)
         assert result.data.fields["test_data"] == expected
+
+
+class TestPoolAdapter:
+    def test_backend_mounts_adapter_on_new_session(self) -> None:
+        backend = requests_backend.RequestsBackend(pool_maxsize=32, pool_block=True)
+
+        adapter = backend.client.get_adapter("https://gitlab.example.com")
+        assert isinstance(adapter, requests_backend.PoolAdapter)
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+
+    def test_backend_keeps_default_adapters_without_pool_options(self) -> None:
+        backend = requests_backend.RequestsBackend()
+
+        adapter = backend.client.get_adapter("https://gitlab.example.com")
+        assert not isinstance(adapter, requests_backend.PoolAdapter)
+        assert backend.pool_stats() == []
+
+    def test_backend_keeps_custom_session_adapters(self) -> None:
+        session = requests.Session()
+        adapter = session.get_adapter("https://gitlab.example.com")
+
+        backend = requests_backend.RequestsBackend(session=session)
+
+        assert backend.client.get_adapter("https://gitlab.example.com") is adapter
+        assert backend.pool_stats() == []
+
+    def test_pool_stats(self, server) -> None:
+        backend = requests_backend.RequestsBackend(pool_maxsize=4)
+        url = f"http://127.0.0.1:{server.server_port}/"
+
+        for _ in range(3):
+            backend.http_request("get", url)
+
+        assert backend.pool_stats() == [
+            requests_backend.PoolStats(
+                host=f"http://127.0.0.1:{server.server_port}",
+                in_use=0,
+                idle=1,
+                maxsize=4,
+                requests=3,
+                discarded=0,
+            )
+        ]
+        assert len(server.clients) == 1
+
+    def test_pool_stats_count_discarded_connections(self, server) -> None:
+        backend = requests_backend.RequestsBackend(pool_maxsize=1)
+        url = f"http://127.0.0.1:{server.server_port}/"
+
+        streamed = [backend.http_request("get", url, stream=True) for _ in range(2)]
+        (stats,) = backend.pool_stats()
+        assert stats.in_use == 2
+
+        for result in streamed:
+            result.response.close()
+        (stats,) = backend.pool_stats()
+        assert (stats.in_use, stats.idle, stats.discarded) == (0, 1, 1)
+
+    def test_idle_connections_are_closed(self, server) -> None:
+        backend = requests_backend.RequestsBackend(pool_idle_timeout=0)
+        url = f"http://127.0.0.1:{server.server_port}/"
+
+        backend.http_request("get", url)
+        backend.http_request("get", url)
+
+        assert len(server.clients) == 2
@@ -10,6 +10,10 @@ from tests.unit import helpers
 from tests.unit.helpers import FakeManager  # noqa: F401, needed for _create_managers
 
 
+class ObjectWithManager(helpers.FakeObject):
+    fakes: FakeManager
+
+
 def test_instantiate(gl, fake_manager):
     attrs = {"foo": "bar"}
     obj = helpers.FakeObject(fake_manager, attrs.copy())
@@ -142,6 +146,43 @@ def test_create_managers(gl, fake_manager):
     assert obj.fakes._parent == obj
 
 
+def test_managers_are_created_on_access(gl, fake_manager):
+    obj = ObjectWithManager(fake_manager, {"id": 42})
+    assert obj.__dict__ == {}
+    assert "fakes" in dir(obj)
+
+    fakes = obj.fakes
+    assert obj.__dict__ == {"fakes": fakes}
+    assert obj.fakes is fakes
+
+
+def test_manager_classes_are_scanned_once_per_class(fake_manager):
+    class ChildObject(ObjectWithManager):
+        others: FakeManager
+
+    assert ObjectWithManager._get_manager_classes() == {"fakes": FakeManager}
+    assert ChildObject._get_manager_classes() == {"others": FakeManager}
+    assert helpers.FakeObject._get_manager_classes() == {}
+    assert (
+        ObjectWithManager._get_manager_classes()
+        is ObjectWithManager._get_manager_classes()
+    )
+
+
+def test_picklability_with_created_managers(fake_manager):
+    obj = ObjectWithManager(fake_manager, {"id": 42})
+    obj.foo = "bar"
+    obj.fakes
+
+    unpickled = pickle.loads(pickle.dumps(obj))
+
+    assert unpickled._attrs == {"id": 42}
+    assert unpickled._updated_attrs == {"foo": "bar"}
+    assert unpickled.manager.path == "/tests"
+    assert unpickled.fakes.path == "/tests"
+    assert unpickled.fakes._parent is unpickled
+
+
 def test_equality(fake_manager):
     obj1 = helpers.FakeObject(fake_manager, {"id": "foo"})
     obj2 = helpers.FakeObject(fake_manager, {"id": "foo", "other_attr": "bar"})
@@ -332,3 +373,78 @@ def test_asdict_modify_object(fake_object):
     # asdict() returns the updated value
     fake_object.attr1 = "spam"
     assert fake_object.asdict() == {"attr1": "spam", "alist": [1, 2, 3]}
+
+
+def test_reading_list_attribute_does_not_mark_it_updated(fake_object):
+    alist = fake_object.alist
+
+    assert alist == [1, 2, 3]
+    assert isinstance(alist, list)
+    assert fake_object.alist is alist
+    assert fake_object._updated_attrs == {}
+
+
+def test_list_attribute_changed_in_place_is_updated(fake_object):
+    fake_object.alist.append(4)
+    fake_object.alist.remove(1)
+
+    assert fake_object.alist == [2, 3, 4]
+    assert fake_object._updated_attrs == {"alist": [2, 3, 4]}
+    # The server value is kept
+    assert fake_object._attrs["alist"] == [1, 2, 3]
+    assert type(fake_object.asdict()["alist"]) is list
+
+
+def test_dict_attribute_changed_in_place_is_updated(fake_manager):
+    obj = helpers.FakeObject(fake_manager, {"adict": {"a": 1}, "attr1": "foo"})
+
+    assert obj.adict["a"] == 1
+    assert obj._updated_attrs == {}
+    obj.adict["b"] = 2
+
+    assert obj._updated_attrs == {"adict": {"a": 1, "b": 2}}
+    assert obj._attrs["adict"] == {"a": 1}
+
+
+def test_list_attribute_changed_after_update_is_not_tracked(fake_object):
+    alist = fake_object.alist
+    fake_object._update_attrs({"alist": [5]})
+
+    alist.append(4)
+
+    assert fake_object._updated_attrs == {}
+    assert fake_object.alist == [5]
+
+
+def test_tracked_attributes_are_pickled_as_plain_containers(fake_object):
+    fake_object.alist.append(4)
+
+    unpickled = pickle.loads(pickle.dumps(fake_object))
+
+    assert type(unpickled._updated_attrs["alist"]) is list
+    assert unpickled.alist == [1, 2, 3, 4]
+
+
+def test_attributes_view_is_read_only(fake_object_with_parent):
+    view = fake_object_with_parent.attributes_view
+
+    assert dict(view) == {"attr1": "foo", "alist": [1, 2, 3], "test_id": "42"}
+    with pytest.raises(TypeError):
+        view["attr1"] = "bar"
+
+
+def test_attributes_view_reflects_updates(fake_object):
+    view = fake_object.attributes_view
+
+    fake_object.attr1 = "hello"
+
+    assert view["attr1"] == "hello"
+    assert fake_object._attrs["attr1"] == "foo"
+
+
+def test_asdict_without_copy_shares_values(fake_object):
+    result = fake_object.asdict(copy=False)
+
+    assert result == {"attr1": "foo", "alist": [1, 2, 3]}
+    assert result["alist"] is fake_object._attrs["alist"]
+    assert fake_object.asdict()["alist"] is not fake_object._attrs["alist"]
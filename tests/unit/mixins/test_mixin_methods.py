@@ -1,10 +1,13 @@
+import datetime
+import json
 from unittest.mock import mock_open, patch
+from urllib import parse
 
 import pytest
 import requests
 import responses
 
-from gitlab import base, GitlabUploadError
+from gitlab import base, GitlabGetError, GitlabUploadError, mixins
 from gitlab import types as gl_types
 from gitlab.mixins import (
     CreateMixin,
@@ -53,6 +56,41 @@ def test_get_mixin(gl):
     assert responses.assert_call_count(url, 1) is True
 
 
+@responses.activate
+def test_get_many_mixin(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    for obj_id in (1, 2, 3):
+        responses.add(
+            method=responses.GET,
+            url=f"http://localhost/api/v4/tests/{obj_id}",
+            json={"id": obj_id},
+            status=200,
+        )
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests/4",
+        json={"message": "404 Not Found"},
+        status=404,
+    )
+
+    mgr = M(gl)
+    result = mgr.get_many([3, 4, 1, 2], concurrency=2)
+
+    assert [obj.id for obj in result if isinstance(obj, FakeObject)] == [3, 1, 2]
+    assert isinstance(result[1], GitlabGetError)
+    assert result[1].response_code == 404
+    assert len(responses.calls) == 4
+
+
+def test_get_many_mixin_empty(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    assert M(gl).get_many([]) == []
+
+
 def test_get_mixin_lazy(gl):
     class M(GetMixin, FakeManager):
         pass
@@ -95,6 +133,126 @@ def test_get_mixin_lazy_missing_attribute(gl):
     ) in message
 
 
+@responses.activate
+def test_get_mixin_lazy_auto_hydrate(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    for obj_id in (1, 2, 3):
+        responses.add(
+            method=responses.GET,
+            url=f"http://localhost/api/v4/tests/{obj_id}",
+            json={"id": obj_id, "foo": f"bar{obj_id}"},
+            status=200,
+        )
+    gl.auto_hydrate = True
+    mgr = M(gl)
+    objs = mgr.get_many([1, 2, 3], lazy=True)
+    assert repr(objs[0]) and not responses.calls
+
+    # The first access retrieves the other lazy objects of the batch as well
+    assert objs[0].foo == "bar1"
+    assert len(responses.calls) == 3
+    assert [obj.foo for obj in objs] == ["bar1", "bar2", "bar3"]
+    assert not any(obj._lazy for obj in objs)
+    assert len(responses.calls) == 3
+    with pytest.raises(AttributeError):
+        objs[0].missing_attribute
+
+
+@responses.activate
+def test_get_mixin_lazy_auto_hydrate_single_object(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests/1",
+        json={"id": 1, "foo": "bar"},
+        status=200,
+    )
+    gl.auto_hydrate = True
+    mgr = M(gl)
+    objs = [mgr.get(obj_id, lazy=True) for obj_id in (1, 2)]
+
+    # Objects created by get() are not hydrated with others
+    assert objs[0].foo == "bar"
+    assert len(responses.calls) == 1
+    assert objs[1]._lazy is True
+
+
+@responses.activate
+def test_get_mixin_lazy_auto_hydrate_batch_error(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests/1",
+        json={"id": 1, "foo": "bar"},
+        status=200,
+    )
+    responses.add(
+        method=responses.GET, url="http://localhost/api/v4/tests/2", status=404
+    )
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests/2",
+        json={"id": 2, "foo": "baz"},
+        status=200,
+    )
+    gl.auto_hydrate = True
+    objs = M(gl).get_many([1, 2], lazy=True)
+
+    assert objs[0].foo == "bar"
+    assert len(responses.calls) == 2
+    # The error is raised by the object it belongs to, which is retried next
+    with pytest.raises(GitlabGetError):
+        objs[1].foo
+    assert len(responses.calls) == 2
+    assert objs[1].foo == "baz"
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_get_mixin_lazy_auto_hydrate_error(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    responses.add(
+        method=responses.GET, url="http://localhost/api/v4/tests/1", status=404
+    )
+    gl.auto_hydrate = True
+    obj = M(gl).get(1, lazy=True)
+
+    with pytest.raises(GitlabGetError):
+        obj.foo
+    assert obj._lazy is True
+
+
+@responses.activate
+def test_hydrate_mixin_keeps_local_changes(gl):
+    class M(GetMixin, FakeManager):
+        pass
+
+    for obj_id in (1, 2):
+        responses.add(
+            method=responses.GET,
+            url=f"http://localhost/api/v4/tests/{obj_id}",
+            json={"id": obj_id, "foo": "bar"},
+            status=200,
+        )
+    mgr = M(gl)
+    objs = [mgr.get(obj_id, lazy=True) for obj_id in (1, 2)]
+    objs[1].foo = "baz"
+
+    result = mgr.hydrate(objs)
+
+    assert result == objs
+    assert [obj.foo for obj in objs] == ["bar", "baz"]
+    assert objs[1]._updated_attrs == {"foo": "baz"}
+
+
 @responses.activate
 def test_head_mixin(gl):
     class M(GetMixin, FakeManager):
@@ -228,6 +386,351 @@ def test_list_mixin_with_attributes(gl):
     mgr.list(iterator=True, my_array=[1, 2, 3])
 
 
+@responses.activate
+def test_list_mixin_iter_dicts(gl):
+    class M(ListMixin, FakeManager):
+        _types = {"my_array": gl_types.ArrayAttribute}
+
+    url = "http://localhost/api/v4/tests"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"id": 43, "foo": "baz", "bar": 2}],
+        status=200,
+        match=[
+            responses.matchers.query_param_matcher(
+                {"my_array[]": ["1", "2"], "page": "2"}
+            )
+        ],
+    )
+    responses.add(
+        method=responses.GET,
+        headers={"Link": f'<{url}?my_array[]=1&my_array[]=2&page=2>; rel="next"'},
+        url=url,
+        json=[{"id": 42, "foo": "bar", "bar": 1}],
+        status=200,
+        match=[responses.matchers.query_param_matcher({"my_array[]": ["1", "2"]})],
+    )
+
+    mgr = M(gl)
+    items = mgr.iter_dicts(fields=["id", "foo", "missing"], my_array=[1, 2])
+
+    assert isinstance(items, base.RESTDictList)
+    assert list(items) == [{"id": 42, "foo": "bar"}, {"id": 43, "foo": "baz"}]
+
+
+@responses.activate
+def test_list_mixin_iter_dicts_without_fields(gl):
+    class M(ListMixin, FakeManager):
+        pass
+
+    url = "http://localhost/api/v4/tests"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"id": 42, "foo": "bar"}],
+        status=200,
+        match=[responses.matchers.query_param_matcher({})],
+    )
+
+    assert list(M(gl).iter_dicts()) == [{"id": 42, "foo": "bar"}]
+
+
+class KeysetManager(ListMixin, FakeManager):
+    _keyset_order_by = "id"
+
+
+class DescKeysetManager(KeysetManager):
+    _keyset_sort = "desc"
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"get_all": True},
+        {"iterator": True, "pagination": "auto"},
+        {"get_all": True, "pagination": "auto"},
+        {"get_all": True, "pagination": "auto", "order_by": "id"},
+    ],
+)
+def test_list_mixin_switches_to_keyset_pagination(gl, kwargs):
+    url = "http://localhost/api/v4/tests"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"id": 42, "foo": "bar"}],
+        status=200,
+        match=[
+            responses.matchers.query_param_matcher(
+                {"pagination": "keyset", "order_by": "id"}
+            )
+        ],
+    )
+
+    mgr = KeysetManager(gl)
+    assert mgr.supports_keyset_pagination
+    assert [obj.id for obj in mgr.list(**kwargs)] == [42]
+
+
+@responses.activate
+def test_list_mixin_switches_to_keyset_pagination_globally(gl):
+    url = "http://localhost/api/v4/tests"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"id": 42, "foo": "bar"}],
+        status=200,
+        match=[
+            responses.matchers.query_param_matcher(
+                {"pagination": "keyset", "order_by": "id", "sort": "desc"}
+            )
+        ],
+    )
+    gl.pagination = "auto"
+
+    mgr = DescKeysetManager(gl)
+    assert [obj.id for obj in mgr.list(get_all=True, sort="desc")] == [42]
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"iterator": True},
+        {"get_all": False, "pagination": "auto"},
+        {"get_all": True, "order_by": "name"},
+        {"get_all": True, "pagination": "auto", "page": 2},
+        {"get_all": True, "pagination": "auto", "order_by": "name"},
+        {"get_all": True, "pagination": "offset"},
+    ],
+)
+def test_list_mixin_keeps_offset_pagination(gl, kwargs):
+    query = {
+        key: str(value)
+        for key, value in kwargs.items()
+        if key not in ("get_all", "iterator") and value != "auto"
+    }
+    url = "http://localhost/api/v4/tests"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"id": 42, "foo": "bar"}],
+        status=200,
+        match=[responses.matchers.query_param_matcher(query)],
+    )
+
+    mgr = KeysetManager(gl)
+    assert [obj.id for obj in mgr.list(**kwargs)] == [42]
+
+
+@responses.activate
+@pytest.mark.parametrize("sort", ["asc", None])
+def test_list_mixin_keyset_pagination_requires_sort(gl, sort):
+    url = "http://localhost/api/v4/tests"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"id": 42, "foo": "bar"}],
+        status=200,
+        match=[
+            responses.matchers.query_param_matcher(
+                {"sort": "asc"} if sort else {"pagination": "keyset", "order_by": "id"}
+            )
+        ],
+    )
+
+    kwargs = {"sort": sort} if sort else {}
+    mgr = DescKeysetManager(gl)
+    assert [obj.id for obj in mgr.list(get_all=True, pagination="auto", **kwargs)]
+
+
+@responses.activate
+def test_list_mixin_without_keyset_support(gl):
+    class M(ListMixin, FakeManager):
+        pass
+
+    url = "http://localhost/api/v4/tests"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"id": 42, "foo": "bar"}],
+        status=200,
+        match=[responses.matchers.query_param_matcher({})],
+    )
+
+    mgr = M(gl)
+    assert not mgr.supports_keyset_pagination
+    assert [obj.id for obj in mgr.list(get_all=True, pagination="auto")] == [42]
+
+
+class ShardedManager(ListMixin, FakeManager):
+    _shard_filters = {"created_at": ("created_after", "created_before")}
+
+
+def created_at(hour):
+    return f"2024-01-01T{hour:02d}:00:00Z"
+
+
+def windowed_items(request, items):
+    """Return the items created in the window of the request, 3 per page."""
+    query = parse.parse_qs(parse.urlparse(request.url).query)
+    after = datetime.datetime.fromisoformat(query["created_after"][0])
+    before = datetime.datetime.fromisoformat(query["created_before"][0])
+    selected = [
+        item
+        for item in items
+        if after <= datetime.datetime.fromisoformat(item["created_at"]) <= before
+    ]
+    pages = max(1, -(-len(selected) // 3))
+    headers = {"X-Total-Pages": str(pages), "X-Total": str(len(selected))}
+    return 200, headers, json.dumps(selected[:3])
+
+
+@responses.activate
+def test_list_mixin_sharded_subdivides_dense_windows(gl, monkeypatch):
+    monkeypatch.setattr(mixins, "_SHARD_MAX_PAGES", 1)
+    items = [{"id": hour, "created_at": created_at(hour)} for hour in range(12)]
+    responses.add_callback(
+        responses.GET,
+        "http://localhost/api/v4/tests",
+        callback=lambda request: windowed_items(request, items),
+    )
+
+    mgr = ShardedManager(gl)
+    objs = mgr.list(
+        shard_by="created_at",
+        shards=2,
+        since=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        until="2024-01-01T11:00:00+00:00",
+    )
+
+    assert [obj.id for obj in objs] == list(reversed(range(12)))
+    assert all(isinstance(obj, FakeObject) for obj in objs)
+    # Both initial windows were too dense and split
+    assert len(responses.calls) > 2
+    query = parse.parse_qs(parse.urlparse(responses.calls[0].request.url).query)
+    assert "pagination" not in query
+
+
+@responses.activate
+def test_list_mixin_sharded_sorts_ascending(gl):
+    items = [{"id": hour, "created_at": created_at(hour)} for hour in range(3)]
+    responses.add_callback(
+        responses.GET,
+        "http://localhost/api/v4/tests",
+        callback=lambda request: windowed_items(request, items),
+    )
+
+    mgr = ShardedManager(gl)
+    objs = mgr.list(
+        shard_by="created_at",
+        since="2024-01-01T00:00:00+00:00",
+        until="2024-01-01T02:00:00+00:00",
+        sort="asc",
+    )
+
+    assert [obj.id for obj in objs] == [0, 1, 2]
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    "since, until",
+    [
+        (datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 1, 2)),
+        ("2024-01-01", "2024-01-01T02:00:00"),
+        ("2024-01-01T00:00:00Z", "2024-01-01T02:00:00Z"),
+        ("2024-01-01T00:00:00.000Z", "2024-01-01T02:00:00z"),
+    ],
+)
+def test_list_mixin_sharded_bounds_default_to_utc(gl, since, until):
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests",
+        json=[{"id": 42, "created_at": created_at(1)}],
+        status=200,
+        match=[
+            responses.matchers.query_param_matcher(
+                {
+                    "created_after": "2024-01-01T00:00:00+00:00",
+                    "created_before": "2024-01-01T02:00:00+00:00",
+                }
+            )
+        ],
+    )
+
+    objs = ShardedManager(gl).list(
+        shard_by="created_at", shards=1, since=since, until=until
+    )
+
+    assert [obj.id for obj in objs] == [42]
+
+
+@responses.activate
+@pytest.mark.parametrize("since", [datetime.datetime(2024, 1, 1), "2024-01-01"])
+def test_list_mixin_sharded_until_defaults_to_now(gl, since):
+    responses.add(
+        method=responses.GET, url="http://localhost/api/v4/tests", json=[], status=200
+    )
+
+    assert ShardedManager(gl).list(shard_by="created_at", shards=1, since=since) == []
+    query = parse.parse_qs(parse.urlparse(responses.calls[0].request.url).query)
+    assert query["created_after"] == ["2024-01-01T00:00:00+00:00"]
+    assert query["created_before"][0].endswith("+00:00")
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"shard_by": "id", "since": "2024-01-01"}, "'created_at'"),
+        ({"shard_by": "updated_at", "since": "2024-01-01"}, "'created_at'"),
+        ({"shard_by": "created_at"}, "start of the period"),
+        (
+            {"shard_by": "created_at", "since": "2024-01-01", "iterator": True},
+            "iterator",
+        ),
+    ],
+)
+def test_list_mixin_sharded_validates_arguments(gl, kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        ShardedManager(gl).list(**kwargs)
+
+
+def test_list_mixin_sharded_requires_shard_filters(gl):
+    with pytest.raises(ValueError, match="supported time attributes: none"):
+        KeysetManager(gl).list(shard_by="created_at", since="2024-01-01")
+
+
+@responses.activate
+def test_list_mixin_sharded_uses_declared_filters(gl):
+    class M(ListMixin, FakeManager):
+        _shard_filters = {"updated_at": ("updated_after", "updated_before")}
+
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests",
+        json=[{"id": 42, "updated_at": created_at(1)}],
+        status=200,
+        match=[
+            responses.matchers.query_param_matcher(
+                {
+                    "updated_after": "2024-01-01T00:00:00+00:00",
+                    "updated_before": "2024-01-01T02:00:00+00:00",
+                }
+            )
+        ],
+    )
+
+    objs = M(gl).list(
+        shard_by="updated_at",
+        shards=1,
+        since="2024-01-01T00:00:00+00:00",
+        until="2024-01-01T02:00:00+00:00",
+    )
+
+    assert [obj.id for obj in objs] == [42]
+
+
 @responses.activate
 def test_list_other_url(gl):
     class M(ListMixin, FakeManager):
@@ -466,6 +969,33 @@ def test_save_mixin(gl):
     assert responses.assert_call_count(url, 1) is True
 
 
+@responses.activate
+def test_save_mixin_sends_only_changed_lists(gl):
+    class M(UpdateMixin, FakeManager):
+        pass
+
+    class TestClass(SaveMixin, base.RESTObject):
+        pass
+
+    url = "http://localhost/api/v4/tests/42"
+    responses.add(
+        method=responses.PUT,
+        url=url,
+        json={"id": 42, "labels": ["a"], "assignees": [1, 2]},
+        status=200,
+        match=[responses.matchers.json_params_matcher({"assignees": [1, 2]})],
+    )
+
+    mgr = M(gl)
+    obj = TestClass(mgr, {"id": 42, "labels": ["a"], "assignees": [1]})
+    assert obj.labels == ["a"]
+    obj.assignees.append(2)
+    obj.save()
+
+    assert obj._updated_attrs == {}
+    assert responses.assert_call_count(url, 1) is True
+
+
 @responses.activate
 def test_save_mixin_without_new_data(gl):
     class M(UpdateMixin, FakeManager):
@@ -0,0 +1,400 @@
+import anyio
+import httpx
+import pytest
+import respx
+
+import gitlab
+from gitlab.coalesce import RequestCoalescer
+from gitlab.v4.objects import Project
+
+pytestmark = pytest.mark.anyio
+
+API_URL = "http://localhost/api/v4"
+
+
+@pytest.fixture
+def gl_async() -> gitlab.AsyncGitlab:
+    return gitlab.AsyncGitlab(
+        "http://localhost", private_token="private_token", api_version="4"
+    )
+
+
+async def test_async_gitlab_as_context_manager_aexits():
+    async with gitlab.AsyncGitlab("http://localhost") as gl:
+        assert isinstance(gl, gitlab.AsyncGitlab)
+        assert isinstance(gl.session, httpx.AsyncClient)
+    assert gl.session.is_closed
+
+
+def test_async_gitlab_selects_httpx_backend_by_name():
+    gl = gitlab.AsyncGitlab("http://localhost", backend="httpx")
+    assert isinstance(gl.session, httpx.AsyncClient)
+
+    with pytest.raises(ValueError, match="only supports the httpx backend"):
+        gitlab.AsyncGitlab("http://localhost", backend="requests")
+
+    with pytest.raises(ValueError, match="cannot be retrieved on access"):
+        gitlab.AsyncGitlab("http://localhost", auto_hydrate=True)
+
+
+async def test_async_http_get_sends_auth_header(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    route = respx_mock.get(f"{API_URL}/projects/1").mock(
+        return_value=httpx.Response(200, json={"id": 1, "name": "project1"})
+    )
+
+    result = await gl_async.http_get("/projects/1")
+
+    assert result == {"id": 1, "name": "project1"}
+    assert route.calls.last.request.headers["PRIVATE-TOKEN"] == "private_token"
+
+
+async def test_async_manager_get(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    respx_mock.get(f"{API_URL}/projects/1").mock(
+        return_value=httpx.Response(200, json={"id": 1, "name": "project1"})
+    )
+
+    project = await gl_async.projects.get(1)
+
+    assert isinstance(project, Project)
+    assert project.name == "project1"
+    assert project.issues.gitlab is gl_async
+
+
+async def test_async_manager_get_raises_get_error(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    respx_mock.get(f"{API_URL}/projects/1").mock(
+        return_value=httpx.Response(404, json={"message": "404 Not Found"})
+    )
+
+    with pytest.raises(gitlab.GitlabGetError, match="404 Not Found"):
+        await gl_async.projects.get(1)
+
+
+async def test_async_manager_list_get_all(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    respx_mock.get(f"{API_URL}/projects", params={"page": "2"}).mock(
+        return_value=httpx.Response(200, json=[{"id": 2}])
+    )
+    respx_mock.get(f"{API_URL}/projects").mock(
+        return_value=httpx.Response(
+            200,
+            json=[{"id": 1}],
+            headers={"Link": f'<{API_URL}/projects?page=2>; rel="next"'},
+        )
+    )
+
+    projects = await gl_async.projects.list(get_all=True)
+
+    assert [project.id for project in projects] == [1, 2]
+
+
+async def test_async_http_list_rejects_prefetch(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    route = respx_mock.get(f"{API_URL}/projects").mock(
+        return_value=httpx.Response(200, json=[{"id": 1}])
+    )
+
+    with pytest.raises(ValueError, match="prefetched"):
+        await gl_async.http_list("/projects", get_all=True, prefetch=4)
+    items = await gl_async.http_list("/projects", get_all=True, prefetch=None)
+
+    assert items == [{"id": 1}]
+    assert "prefetch" not in route.calls.last.request.url.params
+
+
+async def test_async_manager_list_iterator(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    respx_mock.get(f"{API_URL}/projects", params={"page": "2"}).mock(
+        return_value=httpx.Response(200, json=[{"id": 2}])
+    )
+    respx_mock.get(f"{API_URL}/projects").mock(
+        return_value=httpx.Response(
+            200,
+            json=[{"id": 1}],
+            headers={
+                "Link": f'<{API_URL}/projects?page=2>; rel="next"',
+                "X-Total": "2",
+            },
+        )
+    )
+
+    projects = await gl_async.projects.list(iterator=True)
+
+    assert len(projects) == 2
+    assert [project.id async for project in projects] == [1, 2]
+
+
+async def test_async_manager_iter_dicts(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    respx_mock.get(f"{API_URL}/projects", params={"page": "2"}).mock(
+        return_value=httpx.Response(200, json=[{"id": 2, "name": "two"}])
+    )
+    respx_mock.get(f"{API_URL}/projects").mock(
+        return_value=httpx.Response(
+            200,
+            json=[{"id": 1, "name": "one"}],
+            headers={"Link": f'<{API_URL}/projects?page=2>; rel="next"'},
+        )
+    )
+
+    projects = await gl_async.projects.iter_dicts(fields=["id"])
+
+    assert [project async for project in projects] == [{"id": 1}, {"id": 2}]
+
+
+async def test_async_manager_create_update_delete(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    respx_mock.post(f"{API_URL}/projects").mock(
+        return_value=httpx.Response(201, json={"id": 1, "name": "project1"})
+    )
+    respx_mock.put(f"{API_URL}/projects/1").mock(
+        return_value=httpx.Response(200, json={"id": 1, "name": "renamed"})
+    )
+    delete_route = respx_mock.delete(f"{API_URL}/projects/1").mock(
+        return_value=httpx.Response(204)
+    )
+
+    project = await gl_async.projects.create({"name": "project1"})
+    project.name = "renamed"
+    await project.save()
+    assert project.name == "renamed"
+
+    await project.delete()
+    assert delete_route.called
+
+
+async def test_async_http_request_retries_on_429(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    respx_mock.get(f"{API_URL}/projects/1").mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"id": 1}),
+        ]
+    )
+
+    assert await gl_async.http_get("/projects/1") == {"id": 1}
+
+
+async def test_async_http_request_raises_authentication_error(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    respx_mock.get(f"{API_URL}/user").mock(
+        return_value=httpx.Response(401, json={"message": "401 Unauthorized"})
+    )
+
+    with pytest.raises(gitlab.GitlabAuthenticationError):
+        await gl_async.auth()
+
+
+def test_rest_object_list_async_iteration_requires_async_client(gl):
+    with pytest.raises(TypeError, match="AsyncGitlab"):
+        gitlab.base.RESTObjectList(gl.projects, Project, []).__anext__().send(None)
+
+
+async def test_async_http_get_revalidates_cached_response(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    gl_async.cache = gitlab.cache.MemoryCache()
+    route = respx_mock.get(f"{API_URL}/projects/1").mock(
+        side_effect=[
+            httpx.Response(200, json={"id": 1}, headers={"ETag": '"abc"'}),
+            httpx.Response(304, headers={"ETag": '"abc"'}),
+        ]
+    )
+
+    assert await gl_async.http_get("/projects/1") == {"id": 1}
+    assert await gl_async.http_get("/projects/1") == {"id": 1}
+
+    assert route.calls.last.request.headers["If-None-Match"] == '"abc"'
+    assert gl_async.cache.revalidations == 1
+
+
+async def test_async_manager_get_many(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    respx_mock.get(f"{API_URL}/projects/1").mock(
+        return_value=httpx.Response(200, json={"id": 1})
+    )
+    respx_mock.get(f"{API_URL}/projects/2").mock(
+        return_value=httpx.Response(404, json={"message": "404 Not Found"})
+    )
+    respx_mock.get(f"{API_URL}/projects/3").mock(
+        return_value=httpx.Response(200, json={"id": 3})
+    )
+
+    projects = await gl_async.projects.get_many([3, 2, 1], concurrency=2)
+
+    assert projects[0].id == 3
+    assert isinstance(projects[1], gitlab.GitlabGetError)
+    assert projects[2].id == 1
+
+
+async def test_async_manager_list_streamed(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter, monkeypatch
+):
+    monkeypatch.setattr(gitlab.client, "_STREAM_CHUNK_SIZE", 4)
+    respx_mock.get(f"{API_URL}/projects", params={"page": "2"}).mock(
+        return_value=httpx.Response(200, json=[{"id": 3}])
+    )
+    respx_mock.get(f"{API_URL}/projects").mock(
+        return_value=httpx.Response(
+            200,
+            json=[{"id": 1}, {"id": 2}],
+            headers={"Link": f'<{API_URL}/projects?page=2>; rel="next"'},
+        )
+    )
+
+    projects = await gl_async.projects.list(iterator=True, streamed=True)
+
+    assert [project.id async for project in projects] == [1, 2, 3]
+
+
+async def test_async_identical_gets_in_flight_share_one_request(
+    respx_mock: respx.MockRouter,
+):
+    coalescer = RequestCoalescer()
+    gl = gitlab.AsyncGitlab("http://localhost", coalescer=coalescer)
+    release = anyio.Event()
+
+    async def respond(request):
+        await release.wait()
+        return httpx.Response(200, json={"id": 1, "name": "project1"})
+
+    route = respx_mock.get(f"{API_URL}/projects/1").mock(side_effect=respond)
+    results = []
+
+    async def get():
+        results.append(await gl.http_get("/projects/1"))
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(get)
+        task_group.start_soon(get)
+        while coalescer.saved < 1:
+            await anyio.sleep(0)
+        release.set()
+
+    assert results == [{"id": 1, "name": "project1"}] * 2
+    assert route.call_count == 1
+    assert (coalescer.calls, coalescer.saved) == (1, 1)
+
+
+async def test_async_manager_list_sharded(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    issues = [
+        {"id": hour, "created_at": f"2024-01-01T{hour:02d}:00:00Z"} for hour in range(5)
+    ]
+
+    def respond(request):
+        after = request.url.params["created_after"]
+        before = request.url.params["created_before"]
+        return httpx.Response(
+            200,
+            json=[i for i in issues if after[:13] <= i["created_at"][:13] <= before],
+            headers={"X-Total-Pages": "1"},
+        )
+
+    respx_mock.get(f"{API_URL}/issues").mock(side_effect=respond)
+
+    result = await gl_async.issues.list(
+        shard_by="created_at",
+        shards=2,
+        since="2024-01-01T00:00:00+00:00",
+        until="2024-01-01T04:00:00+00:00",
+    )
+
+    assert [issue.id for issue in result] == [4, 3, 2, 1, 0]
+
+
+async def test_async_manager_list_sharded_raises_list_error(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    respx_mock.get(f"{API_URL}/issues").mock(
+        return_value=httpx.Response(500, json={"message": "error"})
+    )
+
+    with pytest.raises(gitlab.GitlabListError):
+        await gl_async.issues.list(
+            shard_by="created_at", since="2024-01-01T00:00:00+00:00"
+        )
+
+
+async def test_async_event_hooks_describe_request(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    respx_mock.get(f"{API_URL}/projects/1").mock(
+        return_value=httpx.Response(200, json={"id": 1, "name": "project1"})
+    )
+    events = []
+    gl_async.event_hooks.on_response.append(events.append)
+
+    await gl_async.projects.get(1)
+
+    assert len(events) == 1
+    assert events[0].url_template == "/projects/{id}"
+    assert (events[0].manager, events[0].operation) == ("ProjectManager", "get")
+    assert gl_async.stats()["endpoints"]["GET /projects/{id}"]["statuses"] == {"200": 1}
+
+
+async def test_async_get_returns_mapped_object(respx_mock: respx.MockRouter):
+    route = respx_mock.get(f"{API_URL}/projects/1").mock(
+        return_value=httpx.Response(200, json={"id": 1, "name": "project1"})
+    )
+    gl_async = gitlab.AsyncGitlab(
+        "http://localhost", identity_map=gitlab.identity.IdentityMap()
+    )
+
+    project = await gl_async.projects.get(1)
+
+    assert await gl_async.projects.get(1) is project
+    assert route.call_count == 1
+
+
+async def test_async_get_by_path_resolves_cached_id_again_after_404(
+    respx_mock: respx.MockRouter,
+):
+    by_path = respx_mock.get(f"{API_URL}/projects/group%2Fproject").mock(
+        side_effect=[
+            httpx.Response(200, json={"id": 1, "path_with_namespace": "group/project"}),
+            httpx.Response(200, json={"id": 2, "path_with_namespace": "group/project"}),
+        ]
+    )
+    by_id = respx_mock.get(f"{API_URL}/projects/1").mock(
+        return_value=httpx.Response(404, json={"message": "404 Project Not Found"})
+    )
+    gl_async = gitlab.AsyncGitlab(
+        "http://localhost", path_cache=gitlab.path_cache.PathCache()
+    )
+    await gl_async.projects.get("group/project")
+
+    project = await gl_async.projects.get("group/project")
+
+    assert project.id == 2
+    assert (by_path.call_count, by_id.call_count) == (2, 1)
+    assert gl_async.projects.get("group/project", lazy=True).id == 2
+
+
+async def test_async_manager_hydrate(
+    gl_async: gitlab.AsyncGitlab, respx_mock: respx.MockRouter
+):
+    for project_id in (1, 2):
+        respx_mock.get(f"{API_URL}/projects/{project_id}").mock(
+            return_value=httpx.Response(200, json={"id": project_id, "name": "p"})
+        )
+    projects = [gl_async.projects.get(project_id, lazy=True) for project_id in (1, 2)]
+
+    result = await gl_async.projects.hydrate(projects)
+
+    assert result == projects
+    assert [project.name for project in projects] == ["p", "p"]
@@ -0,0 +1,142 @@
+import threading
+import time
+
+import pytest
+import requests
+import responses
+
+import gitlab
+from gitlab.batch import BatchExecutor
+
+ISSUES_URL = "http://localhost/api/v4/projects/1/issues"
+
+
+@pytest.fixture
+def issues(gl):
+    return gl.projects.get(1, lazy=True).issues
+
+
+@responses.activate
+def test_batch_reports_successes_and_failures(gl, issues):
+    responses.add(responses.POST, ISSUES_URL, json={"iid": 3, "title": "new"})
+    responses.add(responses.PUT, f"{ISSUES_URL}/1", json={"iid": 1, "labels": ["a"]})
+    responses.add(
+        responses.DELETE,
+        f"{ISSUES_URL}/2",
+        json={"message": "404 Not Found"},
+        status=404,
+    )
+
+    with gl.batch(max_workers=2) as batch:
+        batch.create(issues, {"title": "new"})
+        batch.update(issues, 1, {"labels": "a"})
+        batch.delete(issues, 2)
+
+    report = batch.report
+    assert sorted(r.operation for r in report.succeeded) == ["create", "update"]
+    assert [r.path for r in report.failed] == ["/projects/1/issues/2"]
+    assert isinstance(report.failed[0].error, gitlab.GitlabDeleteError)
+    assert report.retries == 0
+
+
+def test_batch_reports_other_exceptions(gl, issues, monkeypatch):
+    def delete(id, **kwargs):
+        if id == 2:
+            raise KeyError("iid")
+        return None
+
+    monkeypatch.setattr(issues, "delete", delete)
+
+    with gl.batch(retries=2) as batch:
+        batch.delete(issues, 1)
+        batch.delete(issues, 2)
+
+    assert [r.path for r in batch.report.succeeded] == ["/projects/1/issues/1"]
+    failed = batch.report.failed[0]
+    assert failed.path == "/projects/1/issues/2"
+    assert isinstance(failed.error, KeyError)
+    assert failed.attempts == 1
+
+
+@responses.activate
+def test_batch_retries_transient_errors(gl, issues, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+    responses.add(responses.DELETE, f"{ISSUES_URL}/1", status=503)
+    responses.add(responses.DELETE, f"{ISSUES_URL}/1", status=204)
+
+    with gl.batch(retries=2) as batch:
+        batch.delete(issues, 1)
+
+    assert len(batch.report.succeeded) == 1
+    assert batch.report.succeeded[0].attempts == 2
+    assert batch.report.retries == 1
+
+
+@responses.activate
+def test_batch_retries_connection_errors(gl, issues, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+    responses.add(
+        responses.DELETE, f"{ISSUES_URL}/1", body=requests.ConnectionError("down")
+    )
+
+    with gl.batch(retries=1) as batch:
+        batch.delete(issues, 1)
+
+    assert batch.report.failed[0].attempts == 2
+    assert isinstance(batch.report.failed[0].error, requests.ConnectionError)
+
+
+@responses.activate
+def test_batch_checkpoint_skips_completed_operations(gl, issues, tmp_path):
+    checkpoint = str(tmp_path / "checkpoint")
+    responses.add(responses.DELETE, f"{ISSUES_URL}/1", status=204)
+    responses.add(
+        responses.DELETE,
+        f"{ISSUES_URL}/2",
+        json={"message": "500 Internal Server Error"},
+        status=500,
+    )
+
+    with gl.batch(checkpoint=checkpoint) as batch:
+        batch.delete(issues, 1)
+        batch.delete(issues, 2)
+    assert len(batch.report.failed) == 1
+
+    responses.replace(responses.DELETE, f"{ISSUES_URL}/2", status=204)
+    with gl.batch(checkpoint=checkpoint) as batch:
+        batch.delete(issues, 1)
+        batch.delete(issues, 2)
+
+    assert [r.key for r in batch.report.skipped] == ["delete /projects/1/issues/1"]
+    assert [r.key for r in batch.report.succeeded] == ["delete /projects/1/issues/2"]
+    assert len(responses.calls) == 3
+
+
+def test_batch_limits_concurrency_per_host(gl, issues, monkeypatch):
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def delete(*args, **kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    monkeypatch.setattr(issues, "delete", delete)
+
+    with gl.batch(max_workers=8, per_host=2) as batch:
+        for iid in range(10):
+            batch.delete(issues, iid)
+
+    assert len(batch.report.succeeded) == 10
+    assert peak <= 2
+
+
+def test_batch_requires_synchronous_client():
+    gl_async = gitlab.AsyncGitlab("http://localhost")
+    with pytest.raises(TypeError, match="synchronous"):
+        BatchExecutor(gl_async)
@@ -0,0 +1,216 @@
+import pickle
+import time
+
+import pytest
+import responses
+
+import gitlab
+from gitlab.cache import CachedResponse, MemoryCache, SQLiteCache
+
+URL = "http://localhost/api/v4/projects/1"
+
+
+def _response(url=URL, content=b"{}", etag='"abc"', ttl=0.0):
+    return CachedResponse.create(
+        url=url,
+        status_code=200,
+        headers=[("ETag", etag), ("Content-Length", "2")],
+        content=content,
+        ttl=ttl,
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache_factory(request, tmp_path):
+    def factory(**kwargs):
+        if request.param == "memory":
+            return MemoryCache(**kwargs)
+        return SQLiteCache(str(tmp_path / "cache.sqlite"), **kwargs)
+
+    return factory
+
+
+@pytest.fixture
+def gl_cache(gl):
+    gl.cache = MemoryCache()
+    return gl
+
+
+def test_cached_response_create_drops_transfer_headers():
+    response = _response()
+
+    assert response.etag == '"abc"'
+    assert response.headers == {"ETag": '"abc"'}
+
+
+def test_cached_response_is_fresh():
+    assert _response(ttl=60).is_fresh()
+    assert not _response(ttl=0).is_fresh()
+
+
+def test_ttl_for_uses_first_matching_rule():
+    cache = MemoryCache(ttl=5, ttl_rules=[("/projects/*/pipelines*", 30)])
+
+    assert cache.ttl_for("/projects/1/pipelines") == 30
+    assert cache.ttl_for("/projects/1/pipelines/2") == 30
+    assert cache.ttl_for("/projects/1") == 5
+
+
+def test_cache_get_set(cache_factory):
+    cache = cache_factory()
+    cache.set("key", _response(ttl=60))
+
+    response = cache.get("key")
+
+    assert response.content == b"{}"
+    assert response.etag == '"abc"'
+    assert response.is_fresh()
+    assert cache.get("missing") is None
+
+
+def test_cache_pickle(cache_factory):
+    cache = cache_factory()
+    cache.set("key", _response(ttl=60))
+
+    gl = pickle.loads(pickle.dumps(gitlab.Gitlab(cache=cache)))
+
+    assert gl.cache.get("key").content == b"{}"
+    gl.cache.set("other", _response())
+    assert len(gl.cache) == 2
+
+
+def test_cache_evicts_least_recently_used_entries(cache_factory):
+    cache = cache_factory(max_entries=2)
+    cache.set("a", _response())
+    time.sleep(0.01)
+    cache.set("b", _response())
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.set("c", _response())
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+def test_cache_evicts_entries_exceeding_max_size(cache_factory):
+    cache = cache_factory(max_size=10)
+    cache.set("a", _response(content=b"123456"))
+    time.sleep(0.01)
+    cache.set("b", _response(content=b"123456"))
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+
+
+def test_cache_invalidate(cache_factory):
+    cache = cache_factory()
+    cache.set("project", _response())
+    cache.set("issues", _response(url=f"{URL}/issues"))
+    cache.set("other", _response(url=f"{URL}0"))
+
+    cache.invalidate(URL)
+
+    assert cache.get("project") is None
+    assert cache.get("issues") is None
+    assert cache.get("other") is not None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_persists_responses(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = SQLiteCache(path)
+    cache.set("key", _response(ttl=60))
+    cache.close()
+
+    response = SQLiteCache(path).get("key")
+
+    assert response.content == b"{}"
+    assert response.is_fresh()
+
+
+@responses.activate
+def test_http_get_revalidates_with_etag(gl_cache):
+    responses.add(
+        responses.GET,
+        URL,
+        json={"id": 1},
+        headers={"ETag": '"abc"'},
+        match=[responses.matchers.header_matcher({}, strict_match=False)],
+    )
+
+    assert gl_cache.http_get("/projects/1") == {"id": 1}
+    assert "If-None-Match" not in responses.calls[0].request.headers
+
+    responses.replace(responses.GET, URL, status=304, headers={"ETag": '"abc"'})
+
+    assert gl_cache.http_get("/projects/1") == {"id": 1}
+    assert responses.calls[1].request.headers["If-None-Match"] == '"abc"'
+    assert gl_cache.cache.revalidations == 1
+    assert gl_cache.cache.misses == 1
+
+
+@responses.activate
+def test_http_get_serves_fresh_responses_without_request(gl_cache):
+    gl_cache.cache.ttl_rules = [("/projects/*", 60)]
+    responses.add(responses.GET, URL, json={"id": 1})
+
+    assert gl_cache.http_get("/projects/1") == {"id": 1}
+    assert gl_cache.http_get("/projects/1") == {"id": 1}
+
+    assert len(responses.calls) == 1
+    assert gl_cache.cache.hits == 1
+
+
+@responses.activate
+def test_http_get_does_not_cache_without_etag_or_ttl(gl_cache):
+    responses.add(responses.GET, URL, json={"id": 1})
+
+    gl_cache.http_get("/projects/1")
+    gl_cache.http_get("/projects/1")
+
+    assert len(responses.calls) == 2
+    assert len(gl_cache.cache) == 0
+
+
+@responses.activate
+def test_http_get_cache_key_includes_query_and_credentials(gl_cache):
+    responses.add(responses.GET, URL, json={"id": 1}, headers={"ETag": '"abc"'})
+
+    gl_cache.http_get("/projects/1", query_data={"statistics": True})
+    gl_cache.http_get("/projects/1")
+    gl_cache.private_token = "other"
+    gl_cache.http_get("/projects/1")
+
+    assert len(gl_cache.cache) == 3
+    assert all("If-None-Match" not in c.request.headers for c in responses.calls)
+
+
+@responses.activate
+def test_http_put_invalidates_cached_responses(gl_cache):
+    gl_cache.cache.ttl = 60
+    responses.add(responses.GET, URL, json={"id": 1, "name": "old"})
+    responses.add(responses.PUT, URL, json={"id": 1, "name": "new"})
+
+    gl_cache.http_get("/projects/1")
+    gl_cache.http_put("/projects/1", post_data={"name": "new"})
+
+    assert len(gl_cache.cache) == 0
+
+
+@responses.activate
+def test_http_get_negative_ttl_disables_cache(gl_cache):
+    gl_cache.cache.ttl_rules = [("/projects/*", -1)]
+    responses.add(responses.GET, URL, json={"id": 1}, headers={"ETag": '"abc"'})
+
+    gl_cache.http_get("/projects/1")
+
+    assert len(gl_cache.cache) == 0
+
+
+def test_gitlab_accepts_cache_argument():
+    cache = MemoryCache()
+    assert gitlab.Gitlab(cache=cache).cache is cache
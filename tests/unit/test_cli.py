@@ -231,3 +231,14 @@ def test_legacy_display_with_long_repr_truncates(fake_object_long_repr):
         printer.display(fake_object_long_repr, obj=fake_object_long_repr)
 
     assert len(mocked.call_args.args[0]) < 80
+
+
+def test_json_display_uses_json_codec(capsys):
+    codec = gitlab.json_codecs.get_codec("orjson")
+    if codec.name != "orjson":
+        pytest.skip("orjson is not installed")
+
+    v4_cli.JSONPrinter.display({"id": 1}, json_codec=codec)
+    v4_cli.JSONPrinter.display({"id": 1})
+
+    assert capsys.readouterr().out == '{"id":1}\n{"id": 1}\n'
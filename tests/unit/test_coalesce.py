@@ -0,0 +1,146 @@
+import pickle
+import threading
+import time
+
+import pytest
+import responses
+
+import gitlab
+from gitlab.coalesce import RequestCoalescer
+
+PROJECT_URL = "http://localhost/api/v4/projects/1"
+
+
+@pytest.fixture
+def coalescer():
+    return RequestCoalescer()
+
+
+@pytest.fixture
+def gl_coalesce(coalescer):
+    return gitlab.Gitlab(
+        "http://localhost", private_token="private_token", coalescer=coalescer
+    )
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_coalescer_shares_result_of_call_in_flight(coalescer):
+    release = threading.Event()
+
+    def function():
+        release.wait(5)
+        return {"id": 1, "namespace": {"id": 2}}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(coalescer.do("key", function)))
+        for _ in range(2)
+    ]
+    threads[0].start()
+    wait_for(lambda: coalescer.calls == 1)
+    threads[1].start()
+    wait_for(lambda: coalescer.saved == 1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [{"id": 1, "namespace": {"id": 2}}] * 2
+    assert results[0]["namespace"] is not results[1]["namespace"]
+    assert (coalescer.calls, coalescer.saved) == (1, 1)
+
+
+def test_coalescer_does_not_share_completed_calls(coalescer):
+    assert coalescer.do("key", lambda: 1) == 1
+    assert coalescer.do("key", lambda: 2) == 2
+    assert (coalescer.calls, coalescer.saved) == (2, 0)
+
+
+def test_coalescer_pickle(gl_coalesce, coalescer):
+    coalescer.do("key", lambda: 1)
+
+    unpickled = pickle.loads(pickle.dumps(gl_coalesce))
+
+    assert unpickled.coalescer.calls == 1
+    assert unpickled.coalescer.do("key", lambda: 2) == 2
+
+
+def test_coalescer_shares_exceptions(coalescer):
+    release = threading.Event()
+    errors = []
+
+    def function():
+        release.wait(5)
+        raise ValueError("failed")
+
+    def run():
+        try:
+            coalescer.do("key", function)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(2)]
+    threads[0].start()
+    wait_for(lambda: coalescer.calls == 1)
+    threads[1].start()
+    wait_for(lambda: coalescer.saved == 1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 2
+    assert errors[0] is errors[1]
+
+
+@responses.activate
+def test_identical_gets_in_flight_share_one_request(gl_coalesce, coalescer):
+    release = threading.Event()
+
+    def callback(request):
+        release.wait(5)
+        return 200, {"Content-Type": "application/json"}, '{"id": 1, "name": "one"}'
+
+    responses.add_callback(responses.GET, PROJECT_URL, callback=callback)
+
+    projects = []
+    threads = [
+        threading.Thread(target=lambda: projects.append(gl_coalesce.projects.get(1)))
+        for _ in range(2)
+    ]
+    threads[0].start()
+    wait_for(lambda: coalescer.calls == 1)
+    threads[1].start()
+    wait_for(lambda: coalescer.saved == 1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert [project.name for project in projects] == ["one", "one"]
+    assert len(responses.calls) == 1
+
+
+def test_coalesce_key_depends_on_request(gl_coalesce):
+    key = gl_coalesce._coalesce_key("/projects/1", {}, False, False, {})
+
+    assert key == gl_coalesce._coalesce_key("/projects/1", {}, False, False, {})
+    assert key != gl_coalesce._coalesce_key("/projects/2", {}, False, False, {})
+    assert key != gl_coalesce._coalesce_key(
+        "/projects/1", {"statistics": True}, False, False, {}
+    )
+    assert key != gl_coalesce._coalesce_key(
+        "/projects/1", {}, False, False, {"sudo": "user"}
+    )
+    assert key != gl_coalesce._coalesce_key("/projects/1", {}, False, True, {})
+    assert gl_coalesce._coalesce_key("/projects/1", {}, True, False, {}) is None
+
+    gl_coalesce.private_token = "other_token"
+    assert key != gl_coalesce._coalesce_key("/projects/1", {}, False, False, {})
+
+
+def test_coalesce_key_without_coalescer(gl):
+    assert gl._coalesce_key("/projects/1", {}, False, False, {}) is None
@@ -55,6 +55,47 @@ url = http://one.url
 private_token = ABCDEF
 """
 
+json_codec_config = """[global]
+default = one
+json_codec = json
+
+[one]
+url = http://one.url
+private_token = ABCDEF
+json_codec = orjson
+"""
+
+backend_config = """[global]
+default = one
+backend = requests
+
+[one]
+url = http://one.url
+private_token = ABCDEF
+backend = httpx
+"""
+
+pool_config = """[global]
+default = one
+pool_maxsize = 8
+pool_block = true
+
+[one]
+url = http://one.url
+private_token = ABCDEF
+pool_maxsize = 64
+pool_idle_timeout = 30.5
+"""
+
+path_cache_config = """[global]
+default = one
+path_cache = ~/.cache/python-gitlab/ids.json
+
+[one]
+url = http://one.url
+private_token = ABCDEF
+"""
+
 no_default_config = """[global]
 [there]
 url = http://there.url
@@ -382,3 +423,60 @@ def test_config_retry_transient_errors_when_global_config_is_set(
         m.setattr(Path, "resolve", _mock_existent_file)
         cp = config.GitlabConfigParser()
     assert cp.retry_transient_errors == expected
+
+
+@mock.patch("builtins.open")
+@pytest.mark.parametrize(
+    "config_string,expected", [(valid_config, None), (json_codec_config, "orjson")]
+)
+def test_config_json_codec(m_open, monkeypatch, config_string, expected):
+    fd = io.StringIO(config_string)
+    fd.close = mock.Mock(return_value=None)
+    m_open.return_value = fd
+
+    with monkeypatch.context() as m:
+        m.setattr(Path, "resolve", _mock_existent_file)
+        cp = config.GitlabConfigParser()
+    assert cp.json_codec == expected
+
+
+@mock.patch("builtins.open")
+@pytest.mark.parametrize(
+    "config_string,expected", [(valid_config, None), (backend_config, "httpx")]
+)
+def test_config_backend(m_open, monkeypatch, config_string, expected):
+    fd = io.StringIO(config_string)
+    fd.close = mock.Mock(return_value=None)
+    m_open.return_value = fd
+
+    with monkeypatch.context() as m:
+        m.setattr(Path, "resolve", _mock_existent_file)
+        cp = config.GitlabConfigParser()
+    assert cp.backend == expected
+
+
+@mock.patch("builtins.open")
+def test_config_pool_options(m_open, monkeypatch):
+    fd = io.StringIO(pool_config)
+    fd.close = mock.Mock(return_value=None)
+    m_open.return_value = fd
+
+    with monkeypatch.context() as m:
+        m.setattr(Path, "resolve", _mock_existent_file)
+        cp = config.GitlabConfigParser()
+    assert cp.pool_connections is None
+    assert cp.pool_maxsize == 64
+    assert cp.pool_block is True
+    assert cp.pool_idle_timeout == 30.5
+
+
+@mock.patch("builtins.open")
+def test_config_path_cache(m_open, monkeypatch):
+    fd = io.StringIO(path_cache_config)
+    fd.close = mock.Mock(return_value=None)
+    m_open.return_value = fd
+
+    with monkeypatch.context() as m:
+        m.setattr(Path, "resolve", _mock_existent_file)
+        cp = config.GitlabConfigParser()
+    assert cp.path_cache == "~/.cache/python-gitlab/ids.json"
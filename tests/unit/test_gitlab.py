@@ -207,6 +207,124 @@ def test_gitlab_get_all_omitted_when_iterator(gl, resp_page_1, resp_page_2):
     assert isinstance(result, gitlab.GitlabList)
 
 
+def _paginated_responses(total_pages, *, with_totals=True):
+    """Register one `/tests` response per page, each linking to the next one."""
+    for page in range(1, total_pages + 1):
+        headers = {"X-Page": str(page), "X-Per-Page": "1"}
+        if with_totals:
+            headers.update({"X-Total-Pages": str(total_pages), "X-Total": "3"})
+        if page < total_pages:
+            headers["Link"] = (
+                f'<http://localhost/api/v4/tests?page={page + 1}>; rel="next"'
+            )
+        params = {} if page == 1 else {"page": str(page)}
+        responses.add(
+            method=responses.GET,
+            url="http://localhost/api/v4/tests",
+            json=[{"page": page}],
+            headers=headers,
+            status=200,
+            match=[responses.matchers.query_param_matcher(params)],
+        )
+
+
+@responses.activate
+def test_gitlab_list_prefetch_fetches_pages_in_order(gl):
+    _paginated_responses(3)
+
+    obj = gl.http_list("/tests", iterator=True, prefetch=2)
+    assert obj._executor is not None
+
+    assert [item["page"] for item in obj] == [1, 2, 3]
+    assert len(responses.calls) == 3
+    assert obj._executor is None
+
+
+@responses.activate
+def test_gitlab_list_prefetch_get_all(gl):
+    _paginated_responses(3)
+
+    result = gl.http_list("/tests", get_all=True, prefetch=4)
+
+    assert [item["page"] for item in result] == [1, 2, 3]
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_gitlab_list_prefetch_falls_back_without_totals(gl):
+    _paginated_responses(3, with_totals=False)
+
+    obj = gl.http_list("/tests", iterator=True, prefetch=2)
+    assert obj._executor is None
+
+    assert [item["page"] for item in obj] == [1, 2, 3]
+
+
+@responses.activate
+def test_gitlab_list_prefetch_close_stops_prefetching(gl):
+    _paginated_responses(5)
+
+    with gl.http_list("/tests", iterator=True, prefetch=1) as obj:
+        executor = obj._executor
+        assert next(obj) == {"page": 1}
+
+    assert obj._executor is None
+    assert executor._shutdown
+    assert len(responses.calls) <= 3
+
+
+@responses.activate
+def test_gitlab_list_prefetch_raises_page_errors(gl):
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests",
+        json=[{"page": 1}],
+        headers={"X-Page": "1", "X-Total-Pages": "2"},
+        status=200,
+        match=[responses.matchers.query_param_matcher({})],
+    )
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests",
+        json={"message": "500 Internal Server Error"},
+        status=500,
+        match=[responses.matchers.query_param_matcher({"page": "2"})],
+    )
+
+    obj = gl.http_list("/tests", iterator=True, prefetch=2)
+    assert next(obj) == {"page": 1}
+    with pytest.raises(gitlab.GitlabHttpError):
+        next(obj)
+
+
+@responses.activate
+def test_gitlab_list_streamed_decodes_items_incrementally(gl, monkeypatch):
+    monkeypatch.setattr(gitlab.client, "_STREAM_CHUNK_SIZE", 4)
+    _paginated_responses(3)
+
+    obj = gl.http_list("/tests", iterator=True, streamed=True, prefetch=2)
+    assert obj._executor is None
+
+    assert [item["page"] for item in obj] == [1, 2, 3]
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_gitlab_list_streamed_raises_parsing_error(gl):
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests",
+        body='[{"id": 1}, {"id": ',
+        content_type="application/json",
+        status=200,
+    )
+
+    obj = gl.http_list("/tests", iterator=True, streamed=True)
+    assert next(obj) == {"id": 1}
+    with pytest.raises(gitlab.GitlabParsingError):
+        next(obj)
+
+
 def test_gitlab_strip_base_url(gl_trailing):
     assert gl_trailing.url == "http://localhost"
 
@@ -443,3 +561,28 @@ def test_custom_session(default_config):
     )
 
     assert test_gitlab.session == custom_session
+
+
+def test_pool_options_are_passed_to_backend():
+    gl = gitlab.Gitlab(
+        "http://localhost",
+        pool_connections=2,
+        pool_maxsize=64,
+        pool_block=True,
+        pool_idle_timeout=30,
+    )
+
+    adapter = gl.session.get_adapter("http://localhost")
+    assert isinstance(adapter, gitlab._backends.PoolAdapter)
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+    assert adapter.pool_idle_timeout == 30
+    assert gl.pool_stats() == []
+
+
+def test_pool_stats_without_backend_support(monkeypatch):
+    gl = gitlab.Gitlab("http://localhost")
+    monkeypatch.delattr(type(gl._backend), "pool_stats")
+
+    assert gl.pool_stats() == []
@@ -1,9 +1,24 @@
+import json
+from unittest import mock
+
+import graphql
 import httpx
 import pytest
 import respx
 
 import gitlab
 
+SCHEMA = """
+type User {
+  id: ID!
+  name: String
+}
+
+type Query {
+  currentUser: User
+}
+"""
+
 
 @pytest.fixture(scope="module")
 def api_url() -> str:
@@ -114,3 +129,121 @@ async def test_async_graphql_raises_on_401_response(
     respx_mock.post(api_url).mock(return_value=httpx.Response(401))
     with pytest.raises(gitlab.GitlabAuthenticationError):
         await gl_async_gql.execute("query {currentUser {id}}")
+
+
+def test_graphql_shares_circuit_breaker_with_rest_client(
+    api_url: str, respx_mock: respx.MockRouter
+):
+    policy = gitlab.retry.RetryPolicy(
+        circuit_breaker=gitlab.retry.CircuitBreaker(failure_threshold=1)
+    )
+    route = respx_mock.post(api_url).mock(return_value=httpx.Response(502))
+    gl_gql = gitlab.GraphQL("https://gitlab.example.com", retry_policy=policy)
+    gl = gitlab.Gitlab("https://gitlab.example.com", retry_policy=policy)
+
+    with pytest.raises(gitlab.GitlabHttpError):
+        gl_gql.execute("query {currentUser {id}}")
+    with pytest.raises(gitlab.GitlabCircuitOpenError):
+        gl_gql.execute("query {currentUser {id}}")
+    with pytest.raises(gitlab.GitlabCircuitOpenError):
+        gl.http_get("/projects")
+    assert route.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_async_graphql_fails_fast_when_circuit_is_open(
+    api_url: str, respx_mock: respx.MockRouter
+):
+    policy = gitlab.retry.RetryPolicy(
+        circuit_breaker=gitlab.retry.CircuitBreaker(failure_threshold=1)
+    )
+    route = respx_mock.post(api_url).mock(return_value=httpx.Response(502))
+    gl_async_gql = gitlab.AsyncGraphQL(
+        "https://gitlab.example.com", retry_policy=policy
+    )
+
+    with pytest.raises(gitlab.GitlabHttpError):
+        await gl_async_gql.execute("query {currentUser {id}}")
+    with pytest.raises(gitlab.GitlabCircuitOpenError):
+        await gl_async_gql.execute("query {currentUser {id}}")
+    assert route.call_count == 1
+
+
+def test_graphql_caches_parsed_documents(
+    api_url: str, gl_gql: gitlab.GraphQL, respx_mock: respx.MockRouter
+):
+    respx_mock.post(api_url).mock(
+        return_value=httpx.Response(200, json={"data": {"currentUser": None}})
+    )
+    query = "query {currentUser {id}}"
+
+    for _ in range(3):
+        gl_gql.execute(query)
+
+    assert gl_gql.document_cache.misses == 1
+    assert gl_gql.document_cache.hits == 2
+
+
+def test_graphql_document_cache_evicts_least_recently_used():
+    gl_gql = gitlab.GraphQL("https://gitlab.example.com", document_cache_size=2)
+    first = gl_gql.compile("query {currentUser {id}}")
+    gl_gql.compile("query {currentUser {name}}")
+    assert gl_gql.compile("query {currentUser {id}}") is first
+
+    gl_gql.compile("query {currentUser {username}}")
+
+    assert len(gl_gql.document_cache) == 2
+    assert gl_gql.compile("query {currentUser {id}}") is first
+    assert gl_gql.document_cache.misses == 3
+    gl_gql.compile("query {currentUser {name}}")
+    assert gl_gql.document_cache.misses == 4
+
+
+# Variables passed to execute() are deprecated by gql>=4
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_graphql_executes_compiled_documents(
+    api_url: str, gl_gql: gitlab.GraphQL, respx_mock: respx.MockRouter
+):
+    route = respx_mock.post(api_url).mock(
+        return_value=httpx.Response(200, json={"data": {"project": None}})
+    )
+    document = gl_gql.compile("query ($path: ID!) {project(fullPath: $path) {id}}")
+
+    gl_gql.execute(document, variable_values={"path": "group/a"})
+    gl_gql.execute(document, variable_values={"path": "group/b"})
+
+    payloads = [json.loads(call.request.content) for call in route.calls]
+    assert [payload["variables"] for payload in payloads] == [
+        {"path": "group/a"},
+        {"path": "group/b"},
+    ]
+    assert getattr(document, "variable_values", None) is None
+
+
+def test_graphql_validates_documents_once_against_schema(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    validate = mock.Mock(wraps=graphql.validate)
+    monkeypatch.setattr(graphql, "validate", validate)
+    gl_gql = gitlab.GraphQL("https://gitlab.example.com", schema=SCHEMA)
+
+    gl_gql.compile("query {currentUser {id}}")
+    gl_gql.compile("query {currentUser {id}}")
+
+    assert validate.call_count == 1
+    with pytest.raises(graphql.GraphQLError, match="unknown"):
+        gl_gql.compile("query {currentUser {unknown}}")
+
+
+@pytest.mark.anyio
+async def test_async_graphql_caches_parsed_documents(
+    api_url: str, gl_async_gql: gitlab.AsyncGraphQL, respx_mock: respx.MockRouter
+):
+    respx_mock.post(api_url).mock(
+        return_value=httpx.Response(200, json={"data": {"currentUser": None}})
+    )
+
+    await gl_async_gql.execute("query {currentUser {id}}")
+    await gl_async_gql.execute("query {currentUser {id}}")
+
+    assert gl_async_gql.document_cache.hits == 1
@@ -0,0 +1,151 @@
+import pickle
+import time
+
+import pytest
+import responses
+
+import gitlab
+from gitlab.identity import IdentityMap
+from gitlab.v4.objects import Project
+
+API_URL = "http://localhost/api/v4"
+
+
+@pytest.fixture
+def identity_map():
+    return IdentityMap(ttl=60)
+
+
+@pytest.fixture
+def gl_map(identity_map):
+    return gitlab.Gitlab(
+        "http://localhost", private_token="private_token", identity_map=identity_map
+    )
+
+
+@responses.activate
+def test_get_returns_fresh_object_without_request(gl_map, identity_map):
+    responses.add(responses.GET, f"{API_URL}/projects/1", json={"id": 1, "name": "a"})
+
+    project = gl_map.projects.get(1)
+
+    assert gl_map.projects.get(1) is project
+    assert gl_map.projects.get("1") is project
+    assert len(responses.calls) == 1
+    assert (identity_map.hits, identity_map.misses) == (2, 1)
+
+
+@responses.activate
+def test_get_requests_stale_object_again(gl_map, identity_map, monkeypatch):
+    responses.add(responses.GET, f"{API_URL}/projects/1", json={"id": 1, "name": "a"})
+    responses.add(responses.GET, f"{API_URL}/projects/1", json={"id": 1, "name": "b"})
+    project = gl_map.projects.get(1)
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+    assert gl_map.projects.get(1) is project
+    assert project.name == "b"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_get_with_options_bypasses_map(gl_map):
+    responses.add(responses.GET, f"{API_URL}/projects/1", json={"id": 1})
+    project = gl_map.projects.get(1)
+
+    assert gl_map.projects.get(1, statistics=True) is not project
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_list_merges_partial_data(gl_map):
+    responses.add(
+        responses.GET,
+        f"{API_URL}/projects",
+        json=[{"id": 1, "name": "listed"}, {"id": 2, "name": "other"}],
+    )
+    responses.add(
+        responses.GET,
+        f"{API_URL}/projects/1",
+        json={"id": 1, "name": "full", "statistics": {"commit_count": 3}},
+    )
+
+    listed = gl_map.projects.list()
+    assert listed[0]._created_from_list
+    # Listed objects are partial, get() requests the full data
+    project = gl_map.projects.get(1)
+
+    assert project is listed[0]
+    assert not project._created_from_list
+    assert project.statistics == {"commit_count": 3}
+
+    responses.add(responses.GET, f"{API_URL}/projects", json=[{"id": 1, "name": "x"}])
+    assert gl_map.projects.list()[0] is project
+    assert project.name == "x"
+    assert project.statistics == {"commit_count": 3}
+
+
+@responses.activate
+def test_save_invalidates_object(gl_map, identity_map):
+    responses.add(responses.GET, f"{API_URL}/projects/1", json={"id": 1, "name": "a"})
+    responses.add(responses.PUT, f"{API_URL}/projects/1", json={"id": 1, "name": "b"})
+    project = gl_map.projects.get(1)
+    project.name = "b"
+
+    project.save()
+
+    assert len(identity_map) == 0
+    assert gl_map.projects.get(1) is not project
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_delete_and_refresh_invalidate_object(gl_map, identity_map):
+    responses.add(responses.GET, f"{API_URL}/projects/1", json={"id": 1})
+    responses.add(responses.DELETE, f"{API_URL}/projects/1", status=204)
+    project = gl_map.projects.get(1)
+
+    project.refresh()
+    assert len(identity_map) == 0
+
+    gl_map.projects.get(1).delete()
+    assert len(identity_map) == 0
+
+
+def test_map_evicts_least_recently_used(gl_map):
+    identity_map = IdentityMap(maxsize=2)
+    manager = gl_map.projects
+    first = identity_map.add(manager, Project, {"id": 1}, complete=True)
+    identity_map.add(manager, Project, {"id": 2}, complete=True)
+    assert identity_map.lookup(manager.path, 1) is first
+
+    identity_map.add(manager, Project, {"id": 3}, complete=True)
+
+    assert identity_map.lookup(manager.path, 1) is first
+    assert identity_map.lookup(manager.path, 2) is None
+
+
+def test_map_keys_encoded_ids(gl_map):
+    identity_map = IdentityMap()
+    manager = gl_map.projects.get(1, lazy=True).branches
+    branch = identity_map.add(
+        manager, manager._obj_cls, {"name": "feature/x"}, complete=True
+    )
+
+    assert identity_map.lookup(manager.path, "feature/x") is branch
+    identity_map.invalidate(manager.path, "feature/x")
+    assert len(identity_map) == 0
+
+
+@responses.activate
+def test_map_pickle(gl_map):
+    responses.add(responses.GET, f"{API_URL}/projects/1", json={"id": 1, "name": "a"})
+    gl_map.projects.get(1)
+
+    unpickled = pickle.loads(pickle.dumps(gl_map))
+
+    project = unpickled.projects.get(1)
+    assert project.name == "a"
+    assert unpickled.projects.get(1) is project
+    assert len(responses.calls) == 1
@@ -0,0 +1,284 @@
+import pickle
+import time
+from unittest import mock
+
+import pytest
+import requests
+import responses
+
+from gitlab.instrumentation import (
+    Hooks,
+    MetricsCollector,
+    OpenTelemetryHooks,
+    RequestEvent,
+)
+
+API_URL = "http://localhost/api/v4"
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def on_request(self, event):
+        self.events.append(("request", event))
+
+    def on_response(self, event):
+        self.events.append(("response", event))
+
+    def on_retry(self, event):
+        self.events.append(("retry", event))
+
+    def on_rate_limited(self, event):
+        self.events.append(("rate_limited", event))
+
+
+@pytest.fixture
+def recorder(gl):
+    recorder = Recorder()
+    gl.event_hooks.subscribe(recorder)
+    return recorder
+
+
+@responses.activate
+def test_hooks_describe_manager_request(gl, recorder):
+    responses.add(
+        responses.GET,
+        f"{API_URL}/projects/1/issues/2",
+        json={"id": 12, "iid": 2, "project_id": 1},
+        status=200,
+    )
+
+    gl.projects.get(1, lazy=True).issues.get(2)
+
+    assert [name for name, _ in recorder.events] == ["request", "response"]
+    event = recorder.events[1][1]
+    assert event.method == "GET"
+    assert event.url == f"{API_URL}/projects/1/issues/2"
+    assert event.url_template == "/projects/{id}/issues/{id}"
+    assert event.manager == "ProjectIssueManager"
+    assert event.operation == "get"
+    assert event.status_code == 200
+    assert event.bytes_received == len(b'{"id": 12, "iid": 2, "project_id": 1}')
+    assert event.elapsed > 0
+    assert event.retries == 0
+
+
+@responses.activate
+def test_hooks_describe_object_request(gl, recorder):
+    responses.add(
+        responses.PUT,
+        f"{API_URL}/projects/1",
+        json={"id": 1, "name": "renamed"},
+        status=200,
+    )
+    project = gl.projects.get(1, lazy=True)
+    project.name = "renamed"
+
+    project.save()
+
+    event = recorder.events[1][1]
+    assert event.method == "PUT"
+    assert event.url_template == "/projects/{id}"
+    assert event.manager == "ProjectManager"
+    assert event.bytes_sent == len(b'{"name": "renamed"}')
+
+
+@responses.activate
+def test_hooks_template_urls_sent_without_manager(gl, recorder):
+    responses.add(responses.GET, f"{API_URL}/projects/group%2Fproject/jobs/34", json={})
+
+    gl.http_get("/projects/group%2Fproject/jobs/34")
+
+    event = recorder.events[1][1]
+    assert event.url_template == "/projects/{id}/jobs/{id}"
+    assert event.manager is None
+    assert event.operation is None
+
+
+@responses.activate
+def test_hooks_report_retries(gl, recorder, monkeypatch):
+    monkeypatch.setattr(time, "sleep", mock.Mock())
+    url = f"{API_URL}/projects"
+    responses.add(responses.GET, url, status=429, headers={"Retry-After": "1"})
+    responses.add(responses.GET, url, status=502)
+    responses.add(responses.GET, url, json=[], status=200)
+
+    gl.http_get("/projects", retry_transient_errors=True)
+
+    assert [name for name, _ in recorder.events] == [
+        "request",
+        "response",
+        "rate_limited",
+        "request",
+        "response",
+        "retry",
+        "request",
+        "response",
+    ]
+    rate_limited = recorder.events[2][1]
+    assert (rate_limited.status_code, rate_limited.wait) == (429, 1)
+    assert recorder.events[5][1].status_code == 502
+    assert [e.retries for name, e in recorder.events if name == "request"] == [0, 1, 2]
+
+
+@responses.activate
+def test_hooks_report_connection_errors(gl, recorder):
+    error = requests.ConnectionError("refused")
+    responses.add(responses.GET, f"{API_URL}/projects", body=error)
+
+    with pytest.raises(requests.ConnectionError):
+        gl.http_get("/projects")
+
+    event = recorder.events[1][1]
+    assert event.error is error
+    assert event.status_code is None
+    assert gl.stats()["endpoints"]["GET /projects"]["statuses"] == {"error": 1}
+
+
+@responses.activate
+def test_failing_hook_does_not_fail_request(gl, caplog):
+    responses.add(responses.GET, f"{API_URL}/projects", json=[])
+    gl.event_hooks.on_response.append(mock.Mock(side_effect=ValueError("oops")))
+
+    assert gl.http_get("/projects") == []
+    assert "on_response hook" in caplog.text
+
+
+def test_hooks_unsubscribe():
+    hooks = Hooks()
+    recorder = Recorder()
+    hooks.subscribe(recorder)
+    hooks.unsubscribe(recorder)
+
+    hooks.emit("on_request", RequestEvent("GET", "url", "/projects"))
+
+    assert recorder.events == []
+
+
+@responses.activate
+def test_stats_count_requests_per_endpoint(gl):
+    responses.add(responses.GET, f"{API_URL}/projects/1", json={"id": 1})
+    responses.add(responses.GET, f"{API_URL}/projects/2", status=404)
+
+    gl.projects.get(1)
+    with pytest.raises(Exception):
+        gl.projects.get(2)
+
+    stats = gl.stats()
+    assert stats["requests"] == 2
+    assert stats["errors"] == 1
+    endpoint = stats["endpoints"]["GET /projects/{id}"]
+    assert endpoint["statuses"] == {"200": 1, "404": 1}
+    assert endpoint["latency"]["buckets"]["+Inf"] == 2
+    assert stats["bytes_received"] > 0
+
+
+@responses.activate
+def test_stats_template_non_numeric_ids(gl):
+    for name in ("a1b2c3", "d4e5f6"):
+        responses.add(
+            responses.GET,
+            f"{API_URL}/projects/1/repository/commits/{name}",
+            json={"id": name},
+        )
+        responses.add(
+            responses.GET,
+            f"{API_URL}/projects/1/repository/branches/feature-{name}",
+            json={"name": f"feature-{name}"},
+        )
+    project = gl.projects.get(1, lazy=True)
+
+    for name in ("a1b2c3", "d4e5f6"):
+        project.commits.get(name)
+        project.branches.get(f"feature-{name}")
+
+    assert sorted(gl.stats()["endpoints"]) == [
+        "GET /projects/{id}/repository/branches/{id}",
+        "GET /projects/{id}/repository/commits/{id}",
+    ]
+
+
+def test_metrics_count_other_endpoints_together():
+    metrics = MetricsCollector(max_endpoints=2)
+
+    for index in range(4):
+        metrics.on_response(
+            RequestEvent("GET", "url", f"/users/user{index}", status_code=200)
+        )
+
+    endpoints = metrics.snapshot()["endpoints"]
+    assert sorted(endpoints) == ["GET /users/user0", "GET /users/user1", "GET {other}"]
+    assert endpoints["GET {other}"]["count"] == 2
+
+
+def test_metrics_prometheus_format():
+    metrics = MetricsCollector()
+    metrics.on_response(
+        RequestEvent("GET", "url", '/projects/{id}"', status_code=200, elapsed=0.02)
+    )
+    metrics.on_retry(RequestEvent("GET", "url", '/projects/{id}"'))
+
+    text = metrics.to_prometheus()
+
+    labels = 'method="GET",endpoint="/projects/{id}\\""'
+    assert f'python_gitlab_requests_total{{{labels},status="200"}} 1' in text
+    assert (
+        f'python_gitlab_request_duration_seconds_bucket{{{labels},le="0.01"}} 0' in text
+    )
+    assert (
+        f'python_gitlab_request_duration_seconds_bucket{{{labels},le="0.025"}} 1'
+        in text
+    )
+    assert f"python_gitlab_request_duration_seconds_count{{{labels}}} 1" in text
+    assert f"python_gitlab_retries_total{{{labels}}} 1" in text
+    assert "# TYPE python_gitlab_request_duration_seconds histogram" in text
+
+
+def test_metrics_reset_and_pickle():
+    metrics = MetricsCollector()
+    metrics.on_response(RequestEvent("GET", "url", "/projects", status_code=200))
+
+    copied = pickle.loads(pickle.dumps(metrics))
+    metrics.reset()
+
+    assert metrics.snapshot()["requests"] == 0
+    assert copied.snapshot()["requests"] == 1
+
+
+def test_opentelemetry_hooks_record_client_spans():
+    tracer = mock.Mock()
+    error = ValueError("boom")
+    hooks = OpenTelemetryHooks(tracer)
+
+    hooks.on_response(
+        RequestEvent(
+            "GET",
+            f"{API_URL}/projects/1",
+            "/projects/{id}",
+            manager="ProjectManager",
+            operation="get",
+            status_code=200,
+            elapsed=0.5,
+            error=error,
+        )
+    )
+
+    name = tracer.start_span.call_args.args[0]
+    options = tracer.start_span.call_args.kwargs
+    assert name == "GET /projects/{id}"
+    assert options["attributes"]["http.response.status_code"] == 200
+    assert options["attributes"]["gitlab.operation"] == "get"
+    span = tracer.start_span.return_value
+    end = span.end.call_args.kwargs["end_time"]
+    assert end - options["start_time"] == 500_000_000
+    span.record_exception.assert_called_once_with(error)
+
+
+def test_opentelemetry_hooks_use_global_tracer():
+    trace = pytest.importorskip("opentelemetry.trace")
+
+    hooks = OpenTelemetryHooks()
+
+    assert hooks.tracer is not None
+    assert hooks._span_options["kind"] == trace.SpanKind.CLIENT
@@ -0,0 +1,86 @@
+import sys
+
+import pytest
+import responses
+
+import gitlab
+from gitlab.json_codecs import get_codec, MsgspecCodec, OrjsonCodec, StdlibCodec
+
+orjson = pytest.importorskip("orjson")
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        (None, StdlibCodec),
+        ("json", StdlibCodec),
+        ("orjson", OrjsonCodec),
+        ("auto", OrjsonCodec),
+    ],
+)
+def test_get_codec(name, expected):
+    assert type(get_codec(name)) is expected
+
+
+def test_get_codec_returns_codec_instances():
+    codec = StdlibCodec()
+    assert get_codec(codec) is codec
+
+
+def test_get_codec_falls_back_to_stdlib(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+
+    assert type(get_codec("orjson")) is StdlibCodec
+    assert type(get_codec("auto")) is StdlibCodec
+
+
+def test_get_codec_unknown_name():
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_codec("simplejson")
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codec_round_trip(name):
+    codec = get_codec(name)
+    if codec.name != name:
+        pytest.skip(f"{name} is not installed")
+    data = {"id": 1, "name": "é", "labels": ["a"], "big": 2**70}
+
+    assert codec.loads(codec.dumps(data)) == data
+
+
+def test_codec_encodes_integer_keys():
+    assert OrjsonCodec().loads(OrjsonCodec().dumps({1: "a"})) == {"1": "a"}
+
+
+def test_msgspec_codec_requires_msgspec(monkeypatch):
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    with pytest.raises(ImportError):
+        MsgspecCodec()
+
+
+@responses.activate
+def test_gitlab_uses_json_codec():
+    gl = gitlab.Gitlab("http://localhost", json_codec="orjson")
+    responses.add(
+        responses.POST,
+        "http://localhost/api/v4/projects",
+        json={"id": 1, "name": "project"},
+        match=[responses.matchers.json_params_matcher({"name": "project"})],
+    )
+
+    assert isinstance(gl.json_codec, OrjsonCodec)
+    assert gl.http_post("/projects", post_data={"name": "project"}) == {
+        "id": 1,
+        "name": "project",
+    }
+    assert responses.calls[0].request.body == b'{"name":"project"}'
+
+
+def test_to_json_uses_json_codec():
+    gl = gitlab.Gitlab("http://localhost", json_codec="orjson")
+    project = gl.projects.get(1, lazy=True)
+
+    assert project.to_json() == '{"id":1}'
+    assert project.to_json(indent=2) == '{\n  "id": 1\n}'
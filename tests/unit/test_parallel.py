@@ -0,0 +1,129 @@
+import threading
+
+import pytest
+import responses
+
+import gitlab
+from gitlab.parallel import GitlabPool, process_map
+from gitlab.ratelimit import RateLimiter
+
+PROJECT_URL = "http://localhost/api/v4/projects"
+
+
+def test_pool_clients_are_thread_local(gl):
+    pool = GitlabPool(gl)
+    clients = []
+    # Keeps both threads alive, so that they do not share a thread ident
+    barrier = threading.Barrier(2)
+
+    def collect():
+        clients.append(pool.client)
+        barrier.wait()
+
+    threads = [threading.Thread(target=collect) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    first, second = clients
+    assert first is not second
+    assert first is not gl
+    assert pool.client is pool.client
+
+
+def test_pool_clients_share_session_and_isolate_state(gl):
+    client = GitlabPool(gl).client
+
+    client.headers["X-Custom"] = "value"
+    client.user = object()
+
+    assert client.session is gl.session
+    assert client._auth is gl._auth
+    assert "X-Custom" not in gl.headers
+    assert gl.user is None
+    assert client.projects.gitlab is client
+    assert gl.projects.gitlab is gl
+
+
+@responses.activate
+def test_pool_map_collects_results_and_errors(gl):
+    responses.add(responses.GET, f"{PROJECT_URL}/1", json={"id": 1, "name": "one"})
+    responses.add(
+        responses.GET, f"{PROJECT_URL}/2", json={"message": "404 Not Found"}, status=404
+    )
+    responses.add(responses.GET, f"{PROJECT_URL}/3", json={"id": 3, "name": "three"})
+
+    with GitlabPool(gl, max_workers=2) as pool:
+        results = pool.map(lambda client, id: client.projects.get(id).name, [1, 2, 3])
+
+    assert [result.item for result in results] == [1, 2, 3]
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].result == "one"
+    assert results[2].result == "three"
+    assert isinstance(results[1].error, gitlab.GitlabGetError)
+
+
+def test_pool_requires_synchronous_client():
+    gl_async = gitlab.AsyncGitlab("http://localhost")
+    with pytest.raises(TypeError, match="synchronous"):
+        GitlabPool(gl_async)
+
+
+def get_project_name(client, id):
+    return client.projects.get(id).name
+
+
+def describe_project(client, project):
+    return (
+        project.manager.gitlab is client,
+        client.session is not None,
+        client.projects.get(project.id, lazy=True),
+    )
+
+
+@responses.activate
+def test_process_map_collects_results_and_errors(gl):
+    responses.add(responses.GET, f"{PROJECT_URL}/1", json={"id": 1, "name": "one"})
+    responses.add(
+        responses.GET, f"{PROJECT_URL}/2", json={"message": "404 Not Found"}, status=404
+    )
+
+    results = list(process_map(gl, get_project_name, [1, 2], max_workers=2))
+
+    assert [result.item for result in results] == [1, 2]
+    assert results[0].result == "one"
+    assert isinstance(results[1].error, gitlab.GitlabGetError)
+
+
+def acquire_rate_limit(client, item):
+    return client.rate_limiter.acquire()
+
+
+def test_process_map_shares_rate_limit_memory(gl):
+    gl.rate_limiter = RateLimiter(rate=1, burst=1, shared_memory=True)
+
+    results = list(process_map(gl, acquire_rate_limit, [1, 2], max_workers=2))
+
+    assert [result.error for result in results] == [None, None]
+    # The workers took the first two seconds of the budget
+    assert gl.rate_limiter.acquire() > 1
+
+
+def test_process_map_rebinds_objects_to_clients(gl):
+    projects = [gl.projects.get(id, lazy=True) for id in range(3)]
+
+    results = list(process_map(gl, describe_project, projects, max_workers=1))
+
+    for project, result in zip(projects, results):
+        bound_to_worker, has_session, returned = result.result
+        assert bound_to_worker
+        assert has_session
+        assert returned.manager.gitlab is gl
+        assert returned.id == project.id
+
+
+def test_process_map_requires_synchronous_client():
+    gl_async = gitlab.AsyncGitlab("http://localhost")
+    with pytest.raises(TypeError, match="synchronous"):
+        process_map(gl_async, get_project_name, [1])
@@ -0,0 +1,163 @@
+import json
+import pickle
+
+import pytest
+import responses
+
+import gitlab
+from gitlab.identity import IdentityMap
+from gitlab.path_cache import PathCache
+from gitlab.utils import EncodedId
+
+API_URL = "http://localhost/api/v4"
+PROJECT = {"id": 1, "path_with_namespace": "group/project"}
+
+
+@pytest.fixture
+def path_cache():
+    return PathCache()
+
+
+@pytest.fixture
+def gl_cache(path_cache):
+    return gitlab.Gitlab(
+        "http://localhost", private_token="private_token", path_cache=path_cache
+    )
+
+
+@responses.activate
+def test_get_by_path_requests_cached_id(gl_cache, path_cache):
+    responses.add(responses.GET, f"{API_URL}/projects/group%2Fproject", json=PROJECT)
+    responses.add(responses.GET, f"{API_URL}/projects/1", json=PROJECT)
+
+    gl_cache.projects.get("group/project")
+    project = gl_cache.projects.get("Group/Project")
+
+    assert project.id == 1
+    assert [call.request.url for call in responses.calls] == [
+        f"{API_URL}/projects/group%2Fproject",
+        f"{API_URL}/projects/1",
+    ]
+    assert (path_cache.hits, path_cache.misses) == (1, 1)
+
+
+@responses.activate
+def test_lazy_get_by_path_uses_cached_id(gl_cache):
+    responses.add(
+        responses.GET, f"{API_URL}/groups/a%2Fb", json={"id": 5, "full_path": "a/b"}
+    )
+    responses.add(responses.GET, f"{API_URL}/groups/5/issues", json=[])
+
+    gl_cache.groups.get("a/b")
+    group = gl_cache.groups.get("a/b", lazy=True)
+    group.issues.list()
+
+    assert group.id == 5
+    assert responses.calls[1].request.url == f"{API_URL}/groups/5/issues"
+
+
+@responses.activate
+def test_get_by_path_resolves_path_again_after_404(gl_cache, path_cache):
+    responses.add(responses.GET, f"{API_URL}/projects/group%2Fproject", json=PROJECT)
+    responses.add(responses.GET, f"{API_URL}/projects/1", status=404)
+    responses.add(
+        responses.GET,
+        f"{API_URL}/projects/group%2Fproject",
+        json={"id": 2, "path_with_namespace": "group/project"},
+    )
+    gl_cache.projects.get("group/project")
+
+    project = gl_cache.projects.get("group/project")
+
+    assert project.id == 2
+    assert path_cache.get(gl_cache.projects, "group/project") == 2
+
+
+@responses.activate
+def test_get_by_path_resolves_path_again_after_rename(gl_cache, path_cache):
+    responses.add(responses.GET, f"{API_URL}/projects/group%2Fproject", json=PROJECT)
+    responses.add(
+        responses.GET,
+        f"{API_URL}/projects/1",
+        json={"id": 1, "path_with_namespace": "group/renamed"},
+    )
+    responses.add(responses.GET, f"{API_URL}/projects/group%2Fproject", status=404)
+    gl_cache.projects.get("group/project")
+
+    with pytest.raises(gitlab.GitlabGetError):
+        gl_cache.projects.get("group/project")
+
+    assert path_cache.get(gl_cache.projects, "group/project") is None
+    assert path_cache.get(gl_cache.projects, "group/renamed") == 1
+
+
+@responses.activate
+def test_update_remembers_new_path(gl_cache, path_cache):
+    responses.add(responses.GET, f"{API_URL}/projects/group%2Fproject", json=PROJECT)
+    responses.add(
+        responses.PUT,
+        f"{API_URL}/projects/1",
+        json={"id": 1, "path_with_namespace": "group/renamed"},
+    )
+    project = gl_cache.projects.get("group/project")
+    project.path = "renamed"
+
+    project.save()
+
+    assert path_cache.get(gl_cache.projects, "group/project") is None
+    assert path_cache.get(gl_cache.projects, "group/renamed") == 1
+
+
+@responses.activate
+def test_delete_forgets_path(gl_cache, path_cache):
+    responses.add(responses.GET, f"{API_URL}/projects/group%2Fproject", json=PROJECT)
+    responses.add(responses.DELETE, f"{API_URL}/projects/1", status=204)
+
+    gl_cache.projects.get("group/project").delete()
+
+    assert len(path_cache) == 0
+
+
+@responses.activate
+def test_get_by_path_shares_identity_map_entry(path_cache):
+    gl = gitlab.Gitlab(
+        "http://localhost", path_cache=path_cache, identity_map=IdentityMap()
+    )
+    responses.add(responses.GET, f"{API_URL}/projects/group%2Fproject", json=PROJECT)
+    project = gl.projects.get("group/project")
+
+    assert gl.projects.get("group/project") is project
+    assert gl.projects.get(1) is project
+    assert len(responses.calls) == 1
+
+
+def test_cache_scoped_per_server_and_manager(gl_cache, path_cache):
+    other = gitlab.Gitlab("http://other", path_cache=path_cache)
+    path_cache.add(gl_cache.projects, PROJECT)
+
+    assert path_cache.get(other.projects, "group/project") is None
+    assert path_cache.get(gl_cache.groups, "group/project") is None
+    assert path_cache.get(gl_cache.projects, EncodedId("group/project")) == 1
+    assert path_cache.get(gl_cache.projects, 1) is None
+
+
+def test_cache_persists_to_file(gl_cache, tmp_path):
+    filename = tmp_path / "cache" / "ids.json"
+    path_cache = PathCache(str(filename))
+    path_cache.add(gl_cache.projects, PROJECT)
+
+    loaded = PathCache(str(filename))
+
+    assert loaded.get(gl_cache.projects, "group/project") == 1
+    assert json.loads(filename.read_text())["version"] == 1
+    assert pickle.loads(pickle.dumps(loaded)).get(gl_cache.projects, "group/project")
+
+
+def test_cache_ignores_invalid_file(gl_cache, tmp_path, caplog):
+    filename = tmp_path / "ids.json"
+    filename.write_text("{")
+
+    path_cache = PathCache(str(filename))
+
+    assert len(path_cache) == 0
+    assert "Ignoring invalid path cache" in caplog.text
@@ -0,0 +1,151 @@
+import multiprocessing
+import pickle
+import time
+
+import pytest
+import responses
+
+import gitlab
+from gitlab.ratelimit import RateLimiter
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(time, "time", lambda: now)
+    return now
+
+
+def test_acquire_allows_burst_then_paces(frozen_time):
+    limiter = RateLimiter(rate=10, burst=3)
+
+    delays = [limiter.acquire() for _ in range(5)]
+
+    assert delays == pytest.approx([0, 0, 0, 0.1, 0.2])
+
+
+def test_acquire_without_rate_does_not_wait(frozen_time):
+    limiter = RateLimiter()
+
+    assert [limiter.acquire() for _ in range(100)] == [0] * 100
+
+
+def test_update_learns_rate_from_limit_header(frozen_time):
+    limiter = RateLimiter(period=60)
+
+    limiter.update({"RateLimit-Limit": "600"})
+
+    assert limiter.rate == 10
+
+
+def test_update_keeps_configured_rate(frozen_time):
+    limiter = RateLimiter(rate=1)
+
+    limiter.update({"RateLimit-Limit": "600"})
+
+    assert limiter.rate == 1
+
+
+def test_update_waits_for_reset_when_exhausted(frozen_time):
+    limiter = RateLimiter(rate=10, burst=3)
+
+    limiter.update(
+        {"RateLimit-Remaining": "0", "RateLimit-Reset": f"{frozen_time + 5}"}
+    )
+
+    assert [limiter.acquire() for _ in range(4)] == pytest.approx([5, 5.1, 5.2, 5.3])
+
+
+def test_update_limits_burst_to_remaining_requests(frozen_time):
+    limiter = RateLimiter(rate=10, burst=5)
+
+    limiter.update({"RateLimit-Remaining": "2"})
+
+    assert [limiter.acquire() for _ in range(3)] == pytest.approx([0, 0, 0.1])
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"RateLimit-Limit": "many", "RateLimit-Remaining": "2"},
+        {"RateLimit-Remaining": "2.5"},
+        {"RateLimit-Remaining": "0", "RateLimit-Reset": "soon"},
+    ],
+)
+def test_update_ignores_malformed_headers(frozen_time, headers):
+    limiter = RateLimiter(rate=10, burst=1)
+
+    limiter.update(headers)
+
+    assert limiter.rate == 10
+    assert limiter.acquire() <= 0.1
+
+
+def test_file_state_is_shared(tmp_path, frozen_time):
+    path = str(tmp_path / "ratelimit")
+    first = RateLimiter(rate=10, burst=1, path=path)
+    second = RateLimiter(rate=10, burst=1, path=path)
+
+    assert first.acquire() == 0
+    assert second.acquire() == pytest.approx(0.1)
+    assert first.acquire() == pytest.approx(0.2)
+
+
+def _acquire(limiter):
+    return limiter.acquire()
+
+
+def test_shared_memory_state_is_shared_with_child_processes(frozen_time):
+    limiter = RateLimiter(rate=1, burst=1, shared_memory=True)
+    limiter.acquire()
+
+    process = multiprocessing.get_context("fork").Process(
+        target=_acquire, args=(limiter,)
+    )
+    process.start()
+    process.join()
+
+    assert limiter.acquire() == pytest.approx(2)
+
+
+def test_shared_memory_state_is_shared_when_pickled(frozen_time):
+    limiter = RateLimiter(rate=1, burst=1, shared_memory=True)
+    gl = gitlab.Gitlab(rate_limiter=limiter)
+
+    copy = pickle.loads(pickle.dumps(gl)).rate_limiter
+    limiter.acquire()
+
+    assert copy.acquire() == pytest.approx(1)
+
+
+def test_local_state_is_not_shared_when_pickled(frozen_time):
+    limiter = RateLimiter(rate=1, burst=1)
+    limiter.acquire()
+
+    copy = pickle.loads(pickle.dumps(limiter))
+
+    assert copy.acquire() == 0
+    assert copy.rate == 1
+
+
+def test_path_and_shared_memory_are_exclusive(tmp_path):
+    with pytest.raises(ValueError):
+        RateLimiter(path=str(tmp_path / "ratelimit"), shared_memory=True)
+
+
+@responses.activate
+def test_http_request_paces_requests(gl, monkeypatch, frozen_time):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    gl.rate_limiter = RateLimiter(rate=2, burst=1)
+    responses.add(
+        responses.GET,
+        "http://localhost/api/v4/projects",
+        json=[],
+        headers={"RateLimit-Limit": "120", "RateLimit-Remaining": "100"},
+    )
+
+    gl.http_get("/projects")
+    gl.http_get("/projects")
+
+    assert sleeps == [pytest.approx(0.5)]
@@ -1,9 +1,11 @@
+import pickle
 import time
 from unittest import mock
 
 import pytest
 
-from gitlab import utils
+from gitlab import GitlabCircuitOpenError, utils
+from gitlab.retry import CircuitBreaker, RetryBudget, RetryPolicy
 
 
 def test_handle_retry_on_status_ignores_unknown_status_code():
@@ -39,3 +41,65 @@ def test_handle_retry_on_status_accepts_ratelimit_reset_header(
 def test_handle_retry_on_status_returns_false_when_max_retries_reached():
     retry = utils.Retry(max_retries=0)
     assert retry.handle_retry_on_status(429) is False
+
+
+def test_retry_policy_backoff_without_jitter():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.5, jitter=False)
+    delays = [policy.backoff(attempt, None) for attempt in range(4)]
+    assert delays == [pytest.approx(0.1), pytest.approx(0.2), 0.4, 0.5]
+
+
+def test_retry_policy_backoff_with_decorrelated_jitter():
+    policy = RetryPolicy(base_delay=0.1, max_delay=1.0)
+    previous = None
+    for attempt in range(20):
+        delay = policy.backoff(attempt, previous)
+        assert 0.1 <= delay <= min(1.0, 3 * (previous or 0.1))
+        previous = delay
+
+
+def test_retry_budget_limits_transient_retries(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+    budget = RetryBudget(ratio=0.5, minimum=1)
+    policy = RetryPolicy(budget=budget)
+
+    retry = utils.Retry(max_retries=10, retry_transient_errors=True, policy=policy)
+    # 1 retry to start with, plus 0.5 for the request
+    assert retry.handle_retry_on_status(503) is True
+    assert retry.handle_retry_on_status(503) is False
+    # Rate limited requests are not limited by the budget
+    assert retry.handle_retry_on_status(429) is True
+
+    utils.Retry(max_retries=10, policy=policy)
+    utils.Retry(max_retries=10, policy=policy)
+    assert retry.handle_retry() is True
+
+
+def test_circuit_breaker_opens_and_probes(monkeypatch: pytest.MonkeyPatch):
+    now = 100.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=10)
+    retry = utils.Retry(max_retries=0, policy=RetryPolicy(circuit_breaker=breaker))
+
+    retry.record_status(503)
+    retry.check()
+    retry.record_error()
+    assert breaker.is_open
+    with pytest.raises(GitlabCircuitOpenError, match="retry in 10.0 seconds"):
+        retry.check()
+
+    now = 110.0
+    retry.check()
+    with pytest.raises(GitlabCircuitOpenError):
+        retry.check()
+
+    retry.record_status(404)
+    assert not breaker.is_open
+    retry.check()
+
+
+def test_retry_budget_and_circuit_breaker_are_picklable():
+    budget, breaker = pickle.loads(pickle.dumps((RetryBudget(), CircuitBreaker())))
+    assert budget.withdraw()
+    breaker.record_failure()
+    assert breaker.failures == 1
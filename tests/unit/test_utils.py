@@ -235,3 +235,20 @@ def test_masking_formatter_masks_token(capsys: pytest.CaptureFixture):
 
     assert "[MASKED]" in captured.err
     assert token not in captured.err
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 16, 1024])
+def test_iter_json_array(chunk_size):
+    data = [{"id": 1, "nested": [1, 2, {"name": "é ]"}]}, 123, "x", None, [], {}]
+    document = json.dumps(data).encode()
+    chunks = [document[i : i + chunk_size] for i in range(0, len(document), chunk_size)]
+
+    assert list(utils._iter_json_array(chunks)) == data
+
+
+@pytest.mark.parametrize(
+    "chunks", [[b"{}"], [b"[1 2]"], [b"[1,", b"]"], [b"[1"], [b"[1]", b" x"], [b"[,1]"]]
+)
+def test_iter_json_array_invalid(chunks):
+    with pytest.raises(ValueError):
+        list(utils._iter_json_array(chunks))